@@ -10,12 +10,18 @@ if project_root not in sys.path:
 from tools.get_user_choice import get_user_choice
 from tools.info_logger import log_info, log_warning, log_error
 from tools.blank_logger import log_blank_line
+from tools.records_io import find_record_file
+from checkpoint import ScrapeCheckpoint
 
 class YCBatchSelector:
     def __init__(self):
         self.base_url = "https://www.ycombinator.com/companies?batch="
         self.scraper_data_path = os.path.join(os.path.dirname(__file__), "../../Scraper_Data")
         
+        # Scraped batches are streamed as JSON Lines, optionally gzip'd (YC_OUTPUT_FORMAT=jsonl.gz)
+        output_format = os.getenv("YC_OUTPUT_FORMAT", "jsonl").lower()
+        self.output_suffix = ".jsonl.gz" if output_format == "jsonl.gz" else ".jsonl"
+        
         # Define allowed seasons for each year
         self.year_seasons = {
             2025: ["Winter", "Summer", "Spring"],
@@ -87,12 +93,13 @@ class YCBatchSelector:
         season_char = season_map.get(season, '?')
         year_short = str(year)[-2:]
         
-        return f"YC_{season_char}{year_short}_scraped.json"
+        return f"YC_{season_char}{year_short}_scraped{self.output_suffix}"
     
     def check_existing_file(self, filename):
-        """Check if the file already exists"""
-        file_path = os.path.join(self.scraper_data_path, filename)
-        return os.path.exists(file_path), file_path
+        """Check if the batch was already scraped (in any file format)"""
+        stem = filename[:-len(self.output_suffix)]
+        file_path = find_record_file(self.scraper_data_path, stem)
+        return file_path is not None, file_path
     
     def confirm_overwrite(self, filename):
         """Ask user if they want to overwrite existing file"""
@@ -118,6 +125,33 @@ class YCBatchSelector:
             else:
                 log_warning("Please enter 1 or 2")
     
+    def confirm_resume(self, checkpoint):
+        """Ask user whether to resume an interrupted scrape. Returns 'resume', 'restart' or None"""
+        log_blank_line()
+        log_warning("An unfinished scrape of this batch was found!")
+        log_info(f"Companies done: {len(checkpoint.done)}/{len(checkpoint.links)}")
+        if checkpoint.failed:
+            log_info(f"Companies that failed and will be retried: {len(checkpoint.failed)}")
+        log_blank_line()
+        log_info("1. Resume where it stopped")
+        log_info("2. Start over from scratch")
+        log_info("3. Go back to main menu")
+        
+        while True:
+            log_blank_line()
+            choice = get_user_choice(3)
+            
+            if choice == "1":
+                log_info("Resuming previous scrape...")
+                return 'resume'
+            elif choice == "2":
+                return 'restart'
+            elif choice == "3":
+                log_info("Returning to main menu...")
+                return None
+            else:
+                log_warning("Please enter 1, 2 or 3")
+    
     def select_batch(self):
         """Main method to select Y Combinator batch"""
         log_info(1, "=== Y Combinator Batch Selection ===", 1)
@@ -139,19 +173,32 @@ class YCBatchSelector:
         log_info(f"URL: {batch_url}")
         log_info(f"Output file: {filename}")
         
+        selection = {
+            'batch_url': batch_url,
+            'filename': filename,
+            'year': year,
+            'season': season,
+            'resume': False
+        }
+        
+        # Offer to resume an interrupted scrape of the same batch
+        checkpoint = ScrapeCheckpoint(os.path.join(self.scraper_data_path, filename))
+        if checkpoint.load():
+            decision = self.confirm_resume(checkpoint)
+            if decision is None:
+                return None
+            if decision == 'resume':
+                selection['resume'] = True
+                return selection
+        
         # Check if file already exists
         file_exists, file_path = self.check_existing_file(filename)
         
         if file_exists:
-            if not self.confirm_overwrite(filename):
+            if not self.confirm_overwrite(os.path.basename(file_path)):
                 return None  # User chose not to overwrite
         
-        return {
-            'batch_url': batch_url,
-            'filename': filename,
-            'year': year,
-            'season': season
-        }
+        return selection
 
 def get_yc_batch_selection():
     """Function to be called from main.py"""
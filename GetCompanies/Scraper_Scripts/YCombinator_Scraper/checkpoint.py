@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import logging
+from tools.records_io import iter_records, strip_record_suffix
+
+logger = logging.getLogger(__name__)
+
+class ScrapeCheckpoint:
+    """
+    Append-only progress log for one batch scrape
+
+    Sits next to the output file (YC_S25_scraped.checkpoint.jsonl) and records
+    the enumerated company links followed by one done/failed event per company,
+    so an interrupted scrape can pick up where it stopped.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.path = strip_record_suffix(output_path) + ".checkpoint.jsonl"
+        self.batch_url = None
+        self.links = []
+        self.done = {}     # url -> number of founders written
+        self.failed = {}   # url -> last error message
+        self._file = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Replay the log. Returns False if there is no usable checkpoint"""
+        if not self.exists():
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from a crash
+                kind = event.get('event')
+                if kind == 'links':
+                    self.batch_url = event.get('batch_url')
+                    self.links = event.get('links', [])
+                    self.done.clear()
+                    self.failed.clear()
+                elif kind == 'done':
+                    self.done[event['url']] = event.get('founders', 0)
+                    self.failed.pop(event['url'], None)
+                elif kind == 'failed':
+                    self.failed[event['url']] = event.get('error', '')
+
+        return bool(self.links)
+
+    def reconcile_with_output(self):
+        """
+        Trust the output file over the log: a company counts as done only if its
+        founders were actually flushed (or it legitimately had none)
+        """
+        written = set()
+        if os.path.exists(self.output_path):
+            for record in iter_records(self.output_path):
+                written.add(record.get('company_yc_url'))
+
+        for url, founders in list(self.done.items()):
+            if founders and url not in written:
+                del self.done[url]
+        for url in written:
+            if url in self.failed:
+                del self.failed[url]
+            self.done.setdefault(url, 1)
+
+    def outstanding(self):
+        """Links still to scrape - never attempted or previously failed - in original order"""
+        return [link for link in self.links if link not in self.done]
+
+    def _append(self, event):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        event['time'] = time.time()
+        self._file.write(json.dumps(event) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self, batch_url, links):
+        """Begin a fresh checkpoint for a newly enumerated batch"""
+        self.close()
+        if self.exists():
+            os.remove(self.path)
+        self.batch_url = batch_url
+        self.links = list(links)
+        self.done.clear()
+        self.failed.clear()
+        self._append({'event': 'links', 'batch_url': batch_url, 'links': self.links})
+
+    def mark_done(self, url, founders_count):
+        self.done[url] = founders_count
+        self.failed.pop(url, None)
+        self._append({'event': 'done', 'url': url, 'founders': founders_count})
+
+    def mark_failed(self, url, error):
+        self.failed[url] = str(error)
+        self._append({'event': 'failed', 'url': url, 'error': str(error)})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Delete the checkpoint once the whole batch has been scraped"""
+        self.close()
+        if self.exists():
+            os.remove(self.path)
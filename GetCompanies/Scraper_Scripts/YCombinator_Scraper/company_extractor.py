@@ -1,11 +1,20 @@
 import re
-import requests
+import html
+import json
 import logging
-from bs4 import BeautifulSoup
+from tools.html_parser import make_soup, strip_non_content
 from validation import is_valid_linkedin_profile
+from fetch_engine import fetch_in_order
+from response_cache import fetch_cached, get_cache
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction changes so founders cached from older code are re-extracted
+EXTRACTOR_VERSION = 2
+
+# Company pages embed their full page props as JSON in a data-page attribute
+EMBEDDED_PAGE_PATTERN = re.compile(r'data-page="([^"]+)"')
+
 def extract_founders_info(soup):
     """Extract founders information from the company page"""
     founders = []
@@ -139,28 +148,106 @@ def extract_company_linkedin(soup):
             return link.get('href')
     return ''
 
-def extract_founders(company_yc_url):
+def find_company_payload(node):
+    """Depth-first search for the dict that describes the company (has founders)"""
+    if isinstance(node, dict):
+        if isinstance(node.get('founders'), list) and node.get('name'):
+            return node
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    
+    for child in children:
+        found = find_company_payload(child)
+        if found:
+            return found
+    return None
+
+def extract_embedded_company(page_html):
+    """Decode the company object from the JSON payload embedded in the page"""
+    for match in EMBEDDED_PAGE_PATTERN.finditer(page_html):
+        try:
+            payload = json.loads(html.unescape(match.group(1)))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not decode embedded page data: {e}")
+            continue
+        company = payload.get('props', {}).get('company') if isinstance(payload, dict) else None
+        company = company if isinstance(company, dict) else find_company_payload(payload)
+        if company:
+            return company
+    return None
+
+def parse_embedded_company(company):
+    """
+    Map the embedded company JSON to (company_details, company_linkedin, founders_info)
+    in the same shapes the DOM extractors return
+    """
+    def text(value):
+        return str(value).strip() if value not in (None, '') else ''
+    
+    details = {
+        'name': text(company.get('name')),
+        'about': text(company.get('long_description') or company.get('one_liner')),
+        'website': text(company.get('website')),
+        'team_size': text(company.get('team_size')),
+        'founding_year': text(company.get('year_founded'))
+    }
+    
+    company_linkedin = text(company.get('linkedin_url'))
+    if 'linkedin.com/company/' not in company_linkedin.lower():
+        company_linkedin = ''
+    
+    founders = []
+    for founder in company.get('founders') or []:
+        founder_name = text(founder.get('full_name') or founder.get('name'))
+        founder_linkedin_url = text(founder.get('linkedin_url'))
+        if founder_name and is_valid_linkedin_profile(founder_linkedin_url):
+            founders.append({
+                'name': founder_name,
+                'founder_linkedin_url': founder_linkedin_url
+            })
+    
+    return details, company_linkedin, founders
+
+def extract_founders(company_yc_url, raise_on_fetch_error=False):
     # Main function to extract all founder and company information
+    # (raise_on_fetch_error lets callers tell a failed fetch apart from "no founders")
     company_name = company_yc_url.split('/')[-1]
     logger.info(f"Extracting from: {company_name}")
     
     try:
-        response = requests.get(company_yc_url, timeout=20)
-        response.raise_for_status()
+        response = fetch_cached(company_yc_url, parsed_version=EXTRACTOR_VERSION)
     except Exception as e:
         logger.error(f"Error fetching {company_yc_url}: {e}")
+        if raise_on_fetch_error:
+            raise
         return None
     
-    soup = BeautifulSoup(response.text, "html.parser")
-    
-    # Extract company details
-    company_details = extract_company_details(soup)
-    company_linkedin = extract_company_linkedin(soup)
+    # Page unchanged since the last scrape - reuse the previous extraction
+    if response.from_cache and response.parsed is not None:
+        return response.parsed or None
     
-    # Extract founders information
-    founders_info = extract_founders_info(soup)
+    # Prefer the structured JSON the page embeds; fall back to DOM heuristics
+    embedded_company = extract_embedded_company(response.text)
+    if embedded_company:
+        company_details, company_linkedin, founders_info = parse_embedded_company(embedded_company)
+    else:
+        logger.info(f"No embedded company data for {company_name}, using page heuristics")
+        soup = make_soup(strip_non_content(response.text))
+        
+        # Extract company details
+        company_details = extract_company_details(soup)
+        company_linkedin = extract_company_linkedin(soup)
+        
+        # Extract founders information
+        founders_info = extract_founders_info(soup)
     
+    cache = get_cache()
     if not founders_info:
+        if cache:
+            cache.set_parsed(company_yc_url, [], EXTRACTOR_VERSION)
         return None
     
     # Prepare founders data
@@ -178,4 +265,27 @@ def extract_founders(company_yc_url):
             'founding_year': company_details['founding_year']
         })
     
-    return founders_data
\ No newline at end of file
+    if cache:
+        cache.set_parsed(company_yc_url, founders_data, EXTRACTOR_VERSION)
+    
+    return founders_data
+
+def extract_founders_batch(company_yc_urls, max_workers=None, requests_per_second=None):
+    """
+    Extract founders for many companies concurrently
+
+    Args:
+        company_yc_urls: List of YC company page URLs
+        max_workers: Number of companies fetched in parallel
+        requests_per_second: Request rate allowed per host
+
+    Yields:
+        FetchResult: Per-company result (founders list or None), in input order.
+                     Companies whose page could not be fetched carry the error.
+    """
+    yield from fetch_in_order(
+        company_yc_urls,
+        lambda url: extract_founders(url, raise_on_fetch_error=True),
+        max_workers=max_workers,
+        requests_per_second=requests_per_second
+    )
\ No newline at end of file
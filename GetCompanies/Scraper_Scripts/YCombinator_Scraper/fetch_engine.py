@@ -0,0 +1,87 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from tools.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+def get_default_max_workers():
+    """Concurrent fetches (YC_MAX_WORKERS in the .env file)"""
+    return int(os.getenv("YC_MAX_WORKERS", "8"))
+
+def get_default_requests_per_second():
+    """Requests per second allowed per host (YC_REQUESTS_PER_SECOND in the .env file)"""
+    return float(os.getenv("YC_REQUESTS_PER_SECOND", "4"))
+
+class FetchResult:
+    """Outcome of one fetch: either a value or the exception that was raised"""
+
+    def __init__(self, index, item, value=None, error=None):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+def fetch_in_order(items, worker, max_workers=None, requests_per_second=None,
+                   rate_limiter=None, key=None):
+    """
+    Run `worker(item)` for every item on a bounded thread pool and yield the
+    results in the same order as the input.
+
+    Results are yielded as soon as every earlier item has finished, so callers
+    can stream output without waiting for the whole batch.
+
+    Args:
+        items: Iterable of work items (e.g. company URLs)
+        worker: Callable run for each item
+        max_workers: Number of concurrent fetches
+        requests_per_second: Per-host request rate (ignored if rate_limiter is given)
+        rate_limiter: Optional shared HostRateLimiter
+        key: Callable mapping an item to the URL used for rate limiting
+
+    Yields:
+        FetchResult: One result per item, in input order
+    """
+    items = list(items)
+    max_workers = max_workers or get_default_max_workers()
+    if rate_limiter is None:
+        rate_limiter = HostRateLimiter(requests_per_second or get_default_requests_per_second())
+    key = key or (lambda item: item)
+
+    def run(index, item):
+        rate_limiter.acquire(key(item))
+        try:
+            return FetchResult(index, item, value=worker(item))
+        except Exception as e:
+            return FetchResult(index, item, error=e)
+
+    logger.info(f"Fetching {len(items)} items with {max_workers} workers")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Only keep a bounded window of futures in flight so huge batches
+        # don't queue everything up front
+        window = max_workers * 4
+        futures = {}
+        next_to_submit = 0
+        next_to_yield = 0
+
+        try:
+            while next_to_yield < len(items):
+                while next_to_submit < len(items) and next_to_submit - next_to_yield < window:
+                    futures[next_to_submit] = executor.submit(run, next_to_submit, items[next_to_submit])
+                    next_to_submit += 1
+
+                yield futures.pop(next_to_yield).result()
+                next_to_yield += 1
+        finally:
+            # Caller stopped early (or interrupted): drop the pending work
+            for future in futures.values():
+                future.cancel()
+
+def fetch_all(items, worker, **kwargs):
+    """Same as fetch_in_order but returns a list"""
+    return list(fetch_in_order(items, worker, **kwargs))
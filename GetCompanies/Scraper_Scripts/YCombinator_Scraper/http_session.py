@@ -0,0 +1,153 @@
+import os
+import time
+import threading
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# brotli is optional - only advertise "br" if requests can actually decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+
+class SessionConfig:
+    """Settings for the shared YC HTTP session (overridable from the .env file)"""
+
+    def __init__(self):
+        self.pool_size = int(os.getenv("YC_HTTP_POOL_SIZE", os.getenv("YC_MAX_WORKERS", "8")))
+        self.timeout = float(os.getenv("YC_HTTP_TIMEOUT", "20"))
+        self.max_retries = int(os.getenv("YC_HTTP_MAX_RETRIES", "4"))
+        self.backoff_factor = float(os.getenv("YC_HTTP_BACKOFF_FACTOR", "0.5"))
+        self.user_agent = os.getenv("YC_HTTP_USER_AGENT", DEFAULT_USER_AGENT)
+
+class RequestStats:
+    """Thread-safe per-request timing stats"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = []  # (url, status_code, seconds)
+        self.failures = 0
+
+    def record(self, url, status_code, seconds):
+        with self._lock:
+            self.timings.append((url, status_code, seconds))
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def reset(self):
+        """Start counting afresh (the service runs many scrapes in one process)"""
+        with self._lock:
+            self.timings = []
+            self.failures = 0
+
+    def summary(self):
+        """Return count, failures, mean/p50/p95/max latency in seconds"""
+        with self._lock:
+            durations = sorted(t[2] for t in self.timings)
+            failures = self.failures
+        if not durations:
+            return {'count': 0, 'failures': failures}
+
+        def percentile(p):
+            return durations[min(len(durations) - 1, int(len(durations) * p))]
+
+        return {
+            'count': len(durations),
+            'failures': failures,
+            'mean': sum(durations) / len(durations),
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'max': durations[-1]
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        if not summary['count']:
+            logger.info(f"HTTP stats: no completed network requests ({summary['failures']} failures)")
+            return
+        logger.info(
+            f"HTTP stats: {summary['count']} requests, {summary['failures']} failures, "
+            f"mean {summary['mean']:.2f}s, p50 {summary['p50']:.2f}s, "
+            f"p95 {summary['p95']:.2f}s, max {summary['max']:.2f}s"
+        )
+
+def create_session(config=None):
+    """
+    Build a requests.Session with connection pooling, compression and retries
+
+    Retries cover connection errors, read timeouts and 429/5xx responses for
+    GET/HEAD only, back off exponentially and honor the Retry-After header.
+    """
+    config = config or SessionConfig()
+
+    retry = Retry(
+        total=config.max_retries,
+        connect=config.max_retries,
+        read=config.max_retries,
+        status=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_size,
+        pool_maxsize=config.pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": config.user_agent,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive"
+    })
+    return session
+
+_session = None
+_session_config = None
+_session_lock = threading.Lock()
+stats = RequestStats()
+
+def get_session():
+    """Return the process-wide YC session, creating it on first use"""
+    global _session, _session_config
+    with _session_lock:
+        if _session is None:
+            _session_config = SessionConfig()
+            _session = create_session(_session_config)
+        return _session
+
+def fetch(url, method="GET", timeout=None, **kwargs):
+    """
+    Perform a request through the shared session and record its timing
+
+    Raises:
+        requests.RequestException: if the request still fails after retries
+    """
+    session = get_session()
+    timeout = timeout or _session_config.timeout
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, timeout=timeout, **kwargs)
+        response.raise_for_status()
+    except requests.RequestException:
+        stats.record_failure()
+        raise
+    stats.record(url, response.status_code, time.perf_counter() - start)
+    return response
@@ -0,0 +1,82 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Installed once per page. A MutationObserver picks up company links as they
+# render, so Python only ever fetches the links added since the last drain
+# instead of re-querying (or re-serializing) the whole DOM.
+INSTALL_COLLECTOR_JS = """
+if (!window.__ycLinkCollector) {
+    const selector = "a[href*='/companies/']";
+    const collector = {seen: new Set(), pending: []};
+
+    const add = (anchor) => {
+        const href = anchor.getAttribute('href');
+        if (href && !collector.seen.has(href)) {
+            collector.seen.add(href);
+            collector.pending.push(href);
+        }
+    };
+    const scan = (node) => {
+        if (node.nodeType !== 1) return;
+        if (node.matches(selector)) add(node);
+        node.querySelectorAll(selector).forEach(add);
+    };
+
+    scan(document.body);
+    collector.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            if (mutation.type === 'attributes') {
+                if (mutation.target.matches(selector)) add(mutation.target);
+                continue;
+            }
+            mutation.addedNodes.forEach(scan);
+        }
+    });
+    collector.observer.observe(document.body, {
+        childList: true, subtree: true, attributes: true, attributeFilter: ['href']
+    });
+    collector.drain = () => {
+        const links = collector.pending;
+        collector.pending = [];
+        return {links: links, total: collector.seen.size};
+    };
+    window.__ycLinkCollector = collector;
+}
+return window.__ycLinkCollector.seen.size;
+"""
+
+DRAIN_COLLECTOR_JS = """
+if (!window.__ycLinkCollector) return null;
+return window.__ycLinkCollector.drain();
+"""
+
+class LinkCollector:
+    """Python side of the in-page company link collector"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.hrefs = []  # Every href seen so far, in render order
+        self._seen = set()
+
+    def install(self):
+        """Inject the observer (safe to call again after a navigation)"""
+        total = self.driver.execute_script(INSTALL_COLLECTOR_JS)
+        logger.info(f"Link collector installed ({total} links already on page)")
+        return total
+
+    def drain(self):
+        """Fetch only the links added since the last call. Returns the new hrefs"""
+        result = self.driver.execute_script(DRAIN_COLLECTOR_JS)
+        if result is None:
+            # Page was replaced and lost the collector - reinstall and retry
+            self.install()
+            result = self.driver.execute_script(DRAIN_COLLECTOR_JS) or {'links': []}
+        new_links = [href for href in result.get('links', []) if href not in self._seen]
+        self._seen.update(new_links)
+        self.hrefs.extend(new_links)
+        return new_links
+
+    @property
+    def count(self):
+        return len(self.hrefs)
@@ -0,0 +1,162 @@
+import os
+import re
+import json
+import logging
+from urllib.parse import urlparse, parse_qs, urlencode
+from http_session import fetch
+from validation import is_valid_company_link
+
+logger = logging.getLogger(__name__)
+
+# The directory page configures its search client with e.g.
+# window.AlgoliaOpts = {"app":"45BWZJ1SGC","key":"..."};
+ALGOLIA_OPTS_PATTERN = re.compile(r'AlgoliaOpts\s*=\s*(\{.*?\})\s*;', re.DOTALL)
+DEFAULT_INDEX_NAME = "YCCompany_production"
+
+class ListingBackendError(Exception):
+    """Raised when a listing backend cannot enumerate the batch"""
+
+def get_batch_name(batch_url):
+    """'https://www.ycombinator.com/companies?batch=Summer%202025' -> 'Summer 2025'"""
+    query_params = parse_qs(urlparse(batch_url).query)
+    return query_params.get('batch', [''])[0]
+
+def extract_algolia_options(html):
+    """Return the search app id and key embedded in the directory page"""
+    match = ALGOLIA_OPTS_PATTERN.search(html)
+    if not match:
+        raise ListingBackendError("Search configuration not found on the directory page")
+    try:
+        opts = json.loads(match.group(1))
+    except json.JSONDecodeError as e:
+        raise ListingBackendError(f"Could not parse search configuration: {e}")
+    if not opts.get('app') or not opts.get('key'):
+        raise ListingBackendError("Search configuration is missing app id or key")
+    return opts
+
+class HttpListingBackend:
+    """
+    Enumerate a batch by paging through the directory's JSON search endpoint
+
+    Args:
+        search_host: Base URL of the search API; defaults to the Algolia host
+                     derived from the page (override it to use the fixture server)
+        index_name: Search index holding the companies
+        hits_per_page: Page size requested from the search API
+        require_complete: Raise ListingBackendError instead of returning fewer
+                          companies than the search reported (nbHits)
+    """
+
+    name = "http"
+
+    def __init__(self, search_host=None, index_name=None, hits_per_page=1000, require_complete=False):
+        self.search_host = search_host or os.getenv("YC_SEARCH_HOST")
+        self.index_name = index_name or os.getenv("YC_SEARCH_INDEX", DEFAULT_INDEX_NAME)
+        self.hits_per_page = hits_per_page
+        self.require_complete = require_complete
+
+    def _query_page(self, search_url, opts, batch_name, page):
+        params = urlencode({
+            'query': '',
+            'hitsPerPage': self.hits_per_page,
+            'page': page,
+            'facetFilters': json.dumps([[f"batch:{batch_name}"]]),
+            'attributesToRetrieve': json.dumps(['slug'])
+        })
+        payload = {'requests': [{'indexName': self.index_name, 'params': params}]}
+        headers = {
+            'X-Algolia-Application-Id': opts['app'],
+            'X-Algolia-API-Key': opts['key'],
+            'Content-Type': 'application/json'
+        }
+        response = fetch(search_url, method="POST", data=json.dumps(payload), headers=headers)
+        results = response.json().get('results') or [{}]
+        return results[0]
+
+    def get_company_links(self, y_combinator_url, batch_url):
+        batch_name = get_batch_name(batch_url)
+        if not batch_name:
+            raise ListingBackendError(f"No batch found in URL: {batch_url}")
+
+        opts = extract_algolia_options(fetch(batch_url).text)
+        search_host = self.search_host or opts.get('host') or f"https://{opts['app']}-dsn.algolia.net"
+        search_url = f"{search_host.rstrip('/')}/1/indexes/*/queries"
+
+        slugs = []
+        page = 0
+        while True:
+            result = self._query_page(search_url, opts, batch_name, page)
+            hits = result.get('hits', [])
+            slugs.extend(hit['slug'] for hit in hits if hit.get('slug'))
+
+            total_pages = result.get('nbPages', 0)
+            logger.info(f"Search page {page + 1}/{max(total_pages, 1)}: {len(hits)} companies")
+            page += 1
+            if not hits or page >= total_pages:
+                break
+
+        expected = result.get('nbHits')
+        if expected is not None and expected > len(slugs):
+            message = f"Search reported {expected} companies but only {len(slugs)} were returned"
+            if self.require_complete:
+                raise ListingBackendError(message)
+            logger.warning(message)
+
+        return build_company_links(y_combinator_url, slugs)
+
+class SeleniumListingBackend:
+    """Enumerate a batch by scrolling the directory page in headless Chrome"""
+
+    name = "selenium"
+
+    def get_company_links(self, y_combinator_url, batch_url):
+        # Imported lazily so the HTTP path never loads selenium
+        from yc_scraper import get_yc_2025_links
+        return get_yc_2025_links(y_combinator_url, batch_url)
+
+def build_company_links(y_combinator_url, slugs):
+    """Turn slugs into unique, validated company URLs (order preserved)"""
+    links = []
+    seen = set()
+    for slug in slugs:
+        href = f"/companies/{slug}"
+        if href in seen or not is_valid_company_link(href, y_combinator_url):
+            continue
+        seen.add(href)
+        links.append(y_combinator_url + href)
+    return links
+
+BACKENDS = {
+    'http': HttpListingBackend,
+    'selenium': SeleniumListingBackend
+}
+
+def get_company_links(y_combinator_url, batch_url, backend=None):
+    """
+    Enumerate all company links for a batch
+
+    Args:
+        y_combinator_url: Base Y Combinator URL
+        batch_url: Directory URL for the batch
+        backend: 'http', 'selenium' or 'auto' (default: YC_LISTING_BACKEND or 'auto').
+                 'auto' uses HTTP and falls back to Selenium if it fails or
+                 returns an incomplete batch.
+
+    Returns:
+        list: Company URLs
+    """
+    backend = (backend or os.getenv("YC_LISTING_BACKEND", "auto")).lower()
+
+    if backend in BACKENDS:
+        return BACKENDS[backend]().get_company_links(y_combinator_url, batch_url)
+
+    try:
+        links = HttpListingBackend(require_complete=True).get_company_links(y_combinator_url, batch_url)
+        if links:
+            logger.info(f"Enumerated {len(links)} companies over HTTP")
+            return links
+        logger.warning("HTTP listing returned no companies, falling back to Selenium")
+    except Exception as e:
+        logger.warning(f"HTTP listing failed ({e}), falling back to Selenium")
+
+    return SeleniumListingBackend().get_company_links(y_combinator_url, batch_url)
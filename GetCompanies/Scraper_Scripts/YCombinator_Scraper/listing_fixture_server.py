@@ -0,0 +1,143 @@
+"""
+Local stand-in for the YC directory and its JSON search endpoint.
+
+Serves a batch page that embeds the search configuration and answers paged
+search queries from an in-memory fixture, so the HTTP listing backend can be
+exercised without network access:
+
+    python listing_fixture_server.py            # self-check against the fixture
+    python listing_fixture_server.py --serve    # keep serving on localhost
+"""
+import os
+import sys
+import json
+import math
+import threading
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote
+
+FIXTURE_APP_ID = "FIXTUREAPP"
+FIXTURE_API_KEY = "fixture-key"
+
+def build_fixture_companies(batches=None, companies_per_batch=250):
+    """Generate {batch name: [slugs]} with a few non-company slugs mixed in"""
+    batches = batches or ["Summer 2025", "Winter 2025"]
+    fixture = {}
+    for batch in batches:
+        prefix = batch.split()[0][0].lower() + batch.split()[1][-2:]
+        slugs = [f"{prefix}-company-{i}" for i in range(1, companies_per_batch + 1)]
+        slugs.insert(companies_per_batch // 2, "founders")  # Must be filtered out
+        fixture[batch] = slugs
+    return fixture
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    companies = {}
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format % args)
+
+    def _send(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != "/companies":
+            self._send(404, "Not found", "text/plain")
+            return
+        opts = json.dumps({'app': FIXTURE_APP_ID, 'key': FIXTURE_API_KEY})
+        html = f"<html><head><script>window.AlgoliaOpts = {opts};</script></head><body></body></html>"
+        self._send(200, html, "text/html")
+
+    def do_POST(self):
+        if not urlparse(self.path).path.startswith("/1/indexes/"):
+            self._send(404, "Not found", "text/plain")
+            return
+        if self.headers.get('X-Algolia-API-Key') != FIXTURE_API_KEY:
+            self._send(403, json.dumps({'message': 'Invalid API key'}), "application/json")
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        results = [self._search(request) for request in payload.get('requests', [])]
+        self._send(200, json.dumps({'results': results}), "application/json")
+
+    def _search(self, request):
+        params = {k: v[0] for k, v in parse_qs(request.get('params', '')).items()}
+        hits_per_page = int(params.get('hitsPerPage', 20))
+        page = int(params.get('page', 0))
+
+        batch = ''
+        for group in json.loads(params.get('facetFilters', '[]')):
+            for facet in group:
+                if facet.startswith('batch:'):
+                    batch = facet[len('batch:'):]
+
+        slugs = self.companies.get(batch, [])
+        page_slugs = slugs[page * hits_per_page:(page + 1) * hits_per_page]
+        return {
+            'hits': [{'slug': slug} for slug in page_slugs],
+            'nbHits': len(slugs),
+            'page': page,
+            'nbPages': math.ceil(len(slugs) / hits_per_page) if slugs else 0,
+            'hitsPerPage': hits_per_page
+        }
+
+def start_fixture_server(companies=None, port=0):
+    """
+    Start the fixture server on a background thread
+
+    Returns:
+        tuple: (server, base_url) - call server.shutdown() when done
+    """
+    handler = type("BoundFixtureHandler", (FixtureHandler,), {
+        'companies': companies or build_fixture_companies()
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def run_self_check():
+    """Enumerate every fixture batch through the HTTP backend and verify the result"""
+    # Make the project root importable when run directly
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    from listing_backend import HttpListingBackend
+
+    companies = build_fixture_companies()
+    server, base_url = start_fixture_server(companies)
+    try:
+        backend = HttpListingBackend(search_host=base_url, hits_per_page=100)
+        for batch, slugs in companies.items():
+            batch_url = f"{base_url}/companies?batch={quote(batch)}"
+            links = backend.get_company_links(base_url, batch_url)
+            expected = [f"{base_url}/companies/{slug}" for slug in slugs if slug != "founders"]
+            if links != expected:
+                raise AssertionError(f"{batch}: expected {len(expected)} links, got {len(links)}")
+            logging.info(f"{batch}: {len(links)} companies enumerated correctly")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    if "--serve" in sys.argv:
+        server, base_url = start_fixture_server(port=int(os.getenv("YC_FIXTURE_PORT", "8765")))
+        logging.info(f"Fixture directory serving at {base_url}/companies?batch=Summer%202025")
+        logging.info(f"Set YC_SEARCH_HOST={base_url} to point the HTTP backend at it")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+    else:
+        run_self_check()
@@ -1,17 +1,19 @@
-import time
 import os
 import sys
 import logging
+from dotenv import load_dotenv
 from tools.info_logger import log_info, log_warning, log_error
-from yc_scraper import get_yc_2025_links
-from company_extractor import extract_founders
+from listing_backend import get_company_links
+from company_extractor import extract_founders_batch
+from http_session import stats as http_stats
+from response_cache import save_cache
 from yc_scraper_utils import (
     create_scraper_data_folder,
-    add_numbering_to_data,
-    save_to_json,
-    generate_json_filename
+    remove_other_batch_formats,
+    FounderRecordWriter
 )
 from batch_selector import get_yc_batch_selection
+from checkpoint import ScrapeCheckpoint
 
 # Add the project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
@@ -25,15 +27,32 @@ logging.basicConfig(
 )
 
 def main():
+    load_dotenv()
+    
+    # Get user's batch selection
+    log_info(f"Starting YC scraper with interactive batch selection...")
+    
     try:
-        # Get user's batch selection
-        log_info(f"Starting YC scraper with interactive batch selection...")
-        
         batch_selection = get_yc_batch_selection()
-        
-        if not batch_selection:
-            log_info("Scraping cancelled. Exiting...")
-            return
+    except KeyboardInterrupt:
+        batch_selection = None
+    
+    if not batch_selection:
+        log_info("Scraping cancelled. Exiting...")
+        return
+    
+    run_scrape(batch_selection)
+
+def run_scrape(batch_selection):
+    """
+    Scrape one batch chosen by YCBatchSelector (also used by the LinkedinOS service)
+    
+    Returns:
+        str: Path of the written batch file, or None if nothing was saved
+    """
+    try:
+        # Report only this scrape's requests
+        http_stats.reset()
         
         # Create Scraper_Data folder
         scraper_data_path = create_scraper_data_folder()
@@ -46,62 +65,89 @@ def main():
         json_file_path = os.path.join(scraper_data_path, json_filename)
         log_info(f"The json_file_path is: {json_file_path}", 1)
         
-        # Get YC company links
-        log_info("Scraping started... this will take a while as we need to load all companies")
-        log_info("The script will scroll through the page multiple times to load all companies")
-        log_info("Please be patient - this process can take 2-5 minutes depending on the batch size", 1)
+        checkpoint = ScrapeCheckpoint(json_file_path)
+        resume = batch_selection.get('resume', False) and checkpoint.load()
         
-        yc_links = get_yc_2025_links(y_combinator_url, y_combinator_batch_url)
-        log_info(f"Successfully found {len(yc_links)} company links", 1)
+        if resume:
+            # Pick up an interrupted scrape: reuse its link list and skip finished companies
+            checkpoint.reconcile_with_output()
+            yc_links = checkpoint.links
+            log_info(f"Resuming previous scrape: {len(checkpoint.done)}/{len(yc_links)} companies already done, "
+                     f"{len(checkpoint.failed)} failed companies will be retried", 1)
+        else:
+            # Get YC company links
+            log_info("Scraping started... enumerating companies via the directory search API")
+            log_info("If that fails we fall back to scrolling the page in Chrome, which can take 2-5 minutes", 1)
+            
+            yc_links = get_company_links(y_combinator_url, y_combinator_batch_url)
+            log_info(f"Successfully found {len(yc_links)} company links", 1)
+            
+            if len(yc_links) == 0:
+                log_warning("No company links found. This might be because:")
+                log_warning("1. The batch URL is incorrect")
+                log_warning("2. The batch doesn't exist")
+                log_warning("3. There are no companies in this batch")
+                log_warning("Please verify the batch information and try again.")
+                return None
+            
+            checkpoint.start(y_combinator_batch_url, yc_links)
         
-        if len(yc_links) == 0:
-            log_warning("No company links found. This might be because:")
-            log_warning("1. The batch URL is incorrect")
-            log_warning("2. The batch doesn't exist")
-            log_warning("3. There are no companies in this batch")
-            log_warning("Please verify the batch information and try again.")
-            return
+        pending_links = checkpoint.outstanding()
         
-        # Extract data from each company
-        all_founders_data = []
-        for i, link in enumerate(yc_links, 1):
-            log_info(f"Processing {i}/{len(yc_links)}: {link}")
-            try:
-                founders = extract_founders(link)
-                if founders:
-                    all_founders_data.extend(founders)
-                    log_info(f"Found {len(founders)} founders", 1)
-                else:
-                    log_warning(f"No founders found", 1)
-            except Exception as e:
-                log_error(f"  Error processing {link}: {e}", 1)
-            
-            # Add delay to avoid rate limiting
-            time.sleep(2)
-
-        log_info(1, f"Total founders found: {len(all_founders_data)}")
+        # Extract data from each company (fetched concurrently, reported in order)
+        # and stream the numbered records straight to disk
+        try:
+            with FounderRecordWriter(json_file_path, resume=resume) as writer:
+                for result in extract_founders_batch(pending_links):
+                    log_info(f"Processing {result.index + 1}/{len(pending_links)}: {result.item}")
+                    if not result.ok:
+                        log_error(f"  Error processing {result.item}: {result.error}", 1)
+                        checkpoint.mark_failed(result.item, result.error)
+                        continue
+                    
+                    if result.value:
+                        writer.write_company(result.value)
+                        log_info(f"Found {len(result.value)} founders", 1)
+                    else:
+                        log_warning(f"No founders found", 1)
+                    checkpoint.mark_done(result.item, len(result.value or []))
+        finally:
+            checkpoint.close()
         
-        if len(all_founders_data) == 0:
-            log_warning("No founder data was extracted. Exiting without saving.")
-            return
+        http_stats.log_summary()
+        log_info(1, f"Total founders found: {writer.founders_count}")
+        
+        if checkpoint.failed:
+            log_warning(f"{len(checkpoint.failed)} companies could not be fetched. "
+                        f"Run the scraper again for this batch and choose 'Resume' to retry them.")
+        else:
+            checkpoint.remove()
         
-        # Add serial numbers and company numbers
-        log_info("Adding serial numbers and company numbers...")
-        all_founders_data = add_numbering_to_data(all_founders_data)
-        log_info("Numbering completed!", 1)
+        if writer.founders_count == 0:
+            os.remove(json_file_path)
+            log_warning("No founder data was extracted. Exiting without saving.")
+            return None
         
-        # Save data to JSON file
-        save_to_json(all_founders_data, json_file_path)
+        # The new file replaces any older copy of this batch in another format
+        remove_other_batch_formats(json_file_path)
         
-        log_info(1, "Scraping completed successfully!")
+        if checkpoint.failed:
+            log_info(1, "Scraping finished with some companies still outstanding.")
+        else:
+            log_info(1, "Scraping completed successfully!")
         log_info(f"Data saved to: {json_file_path}")
-        log_info(f"Total companies processed: {len(set(record.get('company_number', 0) for record in all_founders_data))}")
-        log_info(f"Total founders found: {len(all_founders_data)}", 1)
+        log_info(f"Total companies processed: {writer.companies_count}")
+        log_info(f"Total founders found: {writer.founders_count}", 1)
+        return json_file_path
         
     except KeyboardInterrupt:
         log_warning(1, "Scraping interrupted by user. Exiting...")
+        log_info("Progress was checkpointed - run the scraper again and choose 'Resume' to continue.")
     except Exception as e:
         log_error(f"Error in main execution: {e}")
+    finally:
+        save_cache()
+    return None
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
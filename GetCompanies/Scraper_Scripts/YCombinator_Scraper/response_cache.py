@@ -0,0 +1,271 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from http_session import fetch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(__file__), "../../Scraper_Data/http_cache")
+
+class CacheConfig:
+    """Settings for the on-disk response cache (overridable from the .env file)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("YC_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.cache_dir = os.getenv("YC_CACHE_DIR", DEFAULT_CACHE_DIR)
+        # Entries younger than the TTL are served without touching the network,
+        # older ones are revalidated with a conditional GET
+        self.ttl_seconds = float(os.getenv("YC_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+        self.max_bytes = int(os.getenv("YC_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+class CachedResponse:
+    """Response body plus where it came from"""
+
+    def __init__(self, url, text, source, parsed=None):
+        self.url = url
+        self.text = text
+        self.source = source  # 'fresh', 'revalidated' or 'network'
+        self.parsed = parsed
+
+    @property
+    def from_cache(self):
+        return self.source != 'network'
+
+class ResponseCache:
+    """
+    Persistent URL-keyed cache of gzip-compressed response bodies
+
+    Keeps ETag/Last-Modified for conditional revalidation, an optional parsed
+    result per entry (tagged with the extractor version that produced it),
+    and evicts least recently used entries once the total compressed size
+    exceeds `max_bytes`.
+    """
+
+    INDEX_FILE = "index.json"
+    SAVE_EVERY = 25  # Persist the index after this many changes
+
+    def __init__(self, cache_dir, ttl_seconds, max_bytes):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # url -> metadata, least recently used first
+        self._total_bytes = 0
+        self._dirty = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+        self._remove_orphans()
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    def _body_path(self, entry):
+        return os.path.join(self.cache_dir, entry['file'])
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable cache index: {e}")
+            return
+
+        for url, entry in sorted(entries.items(), key=lambda item: item[1].get('last_access', 0)):
+            if os.path.exists(self._body_path(entry)):
+                self._entries[url] = entry
+                self._total_bytes += entry.get('size', 0)
+        logger.info(f"Loaded response cache with {len(self._entries)} entries")
+
+    def _remove_orphans(self):
+        """Delete body and temp files the index does not know (e.g. written just before a crash)"""
+        known = {entry['file'] for entry in self._entries.values()}
+        removed = 0
+        for file_name in os.listdir(self.cache_dir):
+            if file_name == self.INDEX_FILE or file_name in known:
+                continue
+            if file_name.endswith((".html.gz", ".tmp")):
+                try:
+                    os.remove(os.path.join(self.cache_dir, file_name))
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info(f"Removed {removed} orphaned files from response cache")
+
+    def save(self):
+        """Write the index atomically"""
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        tmp_path = self._index_path() + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self._index_path())
+        self._dirty = 0
+
+    def _mark_dirty_locked(self):
+        self._dirty += 1
+        if self._dirty >= self.SAVE_EVERY:
+            self._save_locked()
+
+    def get(self, url):
+        """Return (entry, body_text) for a cached url, or (None, None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None, None
+            try:
+                with gzip.open(self._body_path(entry), 'rt', encoding='utf-8') as f:
+                    body = f.read()
+            except OSError:
+                self._remove_locked(url)
+                return None, None
+            entry['last_access'] = time.time()
+            self._entries.move_to_end(url)
+            return dict(entry), body
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get('stored_at', 0) < self.ttl_seconds
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Store a new body for the url (drops any previous parsed result)"""
+        file_name = hashlib.sha256(url.encode('utf-8')).hexdigest() + ".html.gz"
+        path = os.path.join(self.cache_dir, file_name)
+        tmp_path = path + f".{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old:
+                self._total_bytes -= old.get('size', 0)
+            now = time.time()
+            self._entries[url] = {
+                'file': file_name,
+                'etag': etag,
+                'last_modified': last_modified,
+                'stored_at': now,
+                'last_access': now,
+                'size': size,
+                'parsed': None,
+                'parsed_version': None
+            }
+            self._total_bytes += size
+            self._evict_locked()
+            self._mark_dirty_locked()
+
+    def mark_revalidated(self, url):
+        """Server answered 304: restart the entry's TTL"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                entry['stored_at'] = time.time()
+                self._mark_dirty_locked()
+
+    def set_parsed(self, url, parsed, version):
+        """Attach a parsed result so unchanged pages don't need re-parsing"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                entry['parsed'] = parsed
+                entry['parsed_version'] = version
+                self._mark_dirty_locked()
+
+    @staticmethod
+    def parsed_for(entry, version):
+        """The entry's parsed result if the same extractor version produced it, else None"""
+        if entry.get('parsed_version') != version:
+            return None
+        return entry.get('parsed')
+
+    def _remove_locked(self, url):
+        entry = self._entries.pop(url, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry.get('size', 0)
+        try:
+            os.remove(self._body_path(entry))
+        except OSError:
+            pass
+
+    def _evict_locked(self):
+        evicted = 0
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest_url = next(iter(self._entries))
+            self._remove_locked(oldest_url)
+            evicted += 1
+        if evicted:
+            logger.info(f"Evicted {evicted} entries from response cache")
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Return the process-wide cache, or None if caching is disabled"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            config = CacheConfig()
+            if not config.enabled:
+                return None
+            _cache = ResponseCache(config.cache_dir, config.ttl_seconds, config.max_bytes)
+        return _cache
+
+def save_cache():
+    """Flush the cache index to disk (call at the end of a scrape)"""
+    if _cache is not None:
+        _cache.save()
+
+def fetch_cached(url, parsed_version=None):
+    """
+    GET a url through the response cache
+
+    Fresh entries are served from disk, stale ones are revalidated with
+    If-None-Match/If-Modified-Since and everything else is downloaded and stored.
+    A stored parsed result is only returned if it was made by `parsed_version`
+    of the extractor, so extractor changes apply to cached pages too.
+
+    Returns:
+        CachedResponse
+    """
+    cache = get_cache()
+    if cache is None:
+        return CachedResponse(url, fetch(url).text, 'network')
+
+    entry, body = cache.get(url)
+    if entry and cache.is_fresh(entry):
+        return CachedResponse(url, body, 'fresh', cache.parsed_for(entry, parsed_version))
+
+    headers = cache.conditional_headers(entry) if entry else {}
+    response = fetch(url, headers=headers)
+
+    if response.status_code == 304 and entry:
+        cache.mark_revalidated(url)
+        return CachedResponse(url, body, 'revalidated', cache.parsed_for(entry, parsed_version))
+
+    cache.put(
+        url,
+        response.text,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified')
+    )
+    return CachedResponse(url, response.text, 'network')
@@ -0,0 +1,102 @@
+import re
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Wraps fetch/XHR so the page can tell us how many requests are in flight and
+# how long the network has been quiet
+INSTALL_NETWORK_TRACKER_JS = """
+if (!window.__ycNetworkTracker) {
+    const tracker = {inflight: 0, lastActivity: performance.now()};
+    const start = () => { tracker.inflight++; tracker.lastActivity = performance.now(); };
+    const done = () => { tracker.inflight = Math.max(0, tracker.inflight - 1); tracker.lastActivity = performance.now(); };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function() {
+            start();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        start();
+        this.addEventListener('loadend', done, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    window.__ycNetworkTracker = tracker;
+}
+"""
+
+# One round trip: link count from the collector plus network state
+POLL_STATE_JS = """
+const tracker = window.__ycNetworkTracker || {inflight: 0, lastActivity: 0};
+const collector = window.__ycLinkCollector;
+return {
+    links: collector ? collector.seen.size : 0,
+    inflight: tracker.inflight,
+    idle_ms: performance.now() - tracker.lastActivity
+};
+"""
+
+# "Showing 160 of 160 companies" is preferred over a bare "160 companies";
+# the bare form must not pick up batch names like "Summer 2025 companies"
+SHOWING_COUNT_PATTERN = re.compile(
+    r'showing\s+[\d,]+\+?\s+of\s+([\d,]+)\+?\s+(?:companies|results)\b',
+    re.IGNORECASE
+)
+PLAIN_COUNT_PATTERN = re.compile(
+    r'(?<!summer )(?<!winter )(?<!spring )(?<!fall )\b([\d,]+)\+?\s+(?:companies|results)\b',
+    re.IGNORECASE
+)
+
+def install_network_tracker(driver):
+    driver.execute_script(INSTALL_NETWORK_TRACKER_JS)
+
+def parse_result_count(text):
+    """Return the total result count from the page's summary text, or None"""
+    for pattern in (SHOWING_COUNT_PATTERN, PLAIN_COUNT_PATTERN):
+        for match in pattern.finditer(text or ''):
+            digits = match.group(1).replace(',', '')
+            if digits.isdigit() and int(digits) > 0:
+                return int(digits)
+    return None
+
+def read_expected_company_count(driver):
+    """Read the 'N companies' result count shown by the directory, if any"""
+    try:
+        text = driver.execute_script("return document.body.innerText.slice(0, 20000);")
+    except Exception as e:
+        logger.warning(f"Could not read result count: {e}")
+        return None
+    return parse_result_count(text)
+
+def wait_for_new_links(driver, previous_total, timeout=10, network_idle_ms=750,
+                       min_wait=0.3, poll_interval=0.2):
+    """
+    Wait until new links render or the network goes quiet
+
+    Args:
+        driver: Selenium WebDriver instance
+        previous_total: Collector link count before the scroll
+        timeout: Upper bound on the wait in seconds
+        network_idle_ms: Quiet period after which loading is considered done
+        min_wait: Minimum time to give the page to start its request
+        poll_interval: Seconds between polls
+
+    Returns:
+        str: 'new_links', 'network_idle' or 'timeout'
+    """
+    start = time.monotonic()
+    while True:
+        state = driver.execute_script(POLL_STATE_JS)
+        elapsed = time.monotonic() - start
+
+        if state['links'] > previous_total:
+            return 'new_links'
+        if elapsed >= min_wait and state['inflight'] == 0 and state['idle_ms'] >= network_idle_ms:
+            return 'network_idle'
+        if elapsed >= timeout:
+            return 'timeout'
+        time.sleep(poll_interval)
@@ -19,4 +19,55 @@ def is_valid_linkedin_profile(url):
     if "linkedin.com/in/" in url:
         return True
     
-    return False
\ No newline at end of file
+    return False
+
+def is_valid_company_link(href, base_url):
+    """
+    Check if the href is a valid company link that should be processed
+    
+    Args:
+        href: The href attribute from the link
+        base_url: The base Y Combinator URL
+        
+    Returns:
+        bool: True if it's a valid company link, False otherwise
+    """
+    if not href.startswith("/companies/"):
+        return False
+        
+    if href == "/companies/":  # Root companies page
+        return False
+        
+    # Extract company identifier from href
+    company_identifier = href.replace("/companies/", "")
+    
+    # List of non-company pages that should be excluded
+    excluded_pages = {
+        "founders",  # Generic founders page
+        "search",    # Search page
+        "filter",    # Filter page
+        "batch",     # Batch listing page
+        "directory", # Directory page
+        "about",     # About page
+        "jobs",      # Jobs page
+        "news",      # News page
+        "blog",      # Blog page
+        "apply",     # Apply page
+    }
+    
+    # Check if it's in the excluded list
+    if company_identifier.lower() in excluded_pages:
+        return False
+        
+    # Additional checks for patterns that aren't companies
+    if "/" in company_identifier:  # URLs with additional path segments are likely not companies
+        return False
+        
+    if company_identifier.startswith("?"):  # Query parameters
+        return False
+        
+    if len(company_identifier) < 2:  # Very short identifiers are suspicious
+        return False
+        
+    # If all checks pass, it's likely a valid company
+    return True
\ No newline at end of file
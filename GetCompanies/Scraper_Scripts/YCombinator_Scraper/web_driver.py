@@ -1,5 +1,6 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from tools.resource_blocking import enable_resource_blocking
 
 def setup_driver():
     """Setup Chrome WebDriver with headless options"""
@@ -9,4 +10,7 @@ def setup_driver():
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     driver = webdriver.Chrome(options=options)
+    
+    # The directory is read from the DOM, so images, fonts and trackers are skipped
+    enable_resource_blocking(driver, 'yc_directory')
     return driver
\ No newline at end of file
@@ -1,161 +1,98 @@
-import time
 import logging
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from web_driver import setup_driver
+from validation import is_valid_company_link
+from link_collector import LinkCollector
+from scroll_waiter import install_network_tracker, read_expected_company_count, wait_for_new_links
 
 logger = logging.getLogger(__name__)
 
-def scroll_and_load_all_companies(driver, max_scrolls=50, scroll_pause_time=3):
+def count_company_links(hrefs):
+    """Number of hrefs that point at actual company pages"""
+    return sum(1 for href in hrefs if is_valid_company_link(href, ""))
+
+def scroll_and_load_all_companies(driver, collector, max_scrolls=200, wait_timeout=10, max_idle_rounds=2):
     """
-    Scroll down the page multiple times to load all companies via infinite scroll
+    Scroll down the page to load all companies via infinite scroll
+    
+    Each scroll returns as soon as new cards render or the network goes idle,
+    and scrolling stops the moment the page's own "N companies" count is reached.
     
     Args:
         driver: Selenium WebDriver instance
+        collector: Installed LinkCollector that accumulates company links
         max_scrolls: Maximum number of scroll attempts to prevent infinite loops
-        scroll_pause_time: Time to wait between scrolls for content to load
+        wait_timeout: Longest time to wait for a single scroll to load content
+        max_idle_rounds: Consecutive scrolls without new companies before giving up
     
     Returns:
-        bool: True if scrolling completed successfully
+        bool: True if every company the page reports was loaded
+              (or no count was shown and loading stopped on its own)
     """
     logger.info("Starting infinite scroll to load all companies...")
     
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    companies_count = 0
+    install_network_tracker(driver)
+    expected_count = read_expected_company_count(driver)
+    if expected_count:
+        logger.info(f"Page reports {expected_count} companies in this batch")
+    
+    collector.drain()
+    companies_count = count_company_links(collector.hrefs)
     scroll_count = 0
-    no_change_count = 0  # Track consecutive scrolls with no new content
+    idle_rounds = 0  # Track consecutive scrolls with no new content
     
     while scroll_count < max_scrolls:
-        # Get current number of company links before scrolling
-        current_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-        current_count = len(current_links)
+        if expected_count and companies_count >= expected_count:
+            logger.info(f"Reached the reported count of {expected_count} companies")
+            break
         
-        logger.info(f"Scroll {scroll_count + 1}: Found {current_count} companies so far")
+        logger.info(f"Scroll {scroll_count + 1}: Found {companies_count} companies so far")
+        previous_total = collector.count
         
-        # Scroll down to the bottom of the page
+        # Scroll down to the bottom of the page and wait for it to react
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        outcome = wait_for_new_links(driver, previous_total, timeout=wait_timeout)
         
-        # Wait for new content to load
-        time.sleep(scroll_pause_time)
-        
-        # Check if new content was loaded
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        new_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-        new_count = len(new_links)
-        
-        # Check for progress
-        if new_count > current_count:
-            logger.info(f"Loaded {new_count - current_count} more companies")
-            no_change_count = 0  # Reset counter
-            companies_count = new_count
-        else:
-            no_change_count += 1
-            logger.info(f"No new companies loaded (attempt {no_change_count})")
-        
-        # If no new content for several attempts, we might be done
-        if no_change_count >= 3:
-            logger.info("No new content loading after multiple attempts")
-            
-            # Try one more aggressive scroll approach
-            logger.info("Trying alternative scroll method...")
-            driver.execute_script("window.scrollTo(0, 0);")  # Go to top
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")  # Go to bottom
-            time.sleep(scroll_pause_time * 2)  # Wait longer
-            
-            # Check one more time
-            final_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-            final_count = len(final_links)
-            
-            if final_count > companies_count:
-                logger.info(f"Found {final_count - companies_count} more companies with alternative method")
-                companies_count = final_count
-                no_change_count = 0  # Reset and continue
-            else:
-                logger.info(f"Finished loading. Total companies found: {companies_count}")
-                break
-        
-        # If page height hasn't changed and no new links, we're likely done
-        if new_height == last_height and new_count == current_count:
-            # Try waiting a bit more in case content is still loading
-            logger.info("Page height unchanged, waiting longer...")
-            time.sleep(scroll_pause_time * 2)
-            
-            # Check one more time
-            newer_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-            if len(newer_links) == new_count:
-                logger.info(f"Finished loading. Total companies found: {len(newer_links)}")
-                break
-        
-        last_height = new_height
+        new_links = collector.drain()
         scroll_count += 1
         
-        # Progressive pause - wait longer as we scroll more
-        if scroll_count % 10 == 0:
-            logger.info(f"Completed {scroll_count} scrolls, taking a longer break...")
-            time.sleep(scroll_pause_time * 2)
-    
-    if scroll_count >= max_scrolls:
-        logger.warning(f"Reached maximum scroll limit ({max_scrolls}). Some companies might be missed.")
-    
-    # Final count
-    final_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-    logger.info(f"Scrolling completed! Total companies found: {len(final_links)}")
-    
-    return True
-
-def is_valid_company_link(href, base_url):
-    """
-    Check if the href is a valid company link that should be processed
-    
-    Args:
-        href: The href attribute from the link
-        base_url: The base Y Combinator URL
-        
-    Returns:
-        bool: True if it's a valid company link, False otherwise
-    """
-    if not href.startswith("/companies/"):
-        return False
+        if new_links:
+            new_companies = count_company_links(new_links)
+            companies_count += new_companies
+            logger.info(f"Loaded {new_companies} more companies")
+            idle_rounds = 0
+            continue
         
-    if href == "/companies/":  # Root companies page
-        return False
+        idle_rounds += 1
+        logger.info(f"No new companies loaded (attempt {idle_rounds}, {outcome})")
         
-    # Extract company identifier from href
-    company_identifier = href.replace("/companies/", "")
+        if idle_rounds >= max_idle_rounds:
+            if not expected_count or idle_rounds > max_idle_rounds:
+                break
+            # The page says there is more - nudge the scroll position once more
+            # in case the loader's intersection observer missed the last scroll
+            logger.info("Fewer companies than reported, retrying with a scroll nudge...")
+            driver.execute_script("window.scrollBy(0, -window.innerHeight);")
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
     
-    # List of non-company pages that should be excluded
-    excluded_pages = {
-        "founders",  # Generic founders page
-        "search",    # Search page
-        "filter",    # Filter page
-        "batch",     # Batch listing page
-        "directory", # Directory page
-        "about",     # About page
-        "jobs",      # Jobs page
-        "news",      # News page
-        "blog",      # Blog page
-        "apply",     # Apply page
-    }
+    collector.drain()
+    companies_count = count_company_links(collector.hrefs)
+    logger.info(f"Scrolling completed! Total companies found: {companies_count}")
     
-    # Check if it's in the excluded list
-    if company_identifier.lower() in excluded_pages:
-        return False
-        
-    # Additional checks for patterns that aren't companies
-    if "/" in company_identifier:  # URLs with additional path segments are likely not companies
+    if expected_count:
+        if companies_count >= expected_count:
+            return True
+        logger.warning(f"Page reports {expected_count} companies but only {companies_count} were loaded. "
+                       f"Some companies might be missed.")
         return False
-        
-    if company_identifier.startswith("?"):  # Query parameters
-        return False
-        
-    if len(company_identifier) < 2:  # Very short identifiers are suspicious
+    
+    if scroll_count >= max_scrolls:
+        logger.warning(f"Reached maximum scroll limit ({max_scrolls}). Some companies might be missed.")
         return False
-        
-    # If all checks pass, it's likely a valid company
+    
     return True
 
 def get_yc_2025_links(y_combinator_url, y_combinator_batch):
@@ -167,7 +104,6 @@ def get_yc_2025_links(y_combinator_url, y_combinator_batch):
         # Navigate to the batch page
         driver.get(y_combinator_batch)
         logger.info("Page loaded, waiting for initial content...")
-        time.sleep(5)  # Wait for initial page load
         
         # Wait for the page to load properly
         try:
@@ -179,27 +115,23 @@ def get_yc_2025_links(y_combinator_url, y_combinator_batch):
             logger.error("No company links found on the page. Check if the URL is correct.")
             return []
         
-        # Get initial count
-        initial_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-        logger.info(f"Initial companies loaded: {len(initial_links)}")
+        # Start collecting links in the page as they render
+        collector = LinkCollector(driver)
+        collector.install()
+        collector.drain()
+        logger.info(f"Initial companies loaded: {collector.count}")
         
         # Scroll and load all companies
-        scroll_success = scroll_and_load_all_companies(driver)
+        scroll_success = scroll_and_load_all_companies(driver, collector)
         
         if not scroll_success:
             logger.warning("Scrolling encountered issues, but continuing with available data...")
         
-        # Get the final page source and parse
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        links = soup.find_all("a", href=True)
-        
-        # Filter company links and build full URLs
+        # Filter the collected company links and build full URLs
         company_links = []
         excluded_count = 0
         
-        for link in links:
-            href = link.get("href", "")
-            
+        for href in collector.hrefs:
             # Check if it's a valid company link
             if is_valid_company_link(href, y_combinator_url):
                 full_url = y_combinator_url + href
@@ -1,14 +1,16 @@
-import json
 import os
 import logging
 from urllib.parse import urlparse, parse_qs
 from tools.blank_logger import log_blank_line
+from tools.records_io import RecordWriter, RECORD_FILE_SUFFIXES, iter_records, strip_record_suffix, write_records
 
 logger = logging.getLogger(__name__)
 
+SCRAPER_DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../Scraper_Data"))
+
 def create_scraper_data_folder():
-    # Create Scraper_Data folder if it doesn't exist
-    scraper_data_path = "GetCompanies/Scraper_Data"
+    # Create Scraper_Data folder if it doesn't exist (independent of the working directory)
+    scraper_data_path = SCRAPER_DATA_DIR
     if not os.path.exists(scraper_data_path):
         os.makedirs(scraper_data_path)
         logger.info(f"Created directory: {scraper_data_path}")
@@ -17,6 +19,26 @@ def create_scraper_data_folder():
     log_blank_line()
     return scraper_data_path
 
+def remove_other_batch_formats(file_path):
+    """Delete copies of the same batch saved in other formats (e.g. an old .json)"""
+    stem = strip_record_suffix(file_path)
+    for suffix in RECORD_FILE_SUFFIXES:
+        other_path = stem + suffix
+        if other_path != file_path and os.path.exists(other_path):
+            os.remove(other_path)
+            logger.info(f"Removed outdated batch file: {other_path}")
+
+def number_founder_record(founder_data, serial_number, company_number):
+    """Return the record with serial number, company number, processed_data and connection_status first"""
+    numbered_data = {
+        "serial_number": serial_number,
+        "company_number": company_number,
+        "processed_data": False,  # Initially set to False
+        "connection_status": "NA"  # Initially set to "NA"
+    }
+    numbered_data.update(founder_data)
+    return numbered_data
+
 def add_numbering_to_data(all_founders_data):
     """Add serial numbers, company numbers, processed_data parameter, and connection_status to the founders data"""
     company_url_to_number = {}
@@ -24,7 +46,7 @@ def add_numbering_to_data(all_founders_data):
     serial_counter = 1
     
     # Process each founder record
-    for founder_data in all_founders_data:
+    for index, founder_data in enumerate(all_founders_data):
         company_url = founder_data.get('company_yc_url', '')
         
         # Assign company number (same for all founders from the same company)
@@ -33,36 +55,93 @@ def add_numbering_to_data(all_founders_data):
             company_counter += 1
         
         # Create new ordered dictionary with serial number, company number, processed_data, and connection_status first
-        numbered_data = {
-            "serial_number": serial_counter,
-            "company_number": company_url_to_number[company_url],
-            "processed_data": False,  # Initially set to False
-            "connection_status": "NA"  # Initially set to "NA"
-        }
-        
-        # Add all existing data
-        numbered_data.update(founder_data)
+        numbered_data = number_founder_record(founder_data, serial_counter, company_url_to_number[company_url])
         
         # Replace the original data with numbered data
-        all_founders_data[all_founders_data.index(founder_data)] = numbered_data
+        all_founders_data[index] = numbered_data
         
         serial_counter += 1
     
     return all_founders_data
 
+class FounderRecordWriter:
+    """
+    Number founder records as they are produced and stream them to a JSONL file
+    
+    Memory stays flat regardless of batch size. The file is flushed after
+    every company, so a crash loses at most the company being written.
+    With resume=True the existing file is appended to and numbering continues
+    where it stopped.
+    """
+    
+    def __init__(self, file_path, resume=False):
+        self.file_path = file_path
+        self._company_numbers = {}
+        self._last_company_number = 0
+        self.serial_counter = 0
+        
+        if resume and os.path.exists(file_path):
+            for record in iter_records(file_path):
+                self.serial_counter = max(self.serial_counter, record.get('serial_number', 0))
+                self._company_numbers.setdefault(record.get('company_yc_url', ''), record.get('company_number', 0))
+            self._last_company_number = max(self._company_numbers.values(), default=0)
+            logger.info(f"Resuming {file_path} after serial {self.serial_counter}")
+        
+        self._writer = RecordWriter(file_path, append=resume, flush_every=None)
+    
+    @property
+    def founders_count(self):
+        return self.serial_counter
+    
+    @property
+    def companies_count(self):
+        return len(self._company_numbers)
+    
+    def write_company(self, founders):
+        """Number and write all founders of one company"""
+        for founder_data in founders:
+            company_url = founder_data.get('company_yc_url', '')
+            if company_url not in self._company_numbers:
+                self._last_company_number += 1
+                self._company_numbers[company_url] = self._last_company_number
+            
+            self.serial_counter += 1
+            self._writer.write(number_founder_record(
+                founder_data, self.serial_counter, self._company_numbers[company_url]
+            ))
+        self._writer.flush()
+    
+    def close(self):
+        self._writer.close()
+        logger.info(f"Data successfully saved to: {self.file_path}")
+        logger.info(f"Total unique companies: {self.companies_count}")
+        logger.info(f"Total founders: {self.founders_count}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 def save_to_json(data, file_path):
-    # Save data to JSON file
+    # Save data atomically so an interrupted save never leaves a truncated file
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_records(file_path, data)
         logger.info(f"Data successfully saved to: {file_path}")
         logger.info(f"Total records in file: {len(data)}")
         
-        # Log summary statistics
+        # Log summary statistics (gathered in a single pass)
         if data:
-            unique_companies = len(set(record.get('company_number', 0) for record in data))
-            processed_count = len([record for record in data if record.get('processed_data', False)])
-            na_status_count = len([record for record in data if record.get('connection_status') == 'NA'])
+            companies = set()
+            processed_count = 0
+            na_status_count = 0
+            for record in data:
+                companies.add(record.get('company_number', 0))
+                if record.get('processed_data', False):
+                    processed_count += 1
+                if record.get('connection_status') == 'NA':
+                    na_status_count += 1
+            unique_companies = len(companies)
             logger.info(f"Total unique companies: {unique_companies}")
             logger.info(f"Total founders: {len(data)}")
             logger.info(f"Initially processed: {processed_count} (should be 0 for new scrapes)")
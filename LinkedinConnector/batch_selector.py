@@ -9,6 +9,7 @@ if project_root not in sys.path:
 from tools.get_user_choice import get_user_choice
 from tools.info_logger import log_info, log_warning, log_error
 from tools.blank_logger import log_blank_line
+from tools.records_io import find_record_file, record_file_suffix, strip_record_suffix
 
 class LinkedInBatchSelector:
     def __init__(self):
@@ -81,9 +82,11 @@ class LinkedInBatchSelector:
         return f"YC_{season_char}{year_short}_scraped.json"
     
     def check_file_exists(self, filename):
-        """Check if the scraped data file exists"""
-        file_path = os.path.join(self.scraper_data_path, filename)
-        return os.path.exists(file_path), file_path
+        """Check if the scraped data file exists (as .jsonl, .jsonl.gz or .json)"""
+        file_path = find_record_file(self.scraper_data_path, strip_record_suffix(filename))
+        if file_path is None:
+            return False, os.path.join(self.scraper_data_path, filename)
+        return True, file_path
     
     def list_available_files(self):
         """List all available scraped YC files"""
@@ -92,7 +95,7 @@ class LinkedInBatchSelector:
         
         yc_files = []
         for file in os.listdir(self.scraper_data_path):
-            if file.startswith("YC_") and file.endswith("_scraped.json"):
+            if file.startswith("YC_") and record_file_suffix(file) and strip_record_suffix(file).endswith("_scraped"):
                 yc_files.append(file)
         
         return sorted(yc_files)
@@ -106,7 +109,7 @@ class LinkedInBatchSelector:
             for i, file in enumerate(available_files, 1):
                 # Parse filename to show readable format
                 try:
-                    parts = file.replace("YC_", "").replace("_scraped.json", "")
+                    parts = strip_record_suffix(file).replace("YC_", "").replace("_scraped", "")
                     season_char = parts[0]
                     year = "20" + parts[1:]
                     
@@ -162,7 +165,7 @@ class LinkedInBatchSelector:
             self.prompt_to_scrape_first(season, year, filename)
             return None
         
-        log_info(f"Found data file: {filename}")
+        log_info(f"Found data file: {os.path.basename(file_path)}")
         log_info(f"File path: {file_path}")
         
         return {
@@ -172,6 +175,37 @@ class LinkedInBatchSelector:
             'season': season
         }
 
+def get_user_input_for_range(total_records):
+    """Get user input for the range of records to process"""
+    log_blank_line()
+    log_info(f"Total founders available: {total_records}")
+    
+    # Get user input for how many connections to send (default 10)
+    while True:
+        try:
+            user_input = input(f"Enter the number of connection requests to send (default 10, max {total_records}): ").strip()
+            
+            if not user_input:  # Default case
+                limit = min(10, total_records)
+                break
+            
+            limit = int(user_input)
+            if limit <= 0:
+                print("Please enter a positive number.")
+                continue
+            elif limit > total_records:
+                print(f"Cannot send more than {total_records} requests (total available).")
+                continue
+            else:
+                break
+                
+        except ValueError:
+            print("Please enter a valid number.")
+    
+    log_blank_line()
+    log_info(f"Will process {limit} connection requests")
+    return limit
+
 def get_linkedin_batch_selection():
     """Function to be called from main.py"""
     selector = LinkedInBatchSelector()
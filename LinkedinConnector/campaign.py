@@ -0,0 +1,167 @@
+import os
+import logging
+import threading
+from tools.rate_limiter import TokenBucket
+from LinkedinConnector.send_connection_request import send_connection_request
+from LinkedinConnector.profile_readiness import wait_for_profile_ready, ReadinessStats
+from tools.resource_blocking import measure_page_traffic, PageTrafficStats
+
+logger = logging.getLogger(__name__)
+
+# Default per-account budget; LinkedIn's weekly limit is the real constraint
+DEFAULT_CONNECTIONS_PER_HOUR = 20
+
+class SessionExpiredError(Exception):
+    """Raised when LinkedIn shows its auth wall instead of a profile: the login is gone"""
+
+def connection_budget_configured():
+    """True if LINKEDIN_CONNECTIONS_PER_HOUR is set (single-browser runs are only capped then)"""
+    return bool(os.getenv("LINKEDIN_CONNECTIONS_PER_HOUR", "").strip())
+
+def get_connections_per_hour():
+    """Connection requests per hour and account from LINKEDIN_CONNECTIONS_PER_HOUR (default 20)"""
+    try:
+        return max(1.0, float(os.getenv("LINKEDIN_CONNECTIONS_PER_HOUR", DEFAULT_CONNECTIONS_PER_HOUR)))
+    except ValueError:
+        return float(DEFAULT_CONNECTIONS_PER_HOUR)
+
+class ConnectionBudget:
+    """
+    Per-account cap on connection requests actually sent
+
+    A token is reserved before each profile visit and given back unless a
+    request was sent, so profiles that are already connected, pending or
+    email-gated cost nothing. Reserving up front keeps several workers on
+    one account from overspending it. Up to a quarter of the hourly budget
+    can be spent in a burst.
+    """
+
+    def __init__(self, per_hour=None):
+        per_hour = per_hour or get_connections_per_hour()
+        self.bucket = TokenBucket(per_hour / 3600, capacity=max(1.0, per_hour / 4))
+
+    def reserve(self, stop_event=None):
+        """Block until a request may be sent. False if `stop_event` was set meanwhile"""
+        if self.bucket.try_acquire():
+            return True
+        logger.info("Hourly connection budget used up - waiting for it to refill")
+        if stop_event is None:
+            self.bucket.acquire()
+            return True
+        while not self.bucket.try_acquire():
+            if stop_event.wait(1):
+                return False
+        return True
+
+    def settle(self, status):
+        """Keep the reserved token only if a connection request went out"""
+        if status != "Connection Sent":
+            self.bucket.release()
+
+class CampaignOutcomes:
+    """
+    Collects the outcomes of one connection campaign
+
+    Every outcome goes to the journal, the founder store and the global
+    visited index under one lock, so several browser workers can report
+    results for the same batch without interleaving their writes.
+    """
+
+    def __init__(self, json_file_path, store, journal, visited):
+        self.batch_file = os.path.basename(json_file_path)
+        self.store = store
+        self.journal = journal
+        self.visited = visited
+        self.status_updates = {}  # serial_number -> connection_status
+        self.claims = {}  # canonical profile URL -> serial_number visiting it in this run
+        self.successful_connections = 0
+        self.skipped_duplicates = 0
+        self.readiness = ReadinessStats()
+        self.traffic = PageTrafficStats()
+        self._lock = threading.Lock()
+
+    def record(self, record, status, skipped=False):
+        serial_number = record.get("serial_number", "N/A")
+        founder_linkedin_url = record.get("founder_linkedin_url", "").strip()
+
+        with self._lock:
+            # Journal the outcome before anything else can go wrong
+            self.journal.record(serial_number, status)
+            self.store.update_status(serial_number, status)
+            self.status_updates[serial_number] = status
+
+            if skipped:
+                self.skipped_duplicates += 1
+                return
+            self.visited.record(founder_linkedin_url, status, self.batch_file, serial_number)
+            if status == "Connection Sent":
+                self.successful_connections += 1
+
+    def skip_if_known(self, record):
+        """
+        Record and skip a profile the visited index already has a final outcome for
+
+        Otherwise the profile's canonical URL is claimed for this record, so a
+        duplicate founder handed to another worker is not visited twice; that
+        duplicate is left unprocessed and settled from the index next run.
+        """
+        founder_linkedin_url = record.get("founder_linkedin_url", "")
+        serial_number = record.get("serial_number", "N/A")
+        with self._lock:
+            known_status = self.visited.get_terminal_status(founder_linkedin_url)
+            if not known_status:
+                canonical = self.visited.resolve(founder_linkedin_url)
+                claimed_by = self.claims.setdefault(canonical, serial_number) if canonical else serial_number
+                if claimed_by == serial_number:
+                    return False
+                logger.info(f"Profile is already being visited for serial {claimed_by} - skipping")
+                return True
+        logger.info(f"Profile already handled in an earlier run ({known_status}) - skipping")
+        self.record(record, known_status, skipped=True)
+        return True
+
+    def status_counts(self):
+        counts = {}
+        for status in self.status_updates.values():
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+def visit_profile(driver, record, outcomes):
+    """
+    Open one founder's profile and try to connect
+
+    Returns:
+        str: The connection status, or None if the URL redirected to a
+             profile that was already handled (the skip is recorded here)
+             or that another worker is visiting
+
+    Raises:
+        SessionExpiredError: LinkedIn showed its auth wall; every following
+                             visit in this browser would fail the same way
+    """
+    founder_linkedin_url = record.get("founder_linkedin_url", "").strip()
+
+    driver.get(founder_linkedin_url)
+    state, waited = wait_for_profile_ready(driver)
+    outcomes.readiness.record(state, waited)
+    logger.info(f"Profile page {state} after {waited:.2f}s")
+    outcomes.traffic.add(measure_page_traffic(driver))
+
+    if state == 'authwall':
+        raise SessionExpiredError("LinkedIn asked to sign in again")
+    if state in ('unavailable', 'timeout'):
+        # Not a decision by the member - leave it to be retried in a later run
+        logger.warning(f"Profile {state} - not trying to connect")
+        return "Failed to connect"
+
+    # A vanity URL may land on a profile we have already handled
+    outcomes.visited.learn_redirect(founder_linkedin_url, driver.current_url)
+    if outcomes.skip_if_known(record):
+        return None
+
+    # Scroll to ensure Connect button is visible; the action bar is already rendered
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
+
+    # Enhanced connection handling with detailed status
+    _, status = send_connection_request(driver)
+    return status
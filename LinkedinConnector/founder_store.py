@@ -0,0 +1,277 @@
+import os
+import json
+import sqlite3
+import threading
+import logging
+from tools.records_io import load_records, write_records, strip_record_suffix
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS founders (
+    serial_number INTEGER PRIMARY KEY,
+    company_number INTEGER,
+    processed_data INTEGER NOT NULL DEFAULT 0,
+    connection_status TEXT NOT NULL DEFAULT 'NA',
+    founder_linkedin_url TEXT NOT NULL DEFAULT '',
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_founders_processed ON founders (processed_data, serial_number);
+CREATE INDEX IF NOT EXISTS idx_founders_status ON founders (connection_status);
+CREATE INDEX IF NOT EXISTS idx_founders_linkedin_url ON founders (founder_linkedin_url);
+CREATE INDEX IF NOT EXISTS idx_founders_company ON founders (company_number);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS batch_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER
+);
+CREATE TABLE IF NOT EXISTS status_counts (
+    connection_status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# batch_counters holds 'total', 'processed', 'processable', 'unique_companies'
+# and 'cursor': the serial of the first unprocessed record with a LinkedIn URL
+# (NULL once everything is processed)
+
+class FounderStore:
+    """
+    Embedded SQLite copy of one YC batch file
+
+    The batch file (YC_*_scraped.json/.jsonl) stays the interchange format:
+    it is imported whenever it changes on disk and exported back after a
+    campaign. In between every profile outcome is a single-row transaction,
+    so an update costs the same no matter how large the batch is.
+    serial_number is the primary key, so lookups by it use that index.
+    """
+
+    def __init__(self, batch_file_path, db_path=None):
+        self.batch_file_path = batch_file_path
+        self.db_path = db_path or strip_record_suffix(batch_file_path) + ".sqlite3"
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        with self._lock, self._conn:
+            if self._get_counter('total') is None:
+                self._rebuild_index()
+
+    @classmethod
+    def open_for(cls, batch_file_path):
+        """Open the store for a batch file and re-import the file if it changed"""
+        store = cls(batch_file_path)
+        store.sync_from_batch_file()
+        return store
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value))
+        )
+
+    def _get_counter(self, name):
+        row = self._conn.execute("SELECT value FROM batch_counters WHERE name = ?", (name,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_counter(self, name, value):
+        self._conn.execute(
+            "INSERT INTO batch_counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (name, value)
+        )
+
+    def _add_to_counter(self, name, delta):
+        if delta:
+            self._conn.execute("UPDATE batch_counters SET value = value + ? WHERE name = ?", (delta, name))
+
+    def _add_to_status_count(self, connection_status, delta):
+        self._conn.execute(
+            "INSERT INTO status_counts (connection_status, count) VALUES (?, ?) "
+            "ON CONFLICT(connection_status) DO UPDATE SET count = count + excluded.count",
+            (connection_status, delta)
+        )
+        self._conn.execute("DELETE FROM status_counts WHERE count <= 0")
+
+    def _rebuild_index(self):
+        """Recompute every counter from the founders table (import time only)"""
+        total, processed, companies = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(processed_data), 0), "
+            "COUNT(DISTINCT company_number) FROM founders"
+        ).fetchone()
+        processable, cursor = self._conn.execute(
+            "SELECT COUNT(*), MIN(serial_number) FROM founders "
+            "WHERE processed_data = 0 AND founder_linkedin_url != ''"
+        ).fetchone()
+
+        self._set_counter('total', total)
+        self._set_counter('processed', processed)
+        self._set_counter('processable', processable)
+        self._set_counter('unique_companies', companies)
+        self._set_counter('cursor', cursor)
+
+        self._conn.execute("DELETE FROM status_counts")
+        self._conn.execute(
+            "INSERT INTO status_counts (connection_status, count) "
+            "SELECT connection_status, COUNT(*) FROM founders GROUP BY connection_status"
+        )
+
+    def _advance_cursor(self, after_serial):
+        """Move the cursor past `after_serial` using the (processed_data, serial_number) index"""
+        row = self._conn.execute(
+            "SELECT serial_number FROM founders WHERE processed_data = 0 AND founder_linkedin_url != '' "
+            "AND serial_number > ? ORDER BY serial_number LIMIT 1",
+            (after_serial,)
+        ).fetchone()
+        self._set_counter('cursor', row['serial_number'] if row else None)
+
+    def _file_signature(self):
+        stat = os.stat(self.batch_file_path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def sync_from_batch_file(self):
+        """Import the batch file unless the store already reflects this exact file"""
+        if not os.path.exists(self.batch_file_path):
+            return
+        with self._lock:
+            if self._get_meta('source_signature') == self._file_signature():
+                return
+        self.import_records(load_records(self.batch_file_path))
+
+    def import_records(self, records):
+        """Replace the store's contents with `records` in one transaction"""
+        rows = []
+        for index, record in enumerate(records, 1):
+            serial_number = record.get('serial_number') or index
+            rows.append((
+                serial_number,
+                record.get('company_number'),
+                1 if record.get('processed_data', False) else 0,
+                record.get('connection_status', 'NA'),
+                (record.get('founder_linkedin_url') or '').strip(),
+                json.dumps(record, ensure_ascii=False)
+            ))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM founders")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO founders (serial_number, company_number, processed_data, "
+                "connection_status, founder_linkedin_url, record) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._rebuild_index()
+            if os.path.exists(self.batch_file_path):
+                self._set_meta('source_signature', self._file_signature())
+        logger.info(f"Imported {len(rows)} records into {os.path.basename(self.db_path)}")
+
+    def _row_to_record(self, row):
+        record = json.loads(row['record'])
+        record['serial_number'] = row['serial_number']
+        record['processed_data'] = bool(row['processed_data'])
+        record['connection_status'] = row['connection_status']
+        return record
+
+    def iter_records(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM founders ORDER BY serial_number").fetchall()
+        for row in rows:
+            yield self._row_to_record(row)
+
+    def export_records(self, path=None):
+        """Write the store back to the batch file format (defaults to the source file)"""
+        path = path or self.batch_file_path
+        write_records(path, list(self.iter_records()))
+        if path == self.batch_file_path:
+            with self._lock, self._conn:
+                self._set_meta('source_signature', self._file_signature())
+        logger.info(f"Exported store to {path}")
+
+    def update_status(self, serial_number, connection_status):
+        """Record one profile outcome and adjust the index, as one transaction"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT processed_data, connection_status, founder_linkedin_url FROM founders "
+                "WHERE serial_number = ?",
+                (serial_number,)
+            ).fetchone()
+            if row is None:
+                return
+
+            self._conn.execute(
+                "UPDATE founders SET processed_data = 1, connection_status = ? WHERE serial_number = ?",
+                (connection_status, serial_number)
+            )
+
+            if row['connection_status'] != connection_status:
+                self._add_to_status_count(row['connection_status'], -1)
+                self._add_to_status_count(connection_status, 1)
+
+            if not row['processed_data']:
+                self._add_to_counter('processed', 1)
+                if row['founder_linkedin_url']:
+                    self._add_to_counter('processable', -1)
+                    if self._get_counter('cursor') == serial_number:
+                        self._advance_cursor(serial_number)
+
+    def get_record(self, serial_number):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM founders WHERE serial_number = ?", (serial_number,)
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def get_next_unprocessed(self, limit, after_serial=None):
+        """Next `limit` unprocessed records with a LinkedIn URL, starting at the cursor
+        or just after `after_serial`, whichever is further on"""
+        with self._lock:
+            cursor = self._get_counter('cursor')
+            if cursor is None:
+                return []
+            if after_serial is not None:
+                cursor = max(cursor, after_serial + 1)
+            rows = self._conn.execute(
+                "SELECT * FROM founders WHERE processed_data = 0 AND founder_linkedin_url != '' "
+                "AND serial_number >= ? ORDER BY serial_number LIMIT ?",
+                (cursor, limit)
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def get_stats(self):
+        """Counts used by the processing summary, read straight from the index"""
+        with self._lock:
+            counters = {
+                row['name']: row['value'] for row in self._conn.execute(
+                    "SELECT name, value FROM batch_counters"
+                )
+            }
+            status_counts = {
+                row['connection_status']: row['count'] for row in self._conn.execute(
+                    "SELECT connection_status, count FROM status_counts"
+                )
+            }
+
+        total = counters.get('total') or 0
+        processed = counters.get('processed') or 0
+        return {
+            'total': total,
+            'processed': processed,
+            'unprocessed': total - processed,
+            'unique_companies': counters.get('unique_companies') or 0,
+            'status_counts': status_counts,
+            'first_unprocessed_serial': counters.get('cursor'),
+            'processable': counters.get('processable') or 0
+        }
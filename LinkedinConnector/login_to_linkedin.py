@@ -2,33 +2,33 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 from tools.blank_logger import log_blank_line
+from LinkedinConnector.session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
+def is_logged_in_url(url):
+  """LinkedIn sends signed-in members away from /login to the feed"""
+  return "linkedin.com" in url and "/login" not in url and "/authwall" not in url and "/checkpoint" not in url
+
 def login_to_linkedin(driver, email, password):
   """Log in to LinkedIn if not already logged in"""
-  driver.get("https://www.linkedin.com/login")
   log_blank_line()
   logger.info("Trying to log in to linkedin")
   
-  # Check if already logged in by looking for feed element
-  try:
-    logger.info("Checking if already logged")
-    WebDriverWait(driver, 5).until(
-      EC.presence_of_element_located((By.CSS_SELECTOR, ".scaffold-finite-scroll__content"))
-    )
-    
-    logger.info("Already logged in to LinkedIn")
+  # Fast path: cached session cookies checked with one HTTP request
+  session = SessionStore(email)
+  if session.restore(driver):
+    logger.info("Restored LinkedIn session from the cookie cache")
     return True
   
-  except TimeoutException as e:
-    logger.error(f"Timed out when trying to log in. Error is - {e}")
-      
-  except Exception as e:
-    logger.error(f"Could not log in directly. Error is - {e}")
+  driver.get("https://www.linkedin.com/login")
   
+  # A live session (persistent profile or unverified cached cookies) redirects away from /login
+  if is_logged_in_url(driver.current_url):
+    logger.info("Already logged in to LinkedIn")
+    session.save(driver)
+    return True
     
   # Logging via filling up email and password
   try:
@@ -50,8 +50,9 @@ def login_to_linkedin(driver, email, password):
       EC.presence_of_element_located((By.CSS_SELECTOR, ".scaffold-finite-scroll__content"))
     )
     print("Successfully logged in to LinkedIn")
+    session.save(driver)
     return True
   
   except Exception as e:
-    logging.critical("Login Failed. Error is: ", e)
-    return False
\ No newline at end of file
+    logging.critical(f"Login Failed. Error is: {e}")
+    return False
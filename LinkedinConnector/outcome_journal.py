@@ -0,0 +1,69 @@
+import os
+import json
+import time
+import logging
+from tools.records_io import strip_record_suffix
+
+logger = logging.getLogger(__name__)
+
+class OutcomeJournal:
+    """
+    Append-only write-ahead log of connection outcomes for one batch file
+
+    Lives next to the batch file (YC_S25_scraped.outcomes.jsonl). Every outcome
+    is appended and fsync'd as soon as the profile has been handled, so a crash
+    or killed browser never loses work that was already done. On the next run
+    the journal is replayed into the batch file and then cleared.
+    """
+
+    def __init__(self, batch_file_path):
+        self.batch_file_path = batch_file_path
+        self.path = strip_record_suffix(batch_file_path) + ".outcomes.jsonl"
+        self._file = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def replay(self):
+        """
+        Read back the journal
+
+        Returns:
+            dict: serial_number -> connection_status (last entry wins)
+        """
+        outcomes = {}
+        if not self.exists():
+            return outcomes
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from a crash
+                outcomes[entry['serial_number']] = entry['connection_status']
+        return outcomes
+
+    def record(self, serial_number, connection_status):
+        """Durably append one outcome before moving on to the next profile"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        entry = {
+            'serial_number': serial_number,
+            'connection_status': connection_status,
+            'time': time.time()
+        }
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """Drop the journal once its outcomes are safely in the batch file"""
+        self.close()
+        if self.exists():
+            os.remove(self.path)
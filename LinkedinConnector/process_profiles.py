@@ -1,65 +1,29 @@
 import os
 import time
-import random
 import logging
 import json
+import sqlite3
 from dotenv import load_dotenv
 from LinkedinConnector.time_delay import variable_delay_between_actions
 from tools.blank_logger import log_blank_line
-from setup_driver import setup_driver
-from login_to_linkedin import login_to_linkedin
-from send_connection_request import send_connection_request
+from tools.records_io import load_records, write_records, record_file_suffix, strip_record_suffix
+from LinkedinConnector.founder_store import FounderStore
+from LinkedinConnector.outcome_journal import OutcomeJournal
+from LinkedinConnector.visited_index import VisitedIndex
+from LinkedinConnector.campaign import (
+    CampaignOutcomes,
+    ConnectionBudget,
+    SessionExpiredError,
+    connection_budget_configured,
+    visit_profile
+)
+from LinkedinConnector.worker_pool import get_worker_count, load_worker_accounts, run_worker_pool
+from LinkedinConnector.batch_selector import get_user_input_for_range
+from LinkedinConnector.setup_driver import setup_driver
+from LinkedinConnector.login_to_linkedin import login_to_linkedin
 
 logger = logging.getLogger(__name__)
 
-def load_json_data(json_file_path):
-    """Load founder data from JSON file"""
-    try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.info(f"Successfully loaded {len(data)} records from JSON file")
-        return data
-    except FileNotFoundError:
-        logger.error(f"JSON file not found: {json_file_path}")
-        return []
-    except json.JSONDecodeError as e:
-        logger.error(f"Error parsing JSON file: {e}")
-        return []
-    except Exception as e:
-        logger.error(f"Error loading JSON file: {e}")
-        return []
-
-def get_user_input_for_range(total_records):
-    """Get user input for the range of records to process"""
-    log_blank_line()
-    logger.info(f"Total founders available: {total_records}")
-    
-    # Get user input for how many connections to send (default 10)
-    while True:
-        try:
-            user_input = input(f"Enter the number of connection requests to send (default 10, max {total_records}): ").strip()
-            
-            if not user_input:  # Default case
-                limit = min(10, total_records)
-                break
-            
-            limit = int(user_input)
-            if limit <= 0:
-                print("Please enter a positive number.")
-                continue
-            elif limit > total_records:
-                print(f"Cannot send more than {total_records} requests (total available).")
-                continue
-            else:
-                break
-                
-        except ValueError:
-            print("Please enter a valid number.")
-    
-    log_blank_line()
-    logger.info(f"Will process {limit} connection requests")
-    return limit
-
 def update_json_with_connection_status(json_file_path, status_updates):
     """Update JSON file with connection status for specific records
     
@@ -67,11 +31,13 @@ def update_json_with_connection_status(json_file_path, status_updates):
         json_file_path (str): Path to the JSON file
         status_updates (dict): Dictionary mapping serial_number to connection_status
                                 e.g., {1: 'Connection Sent', 2: 'Already Connected'}
+    
+    Returns:
+        bool: True if the file was rewritten
     """
     try:
         # Load current data
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_records(json_file_path)
         
         # Update records with new connection status
         updated_count = 0
@@ -82,9 +48,8 @@ def update_json_with_connection_status(json_file_path, status_updates):
                 record['processed_data'] = True
                 updated_count += 1
         
-        # Save updated data
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save updated data in the same format it was read from (atomic rewrite)
+        write_records(json_file_path, data)
             
         log_blank_line()
         logger.info(f"Updated {updated_count} records with connection status")
@@ -97,45 +62,42 @@ def update_json_with_connection_status(json_file_path, status_updates):
         logger.info("Status Summary for this batch:")
         for status, count in status_summary.items():
             logger.info(f"  {status}: {count} records")
+        return True
         
     except Exception as e:
         logger.error(f"Error updating JSON file with connection status: {e}")
+        return False
 
-def get_next_unprocessed_records(data, limit):
-    """Get the next batch of unprocessed records starting from the first False in processed_data"""
-    unprocessed = []
-    
-    # First, sort data by serial_number to ensure correct order
-    sorted_data = sorted(data, key=lambda x: x.get('serial_number', 0))
+def recover_journaled_outcomes(json_file_path, journal):
+    """Fold outcomes left in the journal by an interrupted run into the batch file"""
+    pending = journal.replay()
+    if not pending:
+        journal.clear()
+        return
     
-    # Find the first record with processed_data = False
-    start_processing = False
+    log_blank_line()
+    logger.warning(f"Recovering {len(pending)} outcomes from an interrupted run")
+    if update_json_with_connection_status(json_file_path, pending):
+        journal.clear()
+
+def get_next_unprocessed_records(store, limit, outcomes=None):
+    """
+    Get the next batch of unprocessed records (with a LinkedIn URL) in serial order
     
-    for record in sorted_data:
-        # Start processing from the first False value
-        if not start_processing and not record.get('processed_data', False):
-            start_processing = True
-            logger.info(f"Starting from serial number: {record.get('serial_number', 'N/A')}")
-        
-        # If we haven't reached the first False yet, skip
-        if not start_processing:
-            continue
-            
-        # Skip if already processed (processed_data is True)
-        if record.get('processed_data', False):
-            continue
-            
-        # Skip if no LinkedIn URL
-        founder_linkedin_url = record.get("founder_linkedin_url", "").strip()
-        if not founder_linkedin_url:
-            logger.warning(f"Skipping serial {record.get('serial_number', 'N/A')} - no LinkedIn URL")
-            continue
-            
-        unprocessed.append(record)
-        
-        # Stop when we have enough records
-        if len(unprocessed) >= limit:
+    With `outcomes`, records the visited index already has a final outcome for
+    are recorded as skipped on the way and the selection is topped up past
+    them, so they do not use up the requested number of profiles.
+    """
+    unprocessed = []
+    after_serial = None
+    while len(unprocessed) < limit:
+        candidates = store.get_next_unprocessed(limit - len(unprocessed), after_serial)
+        if not candidates:
             break
+        for record in candidates:
+            if outcomes is None or not outcomes.skip_if_known(record):
+                unprocessed.append(record)
+        after_serial = candidates[-1]['serial_number']
     
     if unprocessed:
         first_serial = unprocessed[0].get('serial_number', 'N/A')
@@ -148,9 +110,10 @@ def get_batch_info_from_filename(json_file_path):
     """Extract batch information from filename for display"""
     filename = os.path.basename(json_file_path)
     
-    if filename.startswith("YC_") and filename.endswith("_scraped.json"):
+    stem = strip_record_suffix(filename)
+    if filename.startswith("YC_") and record_file_suffix(filename) and stem.endswith("_scraped"):
         try:
-            parts = filename.replace("YC_", "").replace("_scraped.json", "")
+            parts = stem.replace("YC_", "").replace("_scraped", "")
             season_char = parts[0]
             year = "20" + parts[1:]
             
@@ -163,60 +126,41 @@ def get_batch_info_from_filename(json_file_path):
     
     return filename
 
-def show_processing_stats(data, json_file_path):
-    """Show statistics about the data to be processed"""
-    total_records = len(data)
-    
-    # Count processed records using processed_data parameter
-    processed_records = len([r for r in data if r.get('processed_data', False)])
-    unprocessed_records = total_records - processed_records
-    
-    # Connection status statistics
-    status_counts = {}
-    for record in data:
-        status = record.get('connection_status', 'Unknown')
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
-    # Find the first unprocessed record's serial number
-    sorted_data = sorted(data, key=lambda x: x.get('serial_number', 0))
-    first_unprocessed_serial = None
-    for record in sorted_data:
-        if not record.get('processed_data', False) and record.get("founder_linkedin_url", "").strip():
-            first_unprocessed_serial = record.get('serial_number', 'N/A')
-            break
-    
-    # Count records with LinkedIn URLs that can be processed (from first False onwards)
-    processable_records = 0
-    start_counting = False
-    for record in sorted_data:
-        if not start_counting and not record.get('processed_data', False):
-            start_counting = True
-        
-        if start_counting and not record.get('processed_data', False) and record.get("founder_linkedin_url", "").strip():
-            processable_records += 1
-    
-    unique_companies = len(set(r.get('company_number', 0) for r in data if r.get('company_number')))
+def show_processing_stats(store, json_file_path):
+    """Show statistics about the data to be processed
     
+    Returns:
+        dict: The stats from FounderStore.get_stats()
+    """
+    stats = store.get_stats()
     batch_info = get_batch_info_from_filename(json_file_path)
     
     log_blank_line()
     logger.info(f"Data Statistics for {batch_info}:")
-    logger.info(f"Total founders: {total_records}")
-    logger.info(f"Unique companies: {unique_companies}")
-    logger.info(f"Already processed: {processed_records}")
-    logger.info(f"Remaining unprocessed: {unprocessed_records}")
+    logger.info(f"Total founders: {stats['total']}")
+    logger.info(f"Unique companies: {stats['unique_companies']}")
+    logger.info(f"Already processed: {stats['processed']}")
+    logger.info(f"Remaining unprocessed: {stats['unprocessed']}")
     
     # Show connection status breakdown
     logger.info("Connection Status Breakdown:")
-    for status, count in sorted(status_counts.items()):
+    for status, count in sorted(stats['status_counts'].items()):
         logger.info(f"  {status}: {count}")
     
-    if first_unprocessed_serial:
-        logger.info(f"Next processing will start from serial: {first_unprocessed_serial}")
-    logger.info(f"Available for processing (from first False): {processable_records}")
+    if stats['first_unprocessed_serial']:
+        logger.info(f"Next processing will start from serial: {stats['first_unprocessed_serial']}")
+    logger.info(f"Available for processing (from first False): {stats['processable']}")
+    return stats
 
-def process_profiles_with_file(json_file_path):
-    """Process profiles using a specific JSON file path"""
+def process_profiles_with_file(json_file_path, limit=None, driver=None):
+    """Process profiles using a specific JSON file path
+    
+    Args:
+        json_file_path (str): Batch file to work through
+        limit (int): Number of profiles to process; asked interactively if None
+        driver: An already logged-in WebDriver to reuse (left open afterwards),
+                e.g. the LinkedinOS service's warm browser
+    """
     load_dotenv()
     
     linkedin_email = os.getenv("LINKEDIN_EMAIL")
@@ -230,59 +174,114 @@ def process_profiles_with_file(json_file_path):
     logger.info(f"Using LinkedIn email from .env: {linkedin_email}")
     logger.info(f"Using JSON file: {json_file_path}")
     
-    # Load data from JSON file
-    all_data = load_json_data(json_file_path)
-    if not all_data:
-        logger.error("No data loaded from JSON file. Exiting...")
+    # Outcomes journaled by a crashed run go into the batch file first
+    journal = OutcomeJournal(json_file_path)
+    if journal.exists():
+        recover_journaled_outcomes(json_file_path, journal)
+    
+    # Load the batch into its SQLite store (re-imported only if the file changed)
+    try:
+        store = FounderStore.open_for(json_file_path)
+    except FileNotFoundError:
+        logger.error(f"JSON file not found: {json_file_path}")
+        return
+    except (json.JSONDecodeError, sqlite3.Error) as e:
+        logger.error(f"Error loading batch data: {e}")
         return
     
     # Show processing statistics
-    show_processing_stats(all_data, json_file_path)
-    
-    # Get user input for how many connections to send
-    available_records = 0
-    sorted_data = sorted(all_data, key=lambda x: x.get('serial_number', 0))
-    start_counting = False
-    
-    # Count available records from the first False onwards
-    for record in sorted_data:
-        if not start_counting and not record.get('processed_data', False):
-            start_counting = True
-        
-        if start_counting and not record.get('processed_data', False) and record.get("founder_linkedin_url", "").strip():
-            available_records += 1
+    stats = show_processing_stats(store, json_file_path)
+    if not stats['total']:
+        logger.error("No data loaded from JSON file. Exiting...")
+        store.close()
+        return
     
+    available_records = stats['processable']
     if available_records == 0:
         logger.info("No unprocessed records with LinkedIn URLs found. All founders may already have been processed.")
+        store.close()
         return
     
-    limit = get_user_input_for_range(available_records)
+    if limit is None:
+        limit = get_user_input_for_range(available_records)
+    limit = min(limit, available_records)
+    
+    # Profiles already settled in any batch are skipped without a page load,
+    # including those only recorded in batch files from before the index existed
+    visited = VisitedIndex()
+    visited.backfill_from_batch_files(os.path.dirname(os.path.abspath(json_file_path)))
+    outcomes = CampaignOutcomes(json_file_path, store, journal, visited)
     
     # Get next unprocessed records
-    records_to_process = get_next_unprocessed_records(all_data, limit)
+    records_to_process = get_next_unprocessed_records(store, limit, outcomes)
+    if records_to_process:
+        logger.info(f"Found {len(records_to_process)} unprocessed records to work with")
+        log_blank_line()
     
+    worker_count = get_worker_count()
     if not records_to_process:
-        logger.info("No unprocessed records found. All founders may already have been processed.")
-        return
+        logger.info("No unprocessed records left to visit. All founders may already have been processed.")
+    elif driver is not None:
+        process_records_serially(driver, records_to_process, outcomes)
+    elif worker_count > 1:
+        run_worker_pool(records_to_process, outcomes, load_worker_accounts(worker_count))
+    else:
+        # Setup browser and login
+        driver = setup_driver()
+        if not login_to_linkedin(driver, linkedin_email, linkedin_password):
+            logger.critical("Failed to login to LinkedIn")
+            driver.quit()
+            store.close()
+            visited.close()
+            return
+        process_records_serially(driver, records_to_process, outcomes)
+        driver.quit()
     
-    logger.info(f"Found {len(records_to_process)} unprocessed records to work with")
-    log_blank_line()
+    # Write the store back to the batch file so it stays the source of truth
+    if outcomes.status_updates:
+        store.export_records()
+        log_blank_line()
+        logger.info(f"Updated {len(outcomes.status_updates)} records with connection status")
+    journal.clear()
+    store.close()
+    visited.close()
     
-    # Setup browser and login
-    driver = setup_driver()
-    if not login_to_linkedin(driver, linkedin_email, linkedin_password):
-        logger.critical("Failed to login to LinkedIn")
-        driver.quit()
-        return
+    log_blank_line(2)
+    logger.info(f"🎉 Connection campaign completed!")
+    logger.info(f"📊 Campaign Results:")
+    logger.info(f"   • New connections sent: {outcomes.successful_connections}")
+    logger.info(f"   • Total profiles processed: {len(outcomes.status_updates)}")
+    logger.info(f"   • Skipped (already handled in another batch): {outcomes.skipped_duplicates}")
+    
+    # Show detailed breakdown
+    logger.info(f"📈 Detailed Breakdown:")
+    for status, count in sorted(outcomes.status_counts().items()):
+        logger.info(f"   {status}: {count}")
     
-    # Track connection results
-    status_updates = {}  # serial_number -> connection_status
-    successful_connections = 0
+    readiness = outcomes.readiness.summary()
+    if readiness:
+        logger.info(f"⏱️ Profile readiness over {readiness['count']} pages: "
+                    f"mean {readiness['mean']:.2f}s, p50 {readiness['p50']:.2f}s, "
+                    f"p90 {readiness['p90']:.2f}s, max {readiness['max']:.2f}s")
+        logger.info(f"   Page states: {readiness['states']}")
+    traffic = outcomes.traffic.summary()
+    if traffic:
+        logger.info(f"🌐 Page traffic: {traffic['requests_per_page']:.0f} requests, "
+                    f"{traffic['kb_per_page']:.0f} KB per profile at readiness")
     
-    # Process each profile
-    for i, record in enumerate(records_to_process, 1):
-        delay_time = random.randint(0, 6)
+    logger.info(f"🚀 Go and have some fun!")
 
+def process_records_serially(driver, records_to_process, outcomes, budget=None):
+    """
+    Work through the records one after another in a single browser
+
+    Paced by the human-like delays; sent requests are only capped by a
+    ConnectionBudget as well when one is passed in or
+    LINKEDIN_CONNECTIONS_PER_HOUR is set.
+    """
+    if budget is None and connection_budget_configured():
+        budget = ConnectionBudget()
+    for i, record in enumerate(records_to_process, 1):
         founder_linkedin_url = record.get("founder_linkedin_url", "").strip()
         founder_name = record.get("founder_name", "Unknown")
         company_name = record.get("company_name", "Unknown Company")
@@ -293,23 +292,19 @@ def process_profiles_with_file(json_file_path):
         logger.info(f"Founder: {founder_name} from {company_name}")
         logger.info(f"URL: {founder_linkedin_url}")
         
+        if outcomes.skip_if_known(record):
+            continue
+        
+        status = None
+        reserved = False
         try:
-            driver.get(founder_linkedin_url)
-            time.sleep(5)
-            
-            # Scroll to ensure Connect button is visible
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
-            time.sleep(1)
-            
-            # Enhanced connection handling with detailed status
-            success, status = send_connection_request(driver)
-            
-            # Track successful connections (only for "Connection Sent")
-            if success and status == "Connection Sent":
-                successful_connections += 1
-            
-            # Store status for JSON update
-            status_updates[serial_number] = status
+            if budget is not None:
+                budget.reserve()
+                reserved = True
+            status = visit_profile(driver, record, outcomes)
+            if status is None:
+                continue
+            outcomes.record(record, status)
                 
             # Add delay to avoid rate limiting
             delays = variable_delay_between_actions()
@@ -319,33 +314,17 @@ def process_profiles_with_file(json_file_path):
             log_blank_line()
             logger.warning("Script stopped by user")
             break
+        except SessionExpiredError as e:
+            # The remaining profiles stay unprocessed for the next run
+            logger.critical(f"{e} - stopping the campaign, log in again and rerun it")
+            break
         except Exception as e:
             logger.error(f"Error processing {founder_linkedin_url}: {e}")
-            status_updates[serial_number] = "Failed to connect"
+            outcomes.record(record, "Failed to connect")
             time.sleep(20)
-    
-    # Update JSON file with connection status
-    if status_updates:
-        update_json_with_connection_status(json_file_path, status_updates)
-    
-    driver.quit()
-    
-    log_blank_line(2)
-    logger.info(f"🎉 Connection campaign completed!")
-    logger.info(f"📊 Campaign Results:")
-    logger.info(f"   • New connections sent: {successful_connections}")
-    logger.info(f"   • Total profiles processed: {len(status_updates)}")
-    
-    # Show detailed breakdown
-    final_status_counts = {}
-    for status in status_updates.values():
-        final_status_counts[status] = final_status_counts.get(status, 0) + 1
-    
-    logger.info(f"📈 Detailed Breakdown:")
-    for status, count in sorted(final_status_counts.items()):
-        logger.info(f"   {status}: {count}")
-    
-    logger.info(f"🚀 Go and have some fun!")
+        finally:
+            if reserved:
+                budget.settle(status)
 
 # Legacy function for backward compatibility (if needed)
 def process_profiles():
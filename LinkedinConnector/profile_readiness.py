@@ -0,0 +1,104 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# One round trip: is the top-card action bar (Connect / Message / More /
+# Follow / Pending) rendered yet, or did LinkedIn serve something else?
+PROFILE_STATE_JS = """
+const main = document.querySelector('main');
+if (document.querySelector('.authwall-join-form, form.login__form, #session_key')) {
+    return 'authwall';
+}
+if (document.querySelector('.not-found__container, .profile-unavailable')) {
+    return 'unavailable';
+}
+if (!main) {
+    return 'loading';
+}
+const actionBar = main.querySelector('.pv-top-card-v2-ctas, .pvs-profile-actions, .pv-top-card__ctas');
+if (actionBar && actionBar.querySelector('button')) {
+    return 'ready';
+}
+const labels = ['Connect', 'Message', 'More', 'Follow', 'Pending'];
+const topCard = main.querySelector('section');
+if (topCard) {
+    for (const span of topCard.querySelectorAll('button span.artdeco-button__text')) {
+        if (labels.includes(span.textContent.trim())) {
+            return 'ready';
+        }
+    }
+}
+return 'loading';
+"""
+
+def wait_for_profile_ready(driver, timeout=15, poll_interval=0.2):
+    """
+    Wait until the profile's top-card action bar is present
+
+    Meant to follow driver.get with the 'eager' page-load strategy: the DOM
+    is parsed but images and trackers may still be loading, which the
+    connect flow does not need.
+
+    Args:
+        driver: Selenium WebDriver instance
+        timeout: Upper bound on the wait in seconds
+        poll_interval: Seconds between polls
+
+    Returns:
+        tuple: (state, seconds waited) where state is 'ready', 'authwall',
+               'unavailable' or 'timeout'
+    """
+    start = time.monotonic()
+    while True:
+        try:
+            state = driver.execute_script(PROFILE_STATE_JS)
+        except Exception as e:
+            # The document can be swapped out under us during redirects
+            logger.debug(f"Readiness poll failed: {e}")
+            state = 'loading'
+
+        elapsed = time.monotonic() - start
+        if state != 'loading':
+            return state, elapsed
+        if elapsed >= timeout:
+            return 'timeout', elapsed
+        time.sleep(poll_interval)
+
+class ReadinessStats:
+    """Per-profile readiness latencies for the campaign summary (thread-safe)"""
+
+    def __init__(self):
+        self.latencies = []
+        self.states = {}
+        self._lock = threading.Lock()
+
+    def record(self, state, seconds):
+        with self._lock:
+            self.latencies.append(seconds)
+            self.states[state] = self.states.get(state, 0) + 1
+
+    def summary(self):
+        """
+        Returns:
+            dict: count, mean, p50, p90 and max latency in seconds plus the
+                  per-state counts, or None if nothing was recorded
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+            states = dict(self.states)
+        if not latencies:
+            return None
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return {
+            'count': len(latencies),
+            'mean': sum(latencies) / len(latencies),
+            'p50': percentile(0.5),
+            'p90': percentile(0.9),
+            'max': latencies[-1],
+            'states': states
+        }
@@ -9,6 +9,136 @@ from selenium.common.exceptions import (
 
 from tools.info_logger import log_error, log_info, log_warning
 
+# Reads the top card and the (already rendered, still hidden) More menu in one
+# round trip. Returns {state, element, more_button}; element is what to click.
+CLASSIFY_PROFILE_JS = """
+const main = document.querySelector('main');
+const result = {state: 'unknown', element: null, more_button: null};
+if (!main) {
+    return result;
+}
+const topCard = main.querySelector('section');
+if (!topCard) {
+    return result;
+}
+const text = (node) => (node.textContent || '').trim();
+const hasClasses = (node, names) => names.every((name) => node.classList.contains(name));
+
+// Same rules as check_pending_connection / find_connect_button
+const topButtons = [];
+for (const span of topCard.querySelectorAll('span.artdeco-button__text')) {
+    const button = span.parentElement;
+    if (button && hasClasses(button, ['artdeco-button', 'artdeco-button--2'])) {
+        topButtons.push({label: text(span), button: button});
+    }
+}
+
+const moreButton = topCard.querySelector('button.artdeco-dropdown__trigger');
+result.more_button = moreButton;
+const menu = moreButton ? moreButton.closest('.artdeco-dropdown') : null;
+const menuItems = [];
+if (menu) {
+    for (const item of menu.querySelectorAll('.artdeco-dropdown__item')) {
+        const label = item.querySelector('span.display-flex.t-normal.flex-1');
+        menuItems.push({label: label ? text(label) : text(item), item: item});
+    }
+}
+
+if (menuItems.some((entry) => entry.label.startsWith('Remove connection'))) {
+    result.state = 'connected';
+    return result;
+}
+const distance = topCard.querySelector('.dist-value');
+if (distance && text(distance) === '1st') {
+    result.state = 'connected';
+    return result;
+}
+
+for (const entry of topButtons) {
+    const grandparent = entry.button.parentElement;
+    const inAction = grandparent && hasClasses(grandparent, ['pv-action', 'pv-action__padding']);
+    const styled = hasClasses(entry.button, ['artdeco-button--secondary', 'ember-view']);
+    if (entry.label.startsWith('Pending') && styled && !inAction) {
+        result.state = 'pending';
+        result.element = entry.button;
+        return result;
+    }
+}
+for (const entry of topButtons) {
+    const styled = entry.button.classList.contains('artdeco-button--primary')
+        || entry.button.classList.contains('artdeco-button--secondary');
+    if (entry.label === 'Connect' && styled && entry.button.classList.contains('ember-view')
+            && !entry.button.classList.contains('artdeco-button--muted')) {
+        result.state = 'connect-direct';
+        result.element = entry.button;
+        return result;
+    }
+}
+for (const entry of menuItems) {
+    if (entry.label === 'Connect') {
+        result.state = 'connect-in-menu';
+        result.element = entry.item;
+        return result;
+    }
+}
+if (topButtons.some((entry) => entry.label === 'Follow' || entry.label === 'Following')
+        && (menuItems.length > 0 || !moreButton)) {
+    result.state = 'follow-only';
+}
+return result;
+"""
+
+# Finds the Connect item in the dropdown that `arguments[0]` (the More button) opens
+MENU_CONNECT_ITEM_JS = """
+const menu = arguments[0].closest('.artdeco-dropdown');
+if (!menu) {
+    return null;
+}
+for (const item of menu.querySelectorAll('.artdeco-dropdown__item')) {
+    const label = item.querySelector('span.display-flex.t-normal.flex-1');
+    if (((label || item).textContent || '').trim() === 'Connect') {
+        return item;
+    }
+}
+return null;
+"""
+
+def classify_profile_state(driver):
+    """
+    Snapshot the profile's connection state in a single WebDriver round trip
+
+    Returns:
+        dict: 'state' is one of 'connected', 'pending', 'connect-direct',
+              'connect-in-menu', 'follow-only' or 'unknown'; 'element' is the
+              element to click (if any) and 'more_button' the More trigger
+    """
+    try:
+        return driver.execute_script(CLASSIFY_PROFILE_JS)
+    except Exception as e:
+        log_warning(f"Could not classify profile state: {e}")
+        return {'state': 'unknown', 'element': None, 'more_button': None}
+
+def open_menu_connect_item(driver, more_button, timeout=3):
+    """
+    Open the More menu and return its Connect item, looked up after opening
+    because LinkedIn may re-render the menu (the classifier's item goes stale)
+
+    Returns:
+        The Connect item, or None if it did not show up
+    """
+    try:
+        driver.execute_script("arguments[0].click();", more_button)
+        log_info("🔘 More button clicked to expand menu")
+        return WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(MENU_CONNECT_ITEM_JS, more_button)
+        )
+    except TimeoutException:
+        log_warning("⚠️ Connect item did not appear in the More menu")
+    except Exception as e:
+        log_warning(f"Could not open the More menu: {e}")
+    # Fall back to searching whatever dropdown is open
+    return find_connect_button(driver)
+
 def check_already_connected(driver):
     """Check if already connected via More button dropdown"""
     try:
@@ -199,6 +329,21 @@ def find_connect_button(driver):
     
     return None
 
+def find_connect_button_with_checks(driver):
+    """
+    Fallback for profiles the classifier could not read: the original
+    sequence of already-connected, pending and Connect button checks
+
+    Returns:
+        The Connect button, None, or the status string
+        'Already Connected' / 'Pending state'
+    """
+    if check_already_connected(driver):
+        return "Already Connected"
+    if check_pending_connection(driver):
+        return "Pending state"
+    return find_connect_button(driver)
+
 def send_connection_request(driver):
     """
     Enhanced function to send connection request with comprehensive status detection
@@ -206,33 +351,47 @@ def send_connection_request(driver):
     Status can be: 'Connection Sent', 'Already Connected', 'Pending state', 'Email wanted', 'Doesn\'t want to connect'
     """
     
-    # Step 1: Check if already connected
-    if check_already_connected(driver):
-        return False, "Already Connected"
+    # Step 1: Classify the profile in one round trip
+    snapshot = classify_profile_state(driver)
+    state = snapshot['state']
+    log_info(f"Profile state: {state}")
     
-    # Step 2: Check if connection is pending
-    if check_pending_connection(driver):
+    if state == 'connected':
+        log_info("🔥 Already connected to this person")
+        return False, "Already Connected"
+    if state == 'pending':
+        log_info("⏳ Connection is in Pending state")
         return False, "Pending state"
+    if state == 'follow-only':
+        log_warning("⚠️ Only Follow is offered on this profile")
+        return False, "Doesn't want to connect"
     
-    # Step 3: Look for Connect button
-    connect_button = find_connect_button(driver)
+    if state == 'connect-direct':
+        connect_button = snapshot['element']
+    elif state == 'connect-in-menu':
+        # The menu item only reacts once the dropdown is open
+        connect_button = open_menu_connect_item(driver, snapshot['more_button'])
+    else:
+        connect_button = find_connect_button_with_checks(driver)
+        if connect_button in ("Already Connected", "Pending state"):
+            return False, connect_button
     
     if not connect_button:
         log_warning("⚠️ No connect button found and not connected/pending")
         return False, "Doesn't want to connect"
     
-    # Step 4: Click the Connect button
+    # Step 2: Click the Connect button
     try:
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", connect_button)
         time.sleep(0.5)
         driver.execute_script("arguments[0].click();", connect_button)
         log_info("🔘 Connect button clicked")
         
-        # Step 5: Check if email is required
+        # Step 3: Check if email is required
         if check_email_required_dialog(driver):
             return False, "Email wanted"
         
-        # Step 6: Handle "Send without note" dialog if it appears
+        # Step 4: Handle "Send without note" dialog if it appears
         try:
             send_button = WebDriverWait(driver, 8).until(
                 EC.element_to_be_clickable((By.XPATH,
@@ -0,0 +1,151 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import requests
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SESSION_DIR = os.path.join(PROJECT_ROOT, ".linkedin_sessions")
+
+# Cheapest authenticated endpoint: a small JSON document about the member
+SESSION_CHECK_URL = "https://www.linkedin.com/voyager/api/me"
+# Any small same-origin page works for setting cookies before the real navigation
+COOKIE_LANDING_URL = "https://www.linkedin.com/robots.txt"
+
+# Answers that mean the session itself was refused; anything else (429, 5xx,
+# LinkedIn's 999 bot response, other redirects) says nothing about the cookies
+AUTH_FAILURE_STATUSES = {401, 403}
+AUTH_FAILURE_PATHS = ("/login", "/authwall")
+
+AUTH_COOKIE = "li_at"
+CSRF_COOKIE = "JSESSIONID"
+
+class SessionStore:
+    """
+    Cached LinkedIn session cookies for one account
+
+    After a successful login the browser's linkedin.com cookies (li_at,
+    JSESSIONID, ...) are saved with their expiry. On the next start they are
+    checked with one authenticated HTTP request and injected into the fresh
+    browser, so the login page is only visited when the session is gone.
+    """
+
+    def __init__(self, email):
+        account_id = hashlib.sha1((email or "").strip().lower().encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(SESSION_DIR, f"{account_id}.json")
+
+    def load(self):
+        """Saved cookies that have not expired yet ([] if none)"""
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable session cache {self.path}: {e}")
+            return []
+
+        now = time.time()
+        return [cookie for cookie in cookies if not cookie.get('expiry') or cookie['expiry'] > now]
+
+    def save(self, driver):
+        """Store the driver's linkedin.com cookies (readable by the owner only)"""
+        cookies = [cookie for cookie in driver.get_cookies() if "linkedin.com" in cookie.get('domain', '')]
+        if not any(cookie['name'] == AUTH_COOKIE for cookie in cookies):
+            logger.warning("No LinkedIn auth cookie found - session not cached")
+            return
+
+        os.makedirs(SESSION_DIR, mode=0o700, exist_ok=True)
+        temp_path = self.path + ".tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f)
+        os.replace(temp_path, self.path)
+
+        auth_cookie = next(cookie for cookie in cookies if cookie['name'] == AUTH_COOKIE)
+        if auth_cookie.get('expiry'):
+            days_left = (auth_cookie['expiry'] - time.time()) / 86400
+            logger.info(f"LinkedIn session cached ({days_left:.0f} days until the cookie expires)")
+        else:
+            logger.info("LinkedIn session cached")
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def validate(self, cookies, user_agent=None):
+        """
+        Check the cookies with one authenticated request
+
+        Args:
+            cookies (list): Cookies as returned by load()
+            user_agent (str): The browser's own User-Agent, so the check looks
+                              like the browser the cookies belong to
+
+        Returns:
+            bool: True/False for a valid/rejected session, or None if the
+                  answer was inconclusive (the caller decides what to do)
+        """
+        jar = {cookie['name']: cookie['value'] for cookie in cookies}
+        if AUTH_COOKIE not in jar:
+            return False
+
+        headers = {
+            'csrf-token': jar.get(CSRF_COOKIE, '').strip('"'),
+            'x-restli-protocol-version': '2.0.0',
+            'accept': 'application/vnd.linkedin.normalized+json+2.1'
+        }
+        if user_agent:
+            headers['user-agent'] = user_agent
+        try:
+            response = requests.get(SESSION_CHECK_URL, cookies=jar, headers=headers,
+                                    allow_redirects=False, timeout=5)
+        except requests.RequestException as e:
+            logger.warning(f"Could not validate the cached session: {e}")
+            return None
+
+        if response.status_code == 200:
+            return True
+        location = response.headers.get('Location', '')
+        if response.status_code in AUTH_FAILURE_STATUSES or any(path in location for path in AUTH_FAILURE_PATHS):
+            return False
+        logger.warning(f"Cached session check was inconclusive (HTTP {response.status_code})")
+        return None
+
+    def restore(self, driver):
+        """
+        Put a cached, still valid session into the browser
+
+        The cache is only dropped when LinkedIn definitely refused the session.
+        If the check was inconclusive (unreachable, throttled, bot response)
+        the cookies are still injected but False is returned, so the caller
+        confirms in the browser.
+
+        Returns:
+            bool: True if the browser is now logged in via cached cookies
+        """
+        cookies = self.load()
+        if not any(cookie['name'] == AUTH_COOKIE for cookie in cookies):
+            return False
+
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent;")
+        except Exception:
+            user_agent = None
+        valid = self.validate(cookies, user_agent)
+        if valid is False:
+            logger.info("Cached LinkedIn session was rejected - logging in again")
+            self.clear()
+            return False
+
+        driver.get(COOKIE_LANDING_URL)
+        for cookie in cookies:
+            cookie = {key: value for key, value in cookie.items() if key != 'sameSite' or value in ('Strict', 'Lax', 'None')}
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+        return valid is True
@@ -1,21 +1,57 @@
 import logging
 import os
+import shutil
+import tempfile
 from selenium import webdriver
+from tools.resource_blocking import enable_resource_blocking
 
 logger = logging.getLogger(__name__)
 
-def setup_driver():
-    """Setup and return Chrome WebDriver with appropriate options"""
-    options = webdriver.ChromeOptions()
+def use_ephemeral_profile():
+    """
+    Sessions come from the cookie cache (session_store), so by default every
+    browser starts from a fresh, throw-away profile. Set
+    LINKEDINOS_CHROME_PROFILE=persistent to keep ./chrome_profile instead.
+    """
+    return os.getenv("LINKEDINOS_CHROME_PROFILE", "ephemeral").strip().lower() != "persistent"
+
+def _remove_profile_on_quit(driver, chrome_profile_path):
+    original_quit = driver.quit
     
-    # Get absolute path for chrome profile
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    chrome_profile_path = os.path.join(project_root, "chrome_profile")
+    def quit_and_remove_profile():
+        try:
+            original_quit()
+        finally:
+            shutil.rmtree(chrome_profile_path, ignore_errors=True)
     
-    # Create chrome profile directory if it doesn't exist
-    if not os.path.exists(chrome_profile_path):
-        os.makedirs(chrome_profile_path)
-        logger.info(f"Created chrome profile directory: {chrome_profile_path}")
+    driver.quit = quit_and_remove_profile
+
+def setup_driver(profile_name="chrome_profile", blocking_preset="linkedin"):
+    """Setup and return Chrome WebDriver with appropriate options
+    
+    Args:
+        profile_name (str): Chrome profile directory under the project root
+                            when persistent profiles are enabled (each
+                            concurrent browser needs its own); ephemeral
+                            profiles use it as their temp directory prefix.
+        blocking_preset (str): tools.resource_blocking preset for the pages this
+                               driver will visit, or None to load everything
+    """
+    options = webdriver.ChromeOptions()
+    
+    ephemeral = use_ephemeral_profile()
+    if ephemeral:
+        # Slim throw-away profile, removed again when the driver quits
+        chrome_profile_path = tempfile.mkdtemp(prefix=f"linkedinos_{profile_name}_")
+    else:
+        # Get absolute path for chrome profile
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        chrome_profile_path = os.path.join(project_root, profile_name)
+        
+        # Create chrome profile directory if it doesn't exist
+        if not os.path.exists(chrome_profile_path):
+            os.makedirs(chrome_profile_path)
+            logger.info(f"Created chrome profile directory: {chrome_profile_path}")
     
     logger.info(f"Using chrome profile path: {chrome_profile_path}")
     
@@ -30,6 +66,10 @@ def setup_driver():
     options.add_argument("--disable-extensions-file-access-check")
     options.add_argument("--disable-extensions-http-throttling")
     
+    # Return from driver.get once the DOM is parsed; profile_readiness waits
+    # for the elements we actually use instead of every image and tracker
+    options.page_load_strategy = "eager"
+    
     # Recommended options for stability
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -38,13 +78,21 @@ def setup_driver():
     try:
         # Simple approach - let Selenium handle ChromeDriver automatically
         driver = webdriver.Chrome(options=options)
+        if ephemeral:
+            _remove_profile_on_quit(driver, chrome_profile_path)
         
         # Execute script to hide automation indicators
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Skip images, fonts, video and trackers - we only read the DOM
+        if blocking_preset:
+            enable_resource_blocking(driver, blocking_preset)
+        
         logger.info("WebDriver setup completed successfully")
         return driver
         
     except Exception as e:
         logger.error(f"Error setting up WebDriver: {e}")
+        if ephemeral:
+            shutil.rmtree(chrome_profile_path, ignore_errors=True)
         raise
\ No newline at end of file
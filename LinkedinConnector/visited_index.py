@@ -0,0 +1,175 @@
+import os
+import time
+import sqlite3
+import threading
+import logging
+from tools.linkedin_url import canonicalize_linkedin_url, is_linkedin_profile_url
+from tools.records_io import iter_records, record_file_suffix, strip_record_suffix
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../GetCompanies/Scraper_Data/linkedin_visited.sqlite3"
+)
+
+# Outcomes that settle a profile for good; anything else (e.g. 'Failed to connect') is retried
+TERMINAL_STATUSES = {
+    "Connection Sent",
+    "Already Connected",
+    "Pending state",
+    "Email wanted",
+    "Doesn't want to connect",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS visited (
+    canonical_url TEXT PRIMARY KEY,
+    connection_status TEXT NOT NULL,
+    batch_file TEXT,
+    serial_number INTEGER,
+    visited_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS redirects (
+    source_url TEXT PRIMARY KEY,
+    target_url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backfilled_files (
+    batch_file TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+"""
+
+def is_batch_file(file_name):
+    """True for scraped YC batch files ('YC_S25_scraped.jsonl' and its other formats)"""
+    return (file_name.startswith("YC_") and bool(record_file_suffix(file_name))
+            and strip_record_suffix(file_name).endswith("_scraped"))
+
+class VisitedIndex:
+    """
+    Profiles visited across every YC batch file, keyed by canonical URL
+
+    A founder listed in several YC_*_scraped files (or under several URL
+    variants) is visited once: the whole index is held in dicts so the check
+    before each driver.get is O(1), and every new outcome or learned redirect
+    (vanity URL -> final profile URL) is written through to SQLite.
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        self.db_path = os.path.abspath(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._statuses = dict(self._conn.execute("SELECT canonical_url, connection_status FROM visited"))
+        self._redirects = dict(self._conn.execute("SELECT source_url, target_url FROM redirects"))
+        logger.info(f"Visited-profile index loaded: {len(self._statuses)} profiles, {len(self._redirects)} redirects")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def resolve(self, url):
+        """Canonical URL for `url`, following any redirect learned earlier"""
+        canonical = canonicalize_linkedin_url(url)
+        return self._redirects.get(canonical, canonical)
+
+    def get_status(self, url):
+        """Last recorded outcome for the profile, or None if it was never visited"""
+        return self._statuses.get(self.resolve(url))
+
+    def get_terminal_status(self, url):
+        """The recorded outcome if it means the profile must not be visited again"""
+        status = self.get_status(url)
+        return status if status in TERMINAL_STATUSES else None
+
+    def learn_redirect(self, requested_url, final_url):
+        """Remember that `requested_url` lands on `final_url` (e.g. a vanity URL that moved)"""
+        if not is_linkedin_profile_url(requested_url) or not is_linkedin_profile_url(final_url):
+            return  # Auth walls, checkpoints and error pages are not redirect targets
+        source = canonicalize_linkedin_url(requested_url)
+        target = canonicalize_linkedin_url(final_url)
+        if source == target or self._redirects.get(source) == target:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO redirects (source_url, target_url) VALUES (?, ?) "
+                "ON CONFLICT(source_url) DO UPDATE SET target_url = excluded.target_url",
+                (source, target)
+            )
+            self._redirects[source] = target
+
+    def backfill_from_batch_files(self, folder):
+        """
+        Seed the index with the final outcomes already stored in batch files
+
+        Founders processed before the index existed only have their
+        connection_status in a YC_*_scraped file; without this they would be
+        visited again from other batches. A file is read again only when it
+        changed, and outcomes the index already holds are kept.
+
+        Returns:
+            int: Number of profiles added
+        """
+        added = 0
+        for file_name in sorted(os.listdir(folder)):
+            if not is_batch_file(file_name):
+                continue
+            path = os.path.join(folder, file_name)
+            stat = os.stat(path)
+            signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT signature FROM backfilled_files WHERE batch_file = ?", (file_name,)
+                ).fetchone()
+            if row and row[0] == signature:
+                continue
+
+            rows = []
+            try:
+                for record in iter_records(path):
+                    status = record.get('connection_status')
+                    canonical = self.resolve(record.get('founder_linkedin_url') or '')
+                    if status in TERMINAL_STATUSES and canonical and canonical not in self._statuses:
+                        rows.append((canonical, status, file_name, record.get('serial_number'), time.time()))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read {file_name} for the visited index: {e}")
+                continue
+
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO visited (canonical_url, connection_status, batch_file, serial_number, visited_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT(canonical_url) DO NOTHING",
+                    rows
+                )
+                self._conn.execute(
+                    "INSERT INTO backfilled_files (batch_file, signature) VALUES (?, ?) "
+                    "ON CONFLICT(batch_file) DO UPDATE SET signature = excluded.signature",
+                    (file_name, signature)
+                )
+                for canonical, status, *_ in rows:
+                    self._statuses.setdefault(canonical, status)
+            added += len(rows)
+
+        if added:
+            logger.info(f"Visited-profile index: added {added} profiles handled in existing batch files")
+        return added
+
+    def record(self, url, connection_status, batch_file=None, serial_number=None):
+        """Store the outcome for a profile under its canonical URL"""
+        canonical = self.resolve(url)
+        if not canonical:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO visited (canonical_url, connection_status, batch_file, serial_number, visited_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(canonical_url) DO UPDATE SET connection_status = excluded.connection_status, "
+                "batch_file = excluded.batch_file, serial_number = excluded.serial_number, "
+                "visited_at = excluded.visited_at",
+                (canonical, connection_status, batch_file, serial_number, time.time())
+            )
+            self._statuses[canonical] = connection_status
@@ -0,0 +1,156 @@
+import os
+import time
+import queue
+import logging
+import threading
+from LinkedinConnector.setup_driver import setup_driver
+from LinkedinConnector.login_to_linkedin import login_to_linkedin
+from LinkedinConnector.time_delay import variable_delay_between_actions
+from LinkedinConnector.campaign import visit_profile, ConnectionBudget, SessionExpiredError
+
+logger = logging.getLogger(__name__)
+
+def get_worker_count():
+    """Number of browser workers from LINKEDIN_WORKERS (default 1 = serial mode)"""
+    try:
+        return max(1, int(os.getenv("LINKEDIN_WORKERS", "1")))
+    except ValueError:
+        logger.warning("LINKEDIN_WORKERS is not a number - using a single browser")
+        return 1
+
+def load_worker_accounts(worker_count):
+    """
+    Credentials for each worker
+
+    Worker 1 uses LINKEDIN_EMAIL / LINKEDIN_PASSWORD, worker N uses
+    LINKEDIN_EMAIL_N / LINKEDIN_PASSWORD_N when set. Workers without their
+    own credentials share the primary account (and its rate budget).
+    'profile_name' is the Chrome profile directory used with
+    LINKEDINOS_CHROME_PROFILE=persistent; ephemeral profiles (the default)
+    are separate per browser anyway and only carry it in their name.
+
+    Returns:
+        list: One dict per worker with 'email', 'password' and 'profile_name'
+    """
+    primary = (os.getenv("LINKEDIN_EMAIL"), os.getenv("LINKEDIN_PASSWORD"))
+    accounts = []
+    for worker_number in range(1, worker_count + 1):
+        email = os.getenv(f"LINKEDIN_EMAIL_{worker_number}")
+        password = os.getenv(f"LINKEDIN_PASSWORD_{worker_number}")
+        if worker_number == 1 or not (email and password):
+            email, password = primary
+        accounts.append({
+            'email': email,
+            'password': password,
+            'profile_name': "chrome_profile" if worker_number == 1 else f"chrome_profile_worker_{worker_number}"
+        })
+    return accounts
+
+def _account_budgets(accounts):
+    """One connection budget per distinct account, shared by the workers that use it"""
+    budgets = {}
+    for account in accounts:
+        if account['email'] not in budgets:
+            budgets[account['email']] = ConnectionBudget()
+    return budgets
+
+class ConnectorWorker(threading.Thread):
+    """One browser with its own Chrome profile, pulling records from the shared queue"""
+
+    def __init__(self, worker_number, account, work_queue, outcomes, budget, stop_event):
+        super().__init__(name=f"connector-worker-{worker_number}", daemon=True)
+        self.worker_number = worker_number
+        self.account = account
+        self.work_queue = work_queue
+        self.outcomes = outcomes
+        self.budget = budget
+        self.stop_event = stop_event
+        self.processed = 0
+
+    def run(self):
+        try:
+            driver = setup_driver(self.account['profile_name'])
+        except Exception as e:
+            logger.error(f"[worker {self.worker_number}] Could not start a browser: {e}")
+            return
+
+        try:
+            if not login_to_linkedin(driver, self.account['email'], self.account['password']):
+                logger.critical(f"[worker {self.worker_number}] Failed to login to LinkedIn")
+                return
+            self._work(driver)
+        finally:
+            driver.quit()
+            logger.info(f"[worker {self.worker_number}] Finished after {self.processed} profiles")
+
+    def _work(self, driver):
+        while not self.stop_event.is_set():
+            try:
+                record = self.work_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                if self.outcomes.skip_if_known(record):
+                    continue
+
+                if not self.budget.reserve(self.stop_event):
+                    return  # Left unprocessed, picked up by the next run
+
+                founder_linkedin_url = record.get("founder_linkedin_url", "").strip()
+                logger.info(f"[worker {self.worker_number}] Serial {record.get('serial_number', 'N/A')}: {founder_linkedin_url}")
+                status = None
+                try:
+                    status = visit_profile(driver, record, self.outcomes)
+                    if status is None:
+                        continue
+                    self.outcomes.record(record, status)
+                    self.processed += 1
+
+                    delays = variable_delay_between_actions()
+                    time.sleep(delays['page_load']())
+                except SessionExpiredError as e:
+                    # This worker's login is gone; its record stays unprocessed for the next run
+                    logger.critical(f"[worker {self.worker_number}] {e} - stopping this worker")
+                    return
+                except Exception as e:
+                    logger.error(f"[worker {self.worker_number}] Error processing {founder_linkedin_url}: {e}")
+                    self.outcomes.record(record, "Failed to connect")
+                    time.sleep(20)
+                finally:
+                    self.budget.settle(status)
+            finally:
+                self.work_queue.task_done()
+
+def run_worker_pool(records_to_process, outcomes, accounts):
+    """
+    Process records with one browser per account entry
+
+    Records are handed out from a shared queue, so a slow profile only holds
+    up its own worker. Ctrl+C stops every worker after its current profile.
+    """
+    work_queue = queue.Queue()
+    for record in records_to_process:
+        work_queue.put(record)
+
+    budgets = _account_budgets(accounts)
+    stop_event = threading.Event()
+    workers = [
+        ConnectorWorker(worker_number, account, work_queue, outcomes, budgets[account['email']], stop_event)
+        for worker_number, account in enumerate(accounts, 1)
+    ]
+
+    logger.info(f"Starting {len(workers)} browser workers for {len(records_to_process)} profiles "
+                f"({len(budgets)} distinct accounts)")
+    for worker in workers:
+        worker.start()
+
+    try:
+        while any(worker.is_alive() for worker in workers):
+            for worker in workers:
+                worker.join(timeout=0.5)
+    except KeyboardInterrupt:
+        logger.warning("Script stopped by user - waiting for workers to finish their current profile")
+        stop_event.set()
+        for worker in workers:
+            worker.join()
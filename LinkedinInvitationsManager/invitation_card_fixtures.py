@@ -0,0 +1,107 @@
+"""
+Synthetic received-invitation cards with the values an extractor should find.
+
+The cards follow the markup of the received-invitations page (hashed class
+names, nested spans, optional badge/"follows you"/mutual lines) and vary
+deterministically with the index, so a corpus is reproducible:
+
+    from LinkedinInvitationsManager.invitation_card_fixtures import build_card_corpus
+    cards = build_card_corpus(1200)   # [(card_html, expected_dict), ...]
+"""
+
+FIRST_NAMES = ["Ada", "Grace", "Linus", "Sean", "Zoë", "Ren", "Priya", "Mateo", "Aisha", "Kai"]
+LAST_NAMES = ["Lovelace", "Hopper", "O'Brien", "D'Souza", "Müller", "Nakamura", "Okafor", "García"]
+
+HEADLINES = [
+    "Founder at Co {i}",
+    "Software Engineer at Dayforce",      # Contains "day" but is not a date
+    "CEO | Building the future of payments",
+    "Talent Acquisition Partner",
+    "Product Manager - Weekend projects in AI",
+    "",                                   # No headline line at all
+]
+
+MUTUAL_LINES = [
+    "",
+    "{n} mutual connections",
+    "{other} and {n} other mutual connections",
+    "{other} is a mutual connection",
+]
+
+TIME_LINES = ["Today", "Yesterday", "{n} hours ago", "{n} days ago", "{n} weeks ago", "{n} months ago"]
+
+def _name(index):
+    return f"{FIRST_NAMES[index % len(FIRST_NAMES)]} {LAST_NAMES[(index // 3) % len(LAST_NAMES)]}"
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+def build_invitation_card(index):
+    """
+    One pending-invitation card
+
+    Returns:
+        tuple: (card HTML, dict of the fields extract_invitation_details should return)
+    """
+    name = _name(index)
+    slug = f"person-{index}"
+    headline = HEADLINES[index % len(HEADLINES)].format(i=index)
+    n = index % 17 + 2
+
+    mutual_template = MUTUAL_LINES[index % len(MUTUAL_LINES)]
+    mutual = mutual_template.format(n=n, other=_name(index + 1))
+    time_sent = TIME_LINES[index % len(TIME_LINES)].format(n=index % 5 + 2)
+    is_verified = index % 4 == 0
+    follows_you = index % 5 == 0
+    # Every 7th card has the name only in the photo's aria-label
+    name_in_strong = index % 7 != 3
+
+    expected = {
+        'name': name,
+        'headline': headline,
+        'profile_url': f"https://www.linkedin.com/in/{slug}/",
+        'mutual_connections': mutual,
+        'time_sent': time_sent,
+        'profile_image_url': f"https://media.licdn.com/dms/image/{slug}.jpg",
+        'is_verified': is_verified,
+        'follows_you': follows_you,
+        'component_key': f"urn:li:invitation:{7000000 + index}"
+    }
+
+    parts = [
+        f'<div data-view-name="pending-invitation" componentkey="{expected["component_key"]}" class="_1b8a3e4c">',
+        f'<a href="{expected["profile_url"]}" aria-label="{_escape(name)}\'s profile picture" class="_6c2d1f0a">',
+        f'<figure class="_0d1e4b7f"><img src="{expected["profile_image_url"]}" alt=""></figure></a>',
+        '<div class="_9f1c2a3b"><div class="_4e7d0c11">',
+        f'<a href="{expected["profile_url"]}" class="_6c2d1f0a">',
+    ]
+    if name_in_strong:
+        parts.append(f'<p class="_10bda8b2 _1a2b3c4d"><strong>{_escape(name)}</strong></p>')
+    if is_verified:
+        parts.append('<svg id="verified-small" aria-hidden="true"><use href="#verified-small"></use></svg>')
+    parts.append('</a>')
+    if headline:
+        parts.append(f'<p class="_10bda8b2 _7abcc18e _4ab35ee0">{_escape(headline)}</p>')
+    if mutual:
+        # Counts are often wrapped in their own span
+        parts.append(f'<p class="_10bda8b2 _390230a6 _4ab35ee0"><span class="_2f4e6a8c">'
+                     f'{_escape(mutual.split(" mutual")[0])}</span> mutual{_escape(mutual.split(" mutual", 1)[1])}</p>')
+    if follows_you:
+        parts.append(f'<div class="_7c9e1b2d"><span>{_escape(name.split()[0])}</span> <span>follows you</span></div>')
+    parts.append(f'<p class="_10bda8b2 _390230a6 _4ab35ee0">{_escape(time_sent)}</p>')
+    parts.append('</div><div class="_3a5c7e9f">')
+    parts.append(f'<button aria-label="Ignore an invitation to connect from {_escape(name)}">Ignore</button>')
+    parts.append(f'<button aria-label="Accept {_escape(name)}\'s invitation">Accept</button>')
+    parts.append('</div></div></div>')
+
+    return "".join(parts), expected
+
+def build_card_corpus(count=1200):
+    """`count` cards as [(card HTML, expected fields), ...]"""
+    return [build_invitation_card(index) for index in range(count)]
+
+def build_corpus_page(corpus):
+    """Wrap corpus cards in a received-invitations page (with sidebar noise)"""
+    cards = "".join(html for html, _ in corpus)
+    sidebar = "".join(f"<div class='ad'><img src='/ad/{i}.png'><p>Promoted {i}</p></div>" for i in range(200))
+    return f"<html><body><main><section>{cards}</section></main><aside>{sidebar}</aside></body></html>"
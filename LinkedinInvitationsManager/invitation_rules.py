@@ -0,0 +1,122 @@
+import os
+import re
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_RULES_PATH = os.path.join(PROJECT_ROOT, "invitation_rules.json")
+EXAMPLE_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "invitation_rules.example.json")
+
+ACTIONS = ("accept", "ignore", "skip")
+
+# Conditions a rule's "when" block may use; every one given must hold
+CONDITIONS = (
+    "min_mutual", "max_mutual", "verified", "follows_you",
+    "headline_any", "headline_none", "min_age_days", "max_age_days"
+)
+
+MUTUAL_PATTERN = re.compile(r"(\d[\d,]*)\s+(?:other\s+)?mutual connection", re.IGNORECASE)
+AGE_PATTERN = re.compile(r"(\d+)\s*(minute|hour|day|week|month|year)s?\b", re.IGNORECASE)
+AGE_UNIT_DAYS = {'minute': 0, 'hour': 0, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+class RuleError(ValueError):
+    """The rules file is malformed"""
+
+def parse_mutual_count(text):
+    """
+    Number of mutual connections from the card text
+
+    '12 mutual connections' -> 12, 'Jane Doe and 3 other mutual connections' -> 4,
+    'Jane Doe is a mutual connection' -> 1, '' -> 0
+    """
+    if not text:
+        return 0
+    match = MUTUAL_PATTERN.search(text)
+    if match:
+        count = int(match.group(1).replace(',', ''))
+        return count + 1 if 'other' in text.lower() else count
+    return 1 if 'mutual connection' in text.lower() else 0
+
+def parse_age_days(text):
+    """Age of an invitation in days from 'Today', 'Yesterday', '3 weeks ago', ... (None if unknown)"""
+    if not text:
+        return None
+    lowered = text.lower()
+    if 'today' in lowered:
+        return 0
+    if 'yesterday' in lowered:
+        return 1
+    match = AGE_PATTERN.search(lowered)
+    if not match:
+        return None
+    return int(match.group(1)) * AGE_UNIT_DAYS[match.group(2).lower()]
+
+def validate_rules(rules):
+    if not isinstance(rules, list):
+        raise RuleError("Rules must be a JSON list")
+    for index, rule in enumerate(rules, 1):
+        if rule.get('action') not in ACTIONS:
+            raise RuleError(f"Rule {index}: action must be one of {', '.join(ACTIONS)}")
+        unknown = set(rule.get('when', {})) - set(CONDITIONS)
+        if unknown:
+            raise RuleError(f"Rule {index}: unknown conditions {', '.join(sorted(unknown))}")
+    return rules
+
+def load_rules(path=None):
+    """
+    Read the rule list (INVITATION_RULES_FILE, else ./invitation_rules.json)
+
+    Returns:
+        list: Validated rules, or None if the file does not exist
+    """
+    path = path or os.getenv("INVITATION_RULES_FILE", DEFAULT_RULES_PATH)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            rules = json.load(f)
+        except json.JSONDecodeError as e:
+            raise RuleError(f"{path} is not valid JSON: {e}")
+    return validate_rules(rules)
+
+def rule_matches(when, invitation):
+    """True if every condition in `when` holds for the invitation"""
+    mutual = parse_mutual_count(invitation.get('mutual_connections', ''))
+    headline = (invitation.get('headline') or '').lower()
+
+    if 'min_mutual' in when and mutual < when['min_mutual']:
+        return False
+    if 'max_mutual' in when and mutual > when['max_mutual']:
+        return False
+    if 'verified' in when and bool(invitation.get('is_verified')) != when['verified']:
+        return False
+    if 'follows_you' in when and bool(invitation.get('follows_you')) != when['follows_you']:
+        return False
+    if 'headline_any' in when and not any(word.lower() in headline for word in when['headline_any']):
+        return False
+    if 'headline_none' in when and any(word.lower() in headline for word in when['headline_none']):
+        return False
+
+    if 'min_age_days' in when or 'max_age_days' in when:
+        age = parse_age_days(invitation.get('time_sent', ''))
+        if age is None:
+            return False
+        if 'min_age_days' in when and age < when['min_age_days']:
+            return False
+        if 'max_age_days' in when and age > when['max_age_days']:
+            return False
+    return True
+
+def decide(rules, invitation):
+    """
+    First matching rule wins
+
+    Returns:
+        tuple: (action, rule number) - ('skip', None) if no rule matched
+    """
+    for index, rule in enumerate(rules, 1):
+        if rule_matches(rule.get('when', {}), invitation):
+            return rule['action'], index
+    return 'skip', None
@@ -0,0 +1,160 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+import logging
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from tools.linkedin_url import canonicalize_linkedin_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join(project_root, "GetCompanies/Scraper_Data/linkedin_invitations.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS invitations (
+    component_key TEXT PRIMARY KEY,
+    profile_url TEXT,
+    name TEXT,
+    details TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    decision TEXT,
+    decided_at REAL,
+    missing_since REAL
+);
+CREATE INDEX IF NOT EXISTS invitations_by_profile ON invitations (profile_url);
+"""
+
+class InvitationStore:
+    """
+    Received invitations seen so far, keyed by componentkey and profile URL
+
+    Records when each invitation was first seen and what was decided
+    ('accepted', 'ignored', 'skipped'). Seeing a card does not consume it:
+    an invitation stays new until a decision is recorded. Undecided
+    invitations a complete scroll no longer showed (withdrawn, or handled on
+    LinkedIn directly) are marked missing so an incremental sync does not wait
+    for them. Keys are held in dicts so the check made for every rendered card
+    is O(1); writes go through to SQLite.
+    """
+
+    def __init__(self, db_path=DEFAULT_STORE_PATH):
+        self.db_path = os.path.abspath(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(invitations)")}
+        if 'missing_since' not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE invitations ADD COLUMN missing_since REAL")
+
+        self._decisions = {}  # component_key -> decision (None while undecided)
+        self._profiles = {}   # canonical profile URL -> component_key
+        self._missing = set()  # undecided component_keys no longer on the page
+        for component_key, profile_url, decision, missing_since in self._conn.execute(
+                "SELECT component_key, profile_url, decision, missing_since FROM invitations"):
+            self._decisions[component_key] = decision
+            if profile_url:
+                self._profiles[profile_url] = component_key
+            if missing_since is not None:
+                self._missing.add(component_key)
+        logger.info(f"Invitation store loaded: {len(self._decisions)} invitations seen before")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _key_for(self, component_key='', profile_url=''):
+        """
+        The stored componentkey for an invitation
+
+        A re-sent invitation gets a new componentkey and counts as new; the
+        profile URL is only used for cards rendered without a componentkey.
+        """
+        if component_key:
+            return component_key if component_key in self._decisions else None
+        return self._profiles.get(canonicalize_linkedin_url(profile_url)) if profile_url else None
+
+    def is_known(self, component_key='', profile_url=''):
+        """True if this invitation (by componentkey or sender profile) was seen before"""
+        return self._key_for(component_key, profile_url) is not None
+
+    def is_decided(self, component_key='', profile_url=''):
+        """True if a decision was recorded for this invitation"""
+        key = self._key_for(component_key, profile_url)
+        return key is not None and self._decisions.get(key) is not None
+
+    def pending_keys(self):
+        """componentkeys of invitations seen but not decided on (and not missing)"""
+        return {key for key, decision in self._decisions.items() if decision is None and key not in self._missing}
+
+    def update_missing(self, rendered_keys, complete):
+        """
+        Track which undecided invitations are still on the page
+
+        Args:
+            rendered_keys (set): componentkeys rendered in this scroll
+            complete (bool): The scroll reached the end of the list, so pending
+                             invitations that were not rendered are gone
+        """
+        found = self._missing & rendered_keys
+        lost = self.pending_keys() - rendered_keys if complete else set()
+        if not found and not lost:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE invitations SET missing_since = NULL WHERE component_key = ?",
+                [(key,) for key in found]
+            )
+            self._conn.executemany(
+                "UPDATE invitations SET missing_since = ? WHERE component_key = ?",
+                [(time.time(), key) for key in lost]
+            )
+        self._missing = (self._missing - found) | lost
+
+    def get_decision(self, invitation):
+        key = self._key_for(invitation.get('component_key', ''), invitation.get('profile_url', ''))
+        return self._decisions.get(key) if key else None
+
+    def record_seen(self, invitations):
+        """Store invitations not seen before; returns how many were new"""
+        now = time.time()
+        rows = []
+        for invitation in invitations:
+            component_key = invitation.get('component_key', '')
+            if not component_key or self.is_known(component_key, invitation.get('profile_url', '')):
+                continue
+            profile_url = canonicalize_linkedin_url(invitation.get('profile_url', ''))
+            rows.append((component_key, profile_url, invitation.get('name', ''), json.dumps(invitation), now))
+            self._decisions[component_key] = None
+            if profile_url:
+                self._profiles[profile_url] = component_key
+
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO invitations (component_key, profile_url, name, details, first_seen) "
+                    "VALUES (?, ?, ?, ?, ?)", rows
+                )
+        return len(rows)
+
+    def record_decision(self, invitation, decision):
+        """Remember what was done with an invitation (stores it first if it is new)"""
+        self.record_seen([invitation])
+        key = self._key_for(invitation.get('component_key', ''), invitation.get('profile_url', ''))
+        if key is None:
+            return
+        self._decisions[key] = decision
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE invitations SET decision = ?, decided_at = ? WHERE component_key = ?",
+                (decision, time.time(), key)
+            )
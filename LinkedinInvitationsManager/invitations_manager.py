@@ -5,19 +5,18 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from dotenv import load_dotenv
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from LinkedinConnector.setup_driver import setup_driver
-from LinkedinConnector.login_to_linkedin import login_to_linkedin
 from tools.info_logger import log_info, log_warning, log_error
 from tools.blank_logger import log_blank_line
 from tools.get_user_choice import get_user_choice
+from tools.rate_limiter import TokenBucket
+from LinkedinInvitationsManager.invitation_rules import decide
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +53,75 @@ def display_invitation_details(invitation, index, total):
     
     log_blank_line()
 
-def accept_invitation(driver, invitation):
+def xpath_literal(text):
+    """Quote text for an XPath expression (names like O'Brien need concat())"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+def find_invitation_button(driver, invitation, action, session=None, refresh=False):
+    """
+    The Accept/Ignore button for an invitation
+    
+    Resolved inside the invitation's own card through the session's
+    componentkey index. The page-wide search by name is only used for
+    invitations without a componentkey or without a session, since
+    duplicate names could otherwise hit another card.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        invitation (dict): Invitation data containing component_key
+        action (str): 'Accept' or 'Ignore'
+        session (InvitationsSession): Session whose page the invitation is on
+        refresh (bool): Look the card up again instead of using cached elements
+        
+    Returns:
+        The button WebElement, or None if it was not found
+    """
+    if session is not None and invitation.get('component_key'):
+        return session.button_for(invitation, action, refresh=refresh)
+    
+    name = invitation.get('name', '')
+    if not name:
+        return None
+    button_xpath = f"//button[starts-with(@aria-label, '{action}') and contains(@aria-label, {xpath_literal(name)})]"
+    try:
+        return WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.XPATH, button_xpath)))
+    except TimeoutException:
+        return None
+
+def click_invitation_button(driver, invitation, action, session=None, pause=True):
+    """
+    Scroll to and click an invitation's Accept/Ignore button
+    
+    Returns:
+        bool: True if the button was clicked
+    """
+    for refresh in (False, True):
+        button = find_invitation_button(driver, invitation, action, session, refresh)
+        if button is None:
+            return False
+        try:
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+            if pause:
+                time.sleep(1)
+            driver.execute_script("arguments[0].click();", button)
+            return True
+        except StaleElementReferenceException:
+            continue  # The card was re-rendered; resolve it again by componentkey
+    return False
+
+def accept_invitation(driver, invitation, session=None, pause=True):
     """
     Accept a LinkedIn invitation
     
     Args:
         driver: Selenium WebDriver instance
         invitation (dict): Invitation data containing component_key
+        session (InvitationsSession): Session the invitation was scraped in, if any
+        pause (bool): Sleep around the click; bulk mode paces with its rate limiter instead
         
     Returns:
         bool: True if successful, False otherwise
@@ -71,111 +132,65 @@ def accept_invitation(driver, invitation):
             log_error("No component key found for this invitation")
             return False
         
-        # Find the Accept button using aria-label and component key
-        accept_button_xpath = f"//button[@componentkey and contains(@aria-label, 'Accept') and contains(@aria-label, '{invitation.get('name', '')}')]"
-        
-        # Alternative: Find by button text
-        if not component_key:
-            accept_button_xpath = "//button[.//span[text()='Accept']]"
-        
-        try:
-            accept_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, accept_button_xpath))
-            )
-            
-            # Scroll to button and click
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", accept_button)
-            time.sleep(1)
-            driver.execute_script("arguments[0].click();", accept_button)
-            
-            log_info(f"✅ Accepted invitation from {invitation.get('name', 'Unknown')}")
-            time.sleep(2)  # Wait for action to complete
-            return True
-            
-        except TimeoutException:
+        if not click_invitation_button(driver, invitation, 'Accept', session, pause):
             log_error(f"Could not find Accept button for {invitation.get('name', 'Unknown')}")
             return False
+        
+        log_info(f"✅ Accepted invitation from {invitation.get('name', 'Unknown')}")
+        if pause:
+            time.sleep(2)  # Wait for action to complete
+        return True
             
     except Exception as e:
         log_error(f"Error accepting invitation: {e}")
         return False
 
-def ignore_invitation(driver, invitation):
+def ignore_invitation(driver, invitation, session=None, pause=True):
     """
     Ignore a LinkedIn invitation
     
     Args:
         driver: Selenium WebDriver instance
         invitation (dict): Invitation data containing component_key
+        session (InvitationsSession): Session the invitation was scraped in, if any
+        pause (bool): Sleep around the click; bulk mode paces with its rate limiter instead
         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        component_key = invitation.get('component_key', '')
-        
-        # Find the Ignore button using aria-label and component key
-        ignore_button_xpath = f"//button[@componentkey and contains(@aria-label, 'Ignore') and contains(@aria-label, '{invitation.get('name', '')}')]"
-        
-        # Alternative: Find by button text
-        if not component_key:
-            ignore_button_xpath = "//button[.//span[text()='Ignore']]"
-        
-        try:
-            ignore_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, ignore_button_xpath))
-            )
-            
-            # Scroll to button and click
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ignore_button)
-            time.sleep(1)
-            driver.execute_script("arguments[0].click();", ignore_button)
-            
-            log_info(f"❌ Ignored invitation from {invitation.get('name', 'Unknown')}")
-            time.sleep(2)  # Wait for action to complete
-            return True
-            
-        except TimeoutException:
+        if not click_invitation_button(driver, invitation, 'Ignore', session, pause):
             log_error(f"Could not find Ignore button for {invitation.get('name', 'Unknown')}")
             return False
+        
+        log_info(f"❌ Ignored invitation from {invitation.get('name', 'Unknown')}")
+        if pause:
+            time.sleep(2)  # Wait for action to complete
+        return True
             
     except Exception as e:
         log_error(f"Error ignoring invitation: {e}")
         return False
 
-def manage_invitations_interactive(invitations):
+def manage_invitations_interactive(invitations, session):
     """
     Interactively manage LinkedIn invitations one by one
     
     Args:
         invitations (list): List of invitation data dictionaries
+        session (InvitationsSession): The session the invitations were scraped
+                                      in; its page and cards are reused
     """
     if not invitations:
         log_warning("No invitations to manage")
         return
     
-    load_dotenv()
-    
-    linkedin_email = os.getenv("LINKEDIN_EMAIL")
-    linkedin_password = os.getenv("LINKEDIN_PASSWORD")
-    
-    if not linkedin_email or not linkedin_password:
-        log_error("LinkedIn credentials not found in .env file")
+    driver = session.driver
+    if driver is None or not session.open_invitations_page():
+        log_error("Invitations page is not available in this session")
         return
     
-    driver = setup_driver()
-    
     try:
-        # Login to LinkedIn
-        if not login_to_linkedin(driver, linkedin_email, linkedin_password):
-            log_error("Failed to login to LinkedIn")
-            return
-        
-        # Navigate to invitations page
-        invitations_url = "https://www.linkedin.com/mynetwork/invitation-manager/received/"
-        driver.get(invitations_url)
-        time.sleep(5)  # Wait for page to load
-        
         log_info(f"🎯 Starting interactive management of {len(invitations)} invitations")
         log_blank_line()
         
@@ -199,14 +214,18 @@ def manage_invitations_interactive(invitations):
             
             if choice == "1":
                 # Accept invitation
-                if accept_invitation(driver, invitation):
+                if accept_invitation(driver, invitation, session):
+                    session.forget(invitation)
+                    session.record_decision(invitation, 'accepted')
                     accepted_count += 1
                 else:
                     log_warning("Failed to accept invitation")
                     
             elif choice == "2":
                 # Ignore invitation
-                if ignore_invitation(driver, invitation):
+                if ignore_invitation(driver, invitation, session):
+                    session.forget(invitation)
+                    session.record_decision(invitation, 'ignored')
                     ignored_count += 1
                 else:
                     log_warning("Failed to ignore invitation")
@@ -214,6 +233,7 @@ def manage_invitations_interactive(invitations):
             elif choice == "3":
                 # Skip
                 log_info(f"⏭️ Skipped invitation from {invitation.get('name', 'Unknown')}")
+                session.record_decision(invitation, 'skipped')
                 skipped_count += 1
                 
             elif choice == "4":
@@ -243,28 +263,98 @@ def manage_invitations_interactive(invitations):
         logger.exception("Full error details:")
         
     finally:
-        driver.quit()
-        log_info("Browser closed")
         log_blank_line()
 
-def batch_accept_all_invitations(invitations):
+def get_actions_per_minute():
+    """Bulk click pace from INVITATIONS_ACTIONS_PER_MINUTE (default 20)"""
+    try:
+        return max(1.0, float(os.getenv("INVITATIONS_ACTIONS_PER_MINUTE", "20")))
+    except ValueError:
+        return 20.0
+
+def bulk_process_invitations(session, invitations, rules, dry_run=False, actions_per_minute=None):
+    """
+    Accept/ignore invitations according to declarative rules
+    
+    Args:
+        session (InvitationsSession): Session whose page the invitations are on
+        invitations (iterable): Invitation dicts - a list, or
+                                session.stream_invitations() to act while
+                                the page is still loading more cards
+        rules (list): Rules from invitation_rules.load_rules()
+        dry_run (bool): Only log the decisions
+        actions_per_minute (float): Click pace (default: get_actions_per_minute())
+        
+    Returns:
+        dict: Counts per outcome plus 'seen', 'elapsed' and 'per_minute'
+    """
+    actions_per_minute = actions_per_minute or get_actions_per_minute()
+    limiter = TokenBucket(actions_per_minute / 60, capacity=1)
+    counts = {'seen': 0, 'accepted': 0, 'ignored': 0, 'skipped': 0, 'failed': 0}
+    start = time.monotonic()
+    
+    log_info(f"⚡ Bulk mode: {len(rules)} rules, {actions_per_minute:.0f} actions/minute"
+             f"{' (dry run)' if dry_run else ''}")
+    
+    try:
+        for invitation in invitations:
+            counts['seen'] += 1
+            action, rule_number = decide(rules, invitation)
+            name = invitation.get('name', 'Unknown')
+            
+            if action == 'skip':
+                counts['skipped'] += 1
+                continue
+            outcome = 'accepted' if action == 'accept' else 'ignored'
+            if dry_run:
+                log_info(f"Would {action} {name} (rule {rule_number})")
+                counts[outcome] += 1
+                continue
+            
+            limiter.acquire()
+            act = accept_invitation if action == 'accept' else ignore_invitation
+            if act(session.driver, invitation, session, pause=False):
+                session.forget(invitation)
+                session.record_decision(invitation, outcome)
+                counts[outcome] += 1
+            else:
+                counts['failed'] += 1
+    except KeyboardInterrupt:
+        log_warning(1, "Bulk processing interrupted by user")
+    
+    elapsed = time.monotonic() - start
+    acted = counts['accepted'] + counts['ignored']
+    counts['elapsed'] = elapsed
+    counts['per_minute'] = acted / elapsed * 60 if elapsed else 0.0
+    
+    log_blank_line(2)
+    log_info("🎉 Bulk invitation processing completed!")
+    log_info(f"📊 Summary:")
+    log_info(f"   👀 Seen: {counts['seen']}")
+    log_info(f"   ✅ Accepted: {counts['accepted']}")
+    log_info(f"   ❌ Ignored: {counts['ignored']}")
+    log_info(f"   ⏭️ Skipped (no rule matched): {counts['skipped']}")
+    log_info(f"   ⚠️ Failed: {counts['failed']}")
+    log_info(f"   ⏱️ {elapsed:.1f}s, {counts['per_minute']:.1f} actions/minute, "
+             f"{counts['seen'] / elapsed if elapsed else 0:.1f} invitations/second evaluated")
+    return counts
+
+def batch_accept_all_invitations(invitations, session):
     """
-    Accept all invitations in batch (future enhancement)
+    Accept all invitations in batch
     
     Args:
         invitations (list): List of invitation data dictionaries
+        session (InvitationsSession): Session the invitations were scraped in
     """
-    log_info("🚀 Batch accept functionality - Coming soon!")
-    log_info("This feature will allow you to accept all invitations at once")
-    # TODO: Implement batch acceptance logic
+    return bulk_process_invitations(session, invitations, [{'action': 'accept', 'when': {}}])
 
-def batch_ignore_all_invitations(invitations):
+def batch_ignore_all_invitations(invitations, session):
     """
-    Ignore all invitations in batch (future enhancement)
+    Ignore all invitations in batch
     
     Args:
         invitations (list): List of invitation data dictionaries
+        session (InvitationsSession): Session the invitations were scraped in
     """
-    log_info("🚀 Batch ignore functionality - Coming soon!")
-    log_info("This feature will allow you to ignore all invitations at once")
-    # TODO: Implement batch ignore logic
\ No newline at end of file
+    return bulk_process_invitations(session, invitations, [{'action': 'ignore', 'when': {}}])
@@ -1,26 +1,29 @@
 import time
 import os
+import re
 import sys
 import logging
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from LinkedinConnector.setup_driver import setup_driver
-from LinkedinConnector.login_to_linkedin import login_to_linkedin
-from tools.info_logger import log_info, log_warning, log_error
-from tools.blank_logger import log_blank_line
+from tools.info_logger import log_info, log_warning
+from tools.html_parser import is_text_node
 
 logger = logging.getLogger(__name__)
 
+# What a line of card text is; anything else in a <p> is headline material
+CARD_TEXT_PATTERN = re.compile(
+    r"(?P<follows>\bfollows you\b)"
+    r"|(?P<mutual>\bmutual connection)"
+    r"|(?P<time>^(?:today|yesterday)$|\b\d+\s*(?:minute|hour|day|week|month|year)s?\s+ago\b)",
+    re.IGNORECASE
+)
+BLOCK_TAGS = ('p', 'strong')
+
 def scroll_to_load_all_invitations(driver, max_scrolls=20):
     """
     Scroll down the invitations page to load all pending invitations
@@ -81,10 +84,22 @@ def scroll_to_load_all_invitations(driver, max_scrolls=20):
     
     return True
 
+def _text_owner(text_node, card):
+    """The nearest <p>/<strong> holding a text node, else its parent element"""
+    element = text_node.parent
+    while element is not card and element.name not in BLOCK_TAGS:
+        element = element.parent
+    return text_node.parent if element is card else element
+
 def extract_invitation_details(invitation_element):
     """
     Extract details from a single invitation element
     
+    Walks the card once: tags give the profile link, name, image and
+    verified badge, text is grouped per paragraph and each paragraph is
+    classified with CARD_TEXT_PATTERN. The first paragraph that is not a
+    mutual-connections, time or "follows you" line is the headline.
+    
     Args:
         invitation_element: BeautifulSoup element containing invitation data
         
@@ -107,73 +122,62 @@ def extract_invitation_details(invitation_element):
         # Extract component key for actions
         invitation_data['component_key'] = invitation_element.get('componentkey', '')
         
-        # Extract name and profile URL
-        profile_link = invitation_element.find('a', href=True)
-        if profile_link:
-            invitation_data['profile_url'] = profile_link.get('href', '')
-            # Name is usually in a strong tag within the profile link area
-            name_element = invitation_element.find('strong')
-            if name_element:
-                invitation_data['name'] = name_element.get_text(strip=True)
-        
-        # Extract headline (usually in a p tag with specific classes)
-        headline_selectors = [
-            'p._10bda8b2._7abcc18e._4ab35ee0',  # Based on the HTML structure
-            'p[class*="_7abcc18e"]',
-            'p[class*="_4ab35ee0"]'
-        ]
-        
-        for selector in headline_selectors:
-            headline_element = invitation_element.select_one(selector)
-            if headline_element and headline_element.get_text(strip=True):
-                # Skip if it contains "mutual connections" or time indicators
-                text = headline_element.get_text(strip=True)
-                if ('mutual connection' not in text.lower() and 
-                    'today' not in text.lower() and 
-                    'yesterday' not in text.lower() and 
-                    'hour' not in text.lower() and
-                    'day' not in text.lower()):
-                    invitation_data['headline'] = text
-                    break
-        
-        # Extract mutual connections info
-        mutual_conn_element = invitation_element.find('p', string=lambda text: text and 'mutual connection' in text.lower())
-        if mutual_conn_element:
-            invitation_data['mutual_connections'] = mutual_conn_element.get_text(strip=True)
-        
-        # Extract time sent
-        time_selectors = [
-            'p._10bda8b2._390230a6._4ab35ee0',  # Time paragraph
-            lambda tag: tag.name == 'p' and any(word in tag.get_text().lower() 
-                                               for word in ['today', 'yesterday', 'hour', 'day', 'week'])
-        ]
-        
-        for selector in time_selectors:
-            if callable(selector):
-                time_element = invitation_element.find(selector)
-            else:
-                time_element = invitation_element.select_one(selector)
+        profile_link = None
+        name_element = None
+        img_element = None
+        blocks = {}  # id(owner) -> (owner, [text parts]), in document order
+        
+        for node in invitation_element.descendants:
+            tag_name = node.name
+            if tag_name is None:
+                if not is_text_node(node):
+                    continue
+                text = node.strip()
+                if text:
+                    owner = _text_owner(node, invitation_element)
+                    block = blocks.get(id(owner))
+                    if block is None:
+                        blocks[id(owner)] = (owner, [text])
+                    else:
+                        block[1].append(text)
+            elif tag_name == 'a':
+                if profile_link is None and node.get('href'):
+                    profile_link = node
+            elif tag_name == 'strong':
+                if name_element is None:
+                    name_element = node
+            elif tag_name == 'img':
+                if img_element is None:
+                    img_element = node
+            elif tag_name == 'svg':
+                if node.get('id') == 'verified-small':
+                    invitation_data['is_verified'] = True
+        
+        for owner, parts in blocks.values():
+            text = ' '.join(parts)
+            if owner is name_element:
+                if profile_link is not None:
+                    invitation_data['name'] = text
+                continue
             
-            if time_element:
-                time_text = time_element.get_text(strip=True)
-                # Verify it's actually a time indicator
-                if any(word in time_text.lower() for word in ['today', 'yesterday', 'hour', 'day', 'week']):
-                    invitation_data['time_sent'] = time_text
-                    break
-        
-        # Extract profile image URL
-        img_element = invitation_element.find('img')
-        if img_element:
+            match = CARD_TEXT_PATTERN.search(text)
+            kind = match.lastgroup if match else None
+            if kind == 'follows':
+                invitation_data['follows_you'] = True
+            elif kind == 'mutual':
+                if not invitation_data['mutual_connections']:
+                    invitation_data['mutual_connections'] = text
+            elif kind == 'time':
+                if not invitation_data['time_sent']:
+                    invitation_data['time_sent'] = text
+            elif owner.name == 'p' and not invitation_data['headline']:
+                invitation_data['headline'] = text
+        
+        if profile_link is not None:
+            invitation_data['profile_url'] = profile_link.get('href', '')
+        if img_element is not None:
             invitation_data['profile_image_url'] = img_element.get('src', '')
         
-        # Check for verification badge
-        verified_svg = invitation_element.find('svg', {'id': 'verified-small'})
-        invitation_data['is_verified'] = verified_svg is not None
-        
-        # Check if they follow you (from aria-label or text content)
-        main_text = invitation_element.get_text()
-        invitation_data['follows_you'] = 'follows you' in main_text.lower()
-        
         # Clean up name if it wasn't found in strong tag
         if not invitation_data['name'] and profile_link:
             # Try to extract from aria-label
@@ -187,84 +191,3 @@ def extract_invitation_details(invitation_element):
         logger.warning(f"Error extracting invitation details: {e}")
     
     return invitation_data
-
-def scrape_received_invitations():
-    """
-    Main function to scrape all received LinkedIn invitations
-    
-    Returns:
-        list: List of invitation data dictionaries
-    """
-    load_dotenv()
-    
-    linkedin_email = os.getenv("LINKEDIN_EMAIL")
-    linkedin_password = os.getenv("LINKEDIN_PASSWORD")
-    
-    if not linkedin_email or not linkedin_password:
-        log_error("LinkedIn credentials not found in .env file")
-        log_info("Please ensure LINKEDIN_EMAIL and LINKEDIN_PASSWORD are set")
-        return []
-    
-    driver = setup_driver()
-    invitations = []
-    
-    try:
-        # Login to LinkedIn
-        if not login_to_linkedin(driver, linkedin_email, linkedin_password):
-            log_error("Failed to login to LinkedIn")
-            return []
-        
-        log_info("Successfully logged in to LinkedIn")
-        log_blank_line()
-        
-        # Navigate to invitations page
-        invitations_url = "https://www.linkedin.com/mynetwork/invitation-manager/received/"
-        log_info(f"Navigating to: {invitations_url}")
-        driver.get(invitations_url)
-        
-        # Wait for page to load
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-view-name='pending-invitation']"))
-            )
-            log_info("Invitations page loaded successfully")
-        except TimeoutException:
-            log_warning("No pending invitations found or page didn't load properly")
-            return []
-        
-        # Scroll to load all invitations
-        scroll_to_load_all_invitations(driver)
-        
-        # Get page source and parse with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Find all invitation elements
-        invitation_elements = soup.find_all('div', {'data-view-name': 'pending-invitation'})
-        
-        log_info(f"Found {len(invitation_elements)} invitation elements to process")
-        log_blank_line()
-        
-        # Extract details from each invitation
-        for i, element in enumerate(invitation_elements, 1):
-            log_info(f"Processing invitation {i}/{len(invitation_elements)}")
-            
-            invitation_data = extract_invitation_details(element)
-            
-            if invitation_data['name']:  # Only add if we got at least a name
-                invitations.append(invitation_data)
-                log_info(f"✅ Extracted: {invitation_data['name']}")
-            else:
-                log_warning(f"⚠️ Failed to extract name from invitation {i}")
-        
-        log_blank_line()
-        log_info(f"Successfully extracted {len(invitations)} complete invitations")
-        
-    except Exception as e:
-        log_error(f"Error during scraping: {e}")
-        logger.exception("Full error details:")
-        
-    finally:
-        driver.quit()
-        log_info("Browser closed")
-    
-    return invitations
\ No newline at end of file
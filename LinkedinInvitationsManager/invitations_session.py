@@ -0,0 +1,385 @@
+import os
+import sys
+import time
+import logging
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from dotenv import load_dotenv
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from LinkedinConnector.setup_driver import setup_driver
+from LinkedinConnector.login_to_linkedin import login_to_linkedin
+from LinkedinInvitationsManager.invitations_scraper import scroll_to_load_all_invitations, extract_invitation_details
+from LinkedinInvitationsManager.invitation_store import InvitationStore
+from tools.info_logger import log_info, log_warning, log_error
+from tools.blank_logger import log_blank_line
+from tools.html_parser import make_soup, strainer
+
+logger = logging.getLogger(__name__)
+
+INVITATIONS_URL = "https://www.linkedin.com/mynetwork/invitation-manager/received/"
+INVITATION_CARD_SELECTOR = "[data-view-name='pending-invitation']"
+
+# Accept/Ignore buttons of one card, matched on the start of their aria-label
+# (or text) so names never have to be put into a selector
+CARD_BUTTONS_JS = """
+function cardButtons(card) {
+    const found = {Accept: null, Ignore: null};
+    for (const button of card.querySelectorAll('button')) {
+        const label = (button.getAttribute('aria-label') || button.textContent || '').trim();
+        for (const action of ['Accept', 'Ignore']) {
+            if (!found[action] && label.startsWith(action)) found[action] = button;
+        }
+    }
+    return found;
+}
+"""
+
+# Cards rendered since the last call, marked so each one is returned only once.
+# Only keys and buttons come back; the markup of a card is fetched once it is known to be undecided.
+TAKE_NEW_CARDS_JS = CARD_BUTTONS_JS + """
+const fresh = [];
+for (const card of document.querySelectorAll("[data-view-name='pending-invitation']:not([data-linkedinos-seen])")) {
+    card.setAttribute('data-linkedinos-seen', '1');
+    const link = card.querySelector('a[href]');
+    fresh.push({key: card.getAttribute('componentkey') || '', href: link ? link.href : '', card: card, buttons: cardButtons(card)});
+}
+return fresh;
+"""
+
+INDEX_CARDS_JS = CARD_BUTTONS_JS + """
+return Array.from(document.querySelectorAll("[data-view-name='pending-invitation']"), card => (
+    {key: card.getAttribute('componentkey') || '', card: card, buttons: cardButtons(card)}
+));
+"""
+
+# The key is passed as an argument and compared, never spliced into a selector
+FIND_CARD_JS = CARD_BUTTONS_JS + """
+for (const card of document.querySelectorAll("[data-view-name='pending-invitation']")) {
+    if (card.getAttribute('componentkey') === arguments[0]) return {card: card, buttons: cardButtons(card)};
+}
+return null;
+"""
+
+CARD_MARKUP_JS = """
+return arguments[0].map(card => card.outerHTML);
+"""
+
+COUNT_NEW_CARDS_JS = """
+return document.querySelectorAll("[data-view-name='pending-invitation']:not([data-linkedinos-seen])").length;
+"""
+
+class InvitationsSession:
+    """
+    One browser session for the whole invitations workflow
+
+    Starts (or borrows) the driver, logs in and loads the received-invitations
+    page once. Scraping keeps live WebElements for each card and its
+    Accept/Ignore buttons, keyed by componentkey, so accept/ignore act on
+    the page that is already open without searching it again.
+
+    Use as a context manager; a borrowed driver is left open on exit.
+    The store, if given, is the caller's to close.
+    """
+
+    def __init__(self, driver=None, store=None):
+        self.driver = driver
+        self.store = store  # Optional InvitationStore: seen-set and decisions
+        self.owns_driver = driver is None
+        self.page_loaded = False
+        self.cards = {}  # component_key -> {'card', 'Accept', 'Ignore'} live WebElements
+        self.rendered_keys = set()  # componentkeys rendered during the current stream
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """
+        Start and log in the browser if this session owns it
+
+        Returns:
+            bool: True if the session is ready to load the invitations page
+        """
+        if not self.owns_driver:
+            return True
+
+        load_dotenv()
+        linkedin_email = os.getenv("LINKEDIN_EMAIL")
+        linkedin_password = os.getenv("LINKEDIN_PASSWORD")
+        if not linkedin_email or not linkedin_password:
+            log_error("LinkedIn credentials not found in .env file")
+            log_info("Please ensure LINKEDIN_EMAIL and LINKEDIN_PASSWORD are set")
+            return False
+
+        self.driver = setup_driver(blocking_preset="linkedin")
+        if not login_to_linkedin(self.driver, linkedin_email, linkedin_password):
+            log_error("Failed to login to LinkedIn")
+            self.close()
+            return False
+
+        log_info("Successfully logged in to LinkedIn")
+        log_blank_line()
+        return True
+
+    def close(self):
+        if self.owns_driver and self.driver is not None:
+            self.driver.quit()
+            log_info("Browser closed")
+        self.driver = None
+        self.cards = {}
+        self.page_loaded = False
+
+    def open_invitations_page(self):
+        """
+        Navigate to the received invitations (once per session)
+
+        Returns:
+            bool: True if at least one invitation card is on the page
+        """
+        if self.page_loaded:
+            return True
+        if self.driver is None:
+            return False
+
+        log_info(f"Navigating to: {INVITATIONS_URL}")
+        self.driver.get(INVITATIONS_URL)
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, INVITATION_CARD_SELECTOR))
+            )
+            log_info("Invitations page loaded successfully")
+        except TimeoutException:
+            log_warning("No pending invitations found or page didn't load properly")
+            return False
+
+        self.page_loaded = True
+        return True
+
+    def _remember_card(self, component_key, entry):
+        self.cards[component_key] = {'card': entry['card'], **entry['buttons']}
+        return self.cards[component_key]
+
+    def index_cards(self):
+        """Map componentkey -> live card and buttons for everything rendered (one script call)"""
+        self.cards = {}
+        for entry in self.driver.execute_script(INDEX_CARDS_JS):
+            if entry['key']:
+                self._remember_card(entry['key'], entry)
+        return self.cards
+
+    def scrape(self):
+        """
+        Load every pending invitation and extract its details
+
+        Returns:
+            list: List of invitation data dictionaries
+        """
+        invitations = []
+        if not self.open_invitations_page():
+            return invitations
+
+        try:
+            # Scroll to load all invitations
+            scroll_to_load_all_invitations(self.driver)
+
+            # Parse only the invitation cards out of the page source
+            soup = make_soup(self.driver.page_source, parse_only=strainer('div', {'data-view-name': 'pending-invitation'}))
+            invitation_elements = soup.find_all('div', {'data-view-name': 'pending-invitation'})
+
+            log_info(f"Found {len(invitation_elements)} invitation elements to process")
+            log_blank_line()
+
+            for i, element in enumerate(invitation_elements, 1):
+                log_info(f"Processing invitation {i}/{len(invitation_elements)}")
+
+                invitation_data = extract_invitation_details(element)
+
+                if invitation_data['name']:  # Only add if we got at least a name
+                    invitations.append(invitation_data)
+                    log_info(f"✅ Extracted: {invitation_data['name']}")
+                else:
+                    log_warning(f"⚠️ Failed to extract name from invitation {i}")
+
+            # Keep the live cards so actions do not have to search the page again
+            self.index_cards()
+            if self.store is not None:
+                self.store.record_seen(invitations)
+
+            log_blank_line()
+            log_info(f"Successfully extracted {len(invitations)} complete invitations")
+
+        except Exception as e:
+            log_error(f"Error during scraping: {e}")
+            logger.exception("Full error details:")
+
+        return invitations
+
+    def take_new_invitations(self, incremental=False):
+        """
+        Parse the cards rendered since the last call
+
+        In incremental mode, cards with a recorded decision (skipped in an
+        earlier review) are stepped over without parsing. Cards seen before
+        but never decided on are returned again.
+
+        Returns:
+            tuple: (undecided invitations, True if a card seen in an earlier
+                    sync was reached)
+        """
+        entries = self.driver.execute_script(TAKE_NEW_CARDS_JS)
+        reached_known = False
+        undecided = []
+        for entry in entries:
+            if entry['key']:
+                self._remember_card(entry['key'], entry)
+                self.rendered_keys.add(entry['key'])
+            if incremental and self.store is not None:
+                if self.store.is_known(entry['key'], entry['href']):
+                    reached_known = True
+                if self.store.is_decided(entry['key'], entry['href']):
+                    continue
+            undecided.append(entry)
+
+        parsed = []
+        if undecided:
+            # One round trip for the markup of every undecided card
+            markup = self.driver.execute_script(CARD_MARKUP_JS, [entry['card'] for entry in undecided])
+            for html in markup:
+                element = make_soup(html).find('div', {'data-view-name': 'pending-invitation'})
+                if element is None:
+                    continue
+                invitation = extract_invitation_details(element)
+                if invitation['name']:
+                    parsed.append(invitation)
+            if self.store is not None:
+                self.store.record_seen(parsed)
+        return parsed, reached_known
+
+    def wait_for_new_cards(self, timeout=3, poll_interval=0.25):
+        """True as soon as unseen cards render after a scroll, False after `timeout`"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.driver.execute_script(COUNT_NEW_CARDS_JS):
+                return True
+            time.sleep(poll_interval)
+        return False
+
+    def stream_invitations(self, max_scrolls=50, idle_rounds=2, incremental=False):
+        """
+        Yield invitations as LinkedIn renders them while scrolling
+
+        Callers can act on each invitation before the next page of cards
+        has loaded, instead of waiting for the whole list. `incremental`
+        (needs a store) only yields invitations without a decision. LinkedIn
+        lists invitations newest first, so it stops scrolling once it is past
+        the new arrivals (a card seen in an earlier sync was reached) and
+        every invitation still waiting for a decision has been rendered.
+        """
+        if not self.open_invitations_page():
+            return
+
+        self.rendered_keys = set()
+        incremental = incremental and self.store is not None
+        reached_known = False
+        quiet_rounds = 0
+        for _ in range(max_scrolls + 1):
+            fresh, reached = self.take_new_invitations(incremental)
+            yield from fresh
+            reached_known = reached_known or reached
+            if incremental and reached_known and self.store.pending_keys() <= self.rendered_keys:
+                log_info("Every invitation waiting for a decision is loaded - stopping")
+                self.store.update_missing(self.rendered_keys, complete=False)
+                return
+
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            if self.wait_for_new_cards():
+                quiet_rounds = 0
+            else:
+                quiet_rounds += 1
+                if quiet_rounds >= idle_rounds:
+                    if incremental:
+                        self.store.update_missing(self.rendered_keys, complete=True)
+                    return
+
+    def sync(self):
+        """
+        Fetch only the invitations nothing was decided for yet
+
+        Syncing records what it saw but consumes nothing: an invitation is
+        returned again until it is accepted, ignored or skipped.
+
+        Returns:
+            list: Undecided invitation data dictionaries, newest first
+        """
+        invitations = list(self.stream_invitations(incremental=True))
+        log_info(f"Found {len(invitations)} undecided invitations")
+        return invitations
+
+    def button_for(self, invitation, action, refresh=False):
+        """
+        The Accept/Ignore button inside an invitation's own card
+
+        Served from the index built while scraping. With `refresh` (after a
+        stale element) or for a card not indexed yet, the card is looked up
+        again by componentkey in one script call.
+
+        Args:
+            invitation (dict): Invitation data containing component_key
+            action (str): 'Accept' or 'Ignore'
+            refresh (bool): Ignore the cached elements
+
+        Returns:
+            The button WebElement, or None if the card is not on the page
+        """
+        component_key = invitation.get('component_key', '')
+        if not component_key or self.driver is None:
+            return None
+
+        entry = None if refresh else self.cards.get(component_key)
+        if entry is None:
+            found = self.driver.execute_script(FIND_CARD_JS, component_key)
+            if not found:
+                self.cards.pop(component_key, None)
+                return None
+            entry = self._remember_card(component_key, found)
+        return entry.get(action)
+
+    def record_decision(self, invitation, decision):
+        """Remember what was done with an invitation ('accepted', 'ignored', 'skipped')"""
+        if self.store is not None:
+            self.store.record_decision(invitation, decision)
+
+    def forget(self, invitation):
+        """Drop a card's elements once it has been acted on (LinkedIn removes it from the page)"""
+        self.cards.pop(invitation.get('component_key', ''), None)
+
+def scrape_received_invitations(driver=None, incremental=True):
+    """
+    Scrape received LinkedIn invitations in a session of their own
+
+    Args:
+        driver: An already logged-in WebDriver to reuse (left open afterwards);
+                a new browser is started and closed if None
+        incremental (bool): Return only invitations not decided on yet,
+                            scrolling no further than needed; False
+                            scrapes the whole list
+
+    Returns:
+        list: List of invitation data dictionaries
+    """
+    store = InvitationStore()
+    try:
+        with InvitationsSession(driver, store=store) as session:
+            return session.sync() if incremental else session.scrape()
+    finally:
+        store.close()
@@ -4,8 +4,10 @@ import sys
 from tools.blank_logger import log_blank_line
 from tools.get_user_choice import get_user_choice
 from tools.info_logger import log_info, log_warning, log_error
-from invitations_scraper import scrape_received_invitations
-from invitations_manager import manage_invitations_interactive
+from invitations_session import InvitationsSession
+from invitations_manager import manage_invitations_interactive, bulk_process_invitations
+from invitation_rules import load_rules, RuleError, EXAMPLE_RULES_PATH
+from invitation_store import InvitationStore
 
 # Add the project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -20,37 +22,85 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def main():
-    log_info(1, "=== LinkedIn Invitations Manager ===", 1)
+def run_bulk(dry_run):
+    """Apply the rules file to invitations as they load"""
+    try:
+        rules = load_rules()
+    except RuleError as e:
+        log_error(f"Invalid rules file: {e}")
+        return
+    if rules is None:
+        log_warning("No rules file found (set INVITATION_RULES_FILE or create invitation_rules.json)")
+        log_info(f"Start from the example: {EXAMPLE_RULES_PATH}")
+        return
     
+    # A dry run changes nothing, so it does not touch the store either
+    store = None if dry_run else InvitationStore()
+    try:
+        with InvitationsSession(store=store) as session:
+            bulk_process_invitations(session, session.stream_invitations(), rules, dry_run=dry_run)
+    finally:
+        if store is not None:
+            store.close()
+
+def run_interactive(new_only):
+    store = InvitationStore()
     try:
-        # Step 1: Scrape received invitations
+        # One browser session from scraping to the last accept/ignore
+        with InvitationsSession(store=store) as session:
+            review_invitations(session, new_only)
+    finally:
+        store.close()
+
+def review_invitations(session, new_only):
+    # Step 1: Scrape received invitations
+    if new_only:
+        log_info("Fetching connection invitations not reviewed yet...")
+        invitations = session.sync()
+    else:
         log_info("Fetching your received connection invitations...")
-        invitations = scrape_received_invitations()
-        
-        if not invitations:
-            log_warning("No pending invitations found or failed to fetch invitations.")
-            log_info("This could mean:")
-            log_info("• You have no pending connection requests")
-            log_info("• LinkedIn login failed")
-            log_info("• Page structure has changed")
+        invitations = session.scrape()
+    
+    if not invitations:
+        if new_only:
+            log_info("No invitations waiting for a decision")
             return
-        
-        # Step 2: Show summary
-        log_blank_line()
-        log_info(f"📨 Found {len(invitations)} pending connection requests!")
-        log_blank_line()
-        
-        # Step 3: Ask if user wants to review them
-        log_info("Would you like to review each invitation individually?")
-        log_info("1. Yes, review each invitation")
-        log_info("2. No, go back to main menu")
-        
-        choice = get_user_choice(2)
-        
+        log_warning("No pending invitations found or failed to fetch invitations.")
+        log_info("This could mean:")
+        log_info("• You have no pending connection requests")
+        log_info("• LinkedIn login failed")
+        log_info("• Page structure has changed")
+        return
+    
+    # Step 2: Show summary
+    log_blank_line()
+    log_info(f"📨 Found {len(invitations)} pending connection requests!")
+    log_blank_line()
+    
+    # Step 3: Interactive management on the page that is already open
+    manage_invitations_interactive(invitations, session)
+
+def main():
+    log_info(1, "=== LinkedIn Invitations Manager ===", 1)
+    
+    log_info("How would you like to handle your invitations?")
+    log_info("1. Review new invitations (not accepted, ignored or skipped yet)")
+    log_info("2. Review all pending invitations")
+    log_info("3. Apply rules automatically (bulk)")
+    log_info("4. Dry run rules (show decisions only)")
+    log_info("5. Go back to main menu")
+    
+    choice = get_user_choice(5)
+    
+    try:
         if choice == "1":
-            # Step 4: Interactive management
-            manage_invitations_interactive(invitations)
+            run_interactive(new_only=True)
+        elif choice == "2":
+            run_interactive(new_only=False)
+        elif choice == "3":
+            run_bulk(dry_run=False)
+        elif choice == "4":
+            run_bulk(dry_run=True)
         else:
             log_info("Returning to main menu...")
             
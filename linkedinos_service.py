@@ -0,0 +1,271 @@
+"""
+LinkedinOS service: one long-lived process with a warm, logged-in browser.
+
+    python linkedinos_service.py start                  # run the service (foreground)
+    python linkedinos_service.py status
+    python linkedinos_service.py connect YC_S25_scraped 10
+    python linkedinos_service.py sync-invitations       # new since the last sync (--full: all)
+    python linkedinos_service.py stop
+
+While the service runs, the main menu hands the YC scraper and the LinkedIn
+connector to it instead of starting a new interpreter, Chrome and login for
+every action. Jobs run one at a time because they share one browser.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import importlib.util
+import socketserver
+import threading
+from dotenv import load_dotenv
+
+from tools.info_logger import log_info, log_warning, log_error
+from tools.service_client import get_socket_path, call_service, service_available, ServiceError
+from tools.records_io import find_record_file, strip_record_suffix
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+YC_SCRAPER_DIR = os.path.join(PROJECT_ROOT, "GetCompanies/Scraper_Scripts/YCombinator_Scraper")
+SCRAPER_DATA_DIR = os.path.join(PROJECT_ROOT, "GetCompanies/Scraper_Data")
+
+logger = logging.getLogger(__name__)
+
+def load_yc_scraper():
+    """Import the YC scraper's main module (its modules use script-style imports)"""
+    if YC_SCRAPER_DIR not in sys.path:
+        sys.path.insert(0, YC_SCRAPER_DIR)
+    spec = importlib.util.spec_from_file_location("yc_scraper_main", os.path.join(YC_SCRAPER_DIR, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def resolve_batch_file(name):
+    """Accept a path or a batch stem like 'YC_S25_scraped' and return the batch file path"""
+    if os.path.exists(name):
+        return os.path.abspath(name)
+    path = find_record_file(SCRAPER_DATA_DIR, strip_record_suffix(os.path.basename(name)))
+    if path is None:
+        raise ValueError(f"No batch file found for '{name}' in {SCRAPER_DATA_DIR}")
+    return path
+
+class StreamLogHandler(logging.Handler):
+    """
+    Sends each log record of the running job to the client as a JSON line
+
+    Sits on the root logger so records from threads the job starts (e.g. the
+    scraper's fetch pool) are streamed too; records from the server thread and
+    from other client connections (`connection_threads`) are not.
+    """
+
+    def __init__(self, send, connection_threads):
+        super().__init__(level=logging.INFO)
+        self.send = send
+        self.job_thread = threading.get_ident()
+        self.connection_threads = connection_threads
+        self.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s", datefmt="%H:%M:%S"))
+
+    def filter(self, record):
+        if record.thread == self.job_thread:
+            return super().filter(record)
+        if record.thread == threading.main_thread().ident or record.thread in self.connection_threads:
+            return False
+        return super().filter(record)
+
+    def emit(self, record):
+        try:
+            self.send({'log': self.format(record)})
+        except OSError:
+            pass  # Client went away; the job keeps running
+
+class LinkedinOSService:
+    """Owns the warm browser and the already-imported job modules"""
+
+    def __init__(self):
+        load_dotenv()
+        self.started_at = time.time()
+        self.jobs_run = 0
+        self.driver = None
+        self.job_lock = threading.Lock()
+        self.connection_threads = set()  # Threads currently serving a client
+        self.shutdown_requested = threading.Event()
+
+        # Pay for the heavy imports once, at startup
+        from LinkedinConnector import process_profiles
+        from LinkedinConnector.founder_store import FounderStore
+        from LinkedinInvitationsManager import invitations_session
+        self.process_profiles = process_profiles
+        self.founder_store = FounderStore
+        self.invitations_session = invitations_session
+        self.yc_scraper = load_yc_scraper()
+
+    def get_driver(self):
+        """The warm browser, started and logged in on first use and after a crash"""
+        if self.driver is not None:
+            try:
+                self.driver.current_url
+                return self.driver
+            except Exception:
+                log_warning("Warm browser is gone - starting a new one")
+                self.close_driver()
+
+        from LinkedinConnector.setup_driver import setup_driver
+        from LinkedinConnector.login_to_linkedin import login_to_linkedin
+        driver = setup_driver()
+        if not login_to_linkedin(driver, os.getenv("LINKEDIN_EMAIL"), os.getenv("LINKEDIN_PASSWORD")):
+            driver.quit()
+            raise RuntimeError("Failed to login to LinkedIn")
+        self.driver = driver
+        return driver
+
+    def close_driver(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def job_ping(self):
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at),
+            'browser_warm': self.driver is not None,
+            'jobs_run': self.jobs_run
+        }
+
+    def job_scrape_batch(self, selection):
+        return {'file_path': self.yc_scraper.run_scrape(selection)}
+
+    def job_batch_stats(self, batch_file):
+        store = self.founder_store.open_for(resolve_batch_file(batch_file))
+        try:
+            return store.get_stats()
+        finally:
+            store.close()
+
+    def job_connect(self, batch_file, limit):
+        self.process_profiles.process_profiles_with_file(
+            resolve_batch_file(batch_file), limit=int(limit), driver=self.get_driver()
+        )
+        return {'ok': True}
+
+    def job_sync_invitations(self, full=False):
+        invitations = self.invitations_session.scrape_received_invitations(
+            driver=self.get_driver(), incremental=not full
+        )
+        return {'invitations': invitations}
+
+    def job_shutdown(self):
+        self.shutdown_requested.set()
+        return {'ok': True}
+
+    def run_job(self, job, args, send):
+        handler = getattr(self, f"job_{job}", None)
+        if handler is None:
+            raise ValueError(f"Unknown job: {job}")
+        if job == 'ping':
+            return handler()
+
+        with self.job_lock:
+            stream = StreamLogHandler(send, self.connection_threads)
+            root_logger = logging.getLogger()
+            root_logger.addHandler(stream)
+            try:
+                self.jobs_run += 1
+                return handler(**args)
+            finally:
+                root_logger.removeHandler(stream)
+
+class JobRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        send_lock = threading.Lock()
+
+        def send(message):
+            with send_lock:
+                self.wfile.write((json.dumps(message, default=str) + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+        connection_threads = self.server.service.connection_threads
+        connection_threads.add(threading.get_ident())
+        try:
+            request = json.loads(self.rfile.readline())
+            result = self.server.service.run_job(request['job'], request.get('args') or {}, send)
+            send({'result': result})
+        except OSError:
+            return  # Client disconnected
+        except Exception as e:
+            logger.exception("Job failed")
+            try:
+                send({'error': str(e)})
+            except OSError:
+                pass
+        finally:
+            connection_threads.discard(threading.get_ident())
+
+        if self.server.service.shutdown_requested.is_set():
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+class ServiceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def run_service():
+    socket_path = get_socket_path()
+    if service_available():
+        log_warning(f"A LinkedinOS service is already running on {socket_path}")
+        return
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # Stale socket from a crashed service
+
+    log_info("Starting LinkedinOS service (importing modules)...")
+    service = LinkedinOSService()
+    server = ServiceServer(socket_path, JobRequestHandler)
+    server.service = service
+    os.chmod(socket_path, 0o600)
+    log_info(f"LinkedinOS service ready on {socket_path} - press Ctrl+C to stop", 1)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log_warning(1, "Service stopped by user")
+    finally:
+        server.server_close()
+        service.close_driver()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        log_info("LinkedinOS service stopped")
+
+def main(args):
+    command = args[0] if args else "start"
+    if command == "start":
+        run_service()
+        return
+
+    if not service_available():
+        log_error("LinkedinOS service is not running. Start it with: python linkedinos_service.py start")
+        return
+
+    try:
+        if command == "status":
+            log_info(f"Service status: {call_service('ping')}")
+        elif command == "stop":
+            call_service("shutdown")
+            log_info("LinkedinOS service is shutting down")
+        elif command == "connect" and len(args) == 3:
+            call_service("connect", batch_file=args[1], limit=int(args[2]))
+        elif command == "sync-invitations":
+            full = "--full" in args[1:]
+            result = call_service("sync_invitations", full=full)
+            log_info(f"Synced {len(result['invitations'])} {'pending' if full else 'undecided'} invitations")
+        else:
+            log_info(__doc__)
+    except ServiceError as e:
+        log_error(f"Service job failed: {e}")
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    main(sys.argv[1:])
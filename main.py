@@ -5,6 +5,7 @@ import logging
 from tools.blank_logger import log_blank_line
 from tools.get_user_choice import get_user_choice
 from tools.info_logger import log_info, log_error
+from tools.service_client import service_available, call_service, ServiceError
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,9 +13,54 @@ logging.basicConfig(
     datefmt="%H:%M:%S"
 )
 
+def run_linkedin_connector_in_service():
+    # Pick the batch here and let the running service's warm browser do the work
+    from LinkedinConnector.batch_selector import get_linkedin_batch_selection, get_user_input_for_range
+    
+    batch_selection = get_linkedin_batch_selection()
+    if not batch_selection:
+        log_info("Connection campaign cancelled.")
+        return
+    
+    try:
+        stats = call_service("batch_stats", on_log=None, batch_file=batch_selection['file_path'])
+        if not stats['processable']:
+            log_info("No unprocessed records with LinkedIn URLs found.")
+            return
+        limit = get_user_input_for_range(stats['processable'])
+        call_service("connect", batch_file=batch_selection['file_path'], limit=limit)
+    except (OSError, ServiceError) as e:
+        log_error(f"LinkedinConnector failed in the service: {e}")
+
+def run_ycombinator_scraper_in_service():
+    # YC modules use script-style imports, so their folder has to be on the path
+    yc_scraper_dir = os.path.join(os.getcwd(), "GetCompanies/Scraper_Scripts/YCombinator_Scraper")
+    if yc_scraper_dir not in sys.path:
+        sys.path.insert(0, yc_scraper_dir)
+    from dotenv import load_dotenv
+    from batch_selector import get_yc_batch_selection
+    
+    load_dotenv()  # YC_OUTPUT_FORMAT decides the output file name
+    
+    selection = get_yc_batch_selection()
+    if not selection:
+        log_info("Scraping cancelled.")
+        return
+    
+    try:
+        call_service("scrape_batch", selection=selection)
+    except (OSError, ServiceError) as e:
+        log_error(f"YCombinator scraper failed in the service: {e}")
+
 def run_linkedin_connector():
     # Run the LinkedinConnector/main.py script
     log_info("Calling LinkedinConnector")
+    if service_available():
+        log_info("Using the running LinkedinOS service")
+        run_linkedin_connector_in_service()
+        log_blank_line()
+        return
+    
     try:
         # Set PYTHONPATH to include current directory
         env = os.environ.copy()
@@ -29,6 +75,12 @@ def run_linkedin_connector():
 def run_ycombinator_scraper():
     # Run the YCombinator scraper script
     log_info("Calling YCombinator Scraper method")
+    if service_available():
+        log_info("Using the running LinkedinOS service")
+        run_ycombinator_scraper_in_service()
+        log_blank_line()
+        return
+    
     try:
         # Set PYTHONPATH to include current directory and change working directory
         env = os.environ.copy()
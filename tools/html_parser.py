@@ -0,0 +1,61 @@
+import os
+import re
+import logging
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# lxml is the intended backend (see requirements.txt); html.parser is kept
+# as a fallback for environments where it could not be installed
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Blocks that never hold data we extract but can dominate page size.
+# The body is matched as an unrolled loop ([^<]* runs) rather than a lazy .*?
+# so large inline scripts are skipped in one pass.
+NON_CONTENT_PATTERN = re.compile(
+    r'<(script|style|noscript|template)\b[^>]*>[^<]*(?:<(?!/\1)[^<]*)*</\1\s*>',
+    re.IGNORECASE
+)
+
+def available_backends():
+    """BeautifulSoup tree builders that can be used on this machine"""
+    backends = ["html.parser"]
+    if HAS_LXML:
+        backends.insert(0, "lxml")
+    return backends
+
+def get_default_backend():
+    """Pick the parser backend: LINKEDINOS_HTML_PARSER if set, else the fastest installed"""
+    requested = os.getenv("LINKEDINOS_HTML_PARSER")
+    if requested:
+        if requested in available_backends():
+            return requested
+        logger.warning(f"HTML parser '{requested}' is not available, using default")
+    return available_backends()[0]
+
+def make_soup(markup, parse_only=None, backend=None):
+    """
+    Parse markup with the configured backend
+
+    Args:
+        markup: HTML string
+        parse_only: Optional SoupStrainer so only the needed subtrees are built
+        backend: Force a specific backend (defaults to get_default_backend())
+    """
+    return BeautifulSoup(markup, backend or get_default_backend(), parse_only=parse_only)
+
+def strip_non_content(markup):
+    """Drop script/style/noscript/template blocks before parsing"""
+    return NON_CONTENT_PATTERN.sub('', markup)
+
+def strainer(name=None, attrs=None, **kwargs):
+    """Shortcut for SoupStrainer so callers don't import bs4 directly"""
+    return SoupStrainer(name, attrs or {}, **kwargs)
+
+def is_text_node(node):
+    """True for plain text nodes (not comments, doctypes or tags)"""
+    return type(node) is NavigableString
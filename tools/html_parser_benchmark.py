@@ -0,0 +1,118 @@
+"""
+Compare HTML parser backends on fixture pages.
+
+    python -m tools.html_parser_benchmark                 # synthetic fixture pages
+    python -m tools.html_parser_benchmark page1.html ...  # your own saved pages
+
+For every page it times a full parse with each available backend and the
+region-restricted parse its extractor actually uses.
+"""
+import os
+import sys
+import time
+import logging
+
+from tools.html_parser import (
+    available_backends,
+    make_soup,
+    strainer,
+    strip_non_content
+)
+
+logger = logging.getLogger(__name__)
+
+def build_company_page(founders=3):
+    """Synthetic YC company page: big script payloads around a small content area"""
+    founder_blocks = "".join(
+        f'<div class="min-w-0 flex-1"><div class="text-xl font-bold">Founder {i}</div>'
+        f'<a href="https://www.linkedin.com/in/founder-{i}/">LinkedIn</a></div>'
+        for i in range(founders)
+    )
+    script = "<script>" + "var x = {};" * 4000 + "</script>"
+    nav = "".join(f'<a href="/companies/other-{i}">Other {i}</a>' for i in range(300))
+    return (
+        f"<html><head><meta name='description' content='A company'>{script * 5}</head><body>"
+        f"<nav>{nav}</nav><h1>Fixture Co</h1>"
+        f"<div class='prose'><div class='text-xl'>We build fixtures.</div></div>"
+        f"<div>Founded: 2024</div><div>Team Size: 12</div>{founder_blocks}"
+        f"<a href='https://www.linkedin.com/company/fixture-co/'>Company</a>"
+        f"{script * 5}</body></html>"
+    )
+
+def build_listing_page(companies=500):
+    """Synthetic YC directory page with `companies` cards"""
+    cards = "".join(
+        f'<a href="/companies/company-{i}" class="card"><div><span>Company {i}</span>'
+        f'<span>One liner {i}</span><svg><path d="M0 0L10 10"/></svg></div></a>'
+        for i in range(companies)
+    )
+    return f"<html><body><div class='filters'>Showing {companies} of {companies} companies</div>{cards}</body></html>"
+
+def build_invitations_page(cards=200):
+    """Synthetic received-invitations page with `cards` pending invitations"""
+    items = "".join(
+        f'<div data-view-name="pending-invitation" componentkey="key-{i}">'
+        f'<a href="https://www.linkedin.com/in/person-{i}/"><img src="https://img/{i}.jpg"></a>'
+        f'<strong>Person {i}</strong><p class="_10bda8b2 _7abcc18e _4ab35ee0">Founder at Co {i}</p>'
+        f'<p>{i % 20} mutual connections</p><p class="_10bda8b2 _390230a6 _4ab35ee0">{i % 6} days ago</p>'
+        f'<button aria-label="Accept Person {i}">Accept</button></div>'
+        for i in range(cards)
+    )
+    sidebar = "".join(f"<div class='ad'><img src='/ad/{i}.png'><p>Promoted {i}</p></div>" for i in range(400))
+    return f"<html><body><main>{items}</main><aside>{sidebar}</aside></body></html>"
+
+def load_pages(paths):
+    if not paths:
+        return {
+            'yc_company': build_company_page(),
+            'yc_listing': build_listing_page(),
+            'invitations': build_invitations_page()
+        }
+    pages = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+def time_call(func, repeat):
+    """Best-of-`repeat` wall time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def page_strainers(name, markup):
+    """The restricted parses that apply to a page: [(label, SoupStrainer)]"""
+    if name == 'invitations' or "pending-invitation" in markup:
+        return [("invitation cards only", strainer('div', {'data-view-name': 'pending-invitation'}))]
+    if name == 'yc_listing' or (name != 'yc_company' and "/companies/" in markup):
+        return [("company links only", strainer('a', href=True))]
+    return []
+
+def benchmark_page(name, markup, repeat=5):
+    strainers = page_strainers(name, markup)
+    results = []
+    for backend in available_backends():
+        results.append((f"{backend} (full document)",
+                        time_call(lambda: make_soup(markup, backend=backend), repeat)))
+        results.append((f"{backend} (scripts stripped)",
+                        time_call(lambda: make_soup(strip_non_content(markup), backend=backend), repeat)))
+        for label, parse_only in strainers:
+            results.append((f"{backend} ({label})",
+                            time_call(lambda: make_soup(markup, backend=backend, parse_only=parse_only), repeat)))
+
+    logger.info(f"{name} ({len(markup) / 1024:.0f} KB):")
+    baseline = dict(results)["html.parser (full document)"]
+    for label, ms in results:
+        logger.info(f"  {label:<40} {ms:8.2f} ms  ({baseline / ms:5.1f}x)")
+
+def main(paths):
+    logger.info(f"Backends available: {', '.join(available_backends())}")
+    for name, markup in load_pages(paths).items():
+        benchmark_page(name, markup)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(sys.argv[1:])
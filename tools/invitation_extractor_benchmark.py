@@ -0,0 +1,77 @@
+"""
+Measure invitation card extraction speed and accuracy.
+
+    python -m tools.invitation_extractor_benchmark              # 1200 synthetic cards
+    python -m tools.invitation_extractor_benchmark 5000         # bigger corpus
+    python -m tools.invitation_extractor_benchmark page.html    # a saved invitations page
+
+Cards are parsed once, as InvitationsSession does, then
+extract_invitation_details is timed over all of them (best of a few runs)
+and reported as cards/second. For the synthetic corpus every result is
+also checked against the values the card was generated from.
+"""
+import sys
+import time
+import logging
+
+from tools.html_parser import make_soup, strainer
+from LinkedinInvitationsManager.invitations_scraper import extract_invitation_details
+from LinkedinInvitationsManager.invitation_card_fixtures import build_card_corpus, build_corpus_page
+
+logger = logging.getLogger(__name__)
+
+CARD_ATTRS = {'data-view-name': 'pending-invitation'}
+
+def parse_cards(markup):
+    soup = make_soup(markup, parse_only=strainer('div', CARD_ATTRS))
+    return soup.find_all('div', CARD_ATTRS)
+
+def time_extraction(cards, repeat=5):
+    """Best-of-`repeat` seconds to extract every card, and the last results"""
+    best = float('inf')
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [extract_invitation_details(card) for card in cards]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+def check_results(results, expected):
+    """Log the first few mismatches; return how many cards were wrong"""
+    wrong = 0
+    for index, (got, want) in enumerate(zip(results, expected)):
+        diff = {key: (got.get(key), value) for key, value in want.items() if got.get(key) != value}
+        if diff:
+            wrong += 1
+            if wrong <= 5:
+                logger.info(f"  card {index}: {diff}")
+    return wrong
+
+def main(args):
+    expected = None
+    if args and not args[0].isdigit():
+        with open(args[0], 'r', encoding='utf-8') as f:
+            markup = f.read()
+        label = args[0]
+    else:
+        corpus = build_card_corpus(int(args[0]) if args else 1200)
+        markup = build_corpus_page(corpus)
+        expected = [fields for _, fields in corpus]
+        label = "synthetic corpus"
+
+    start = time.perf_counter()
+    cards = parse_cards(markup)
+    parse_seconds = time.perf_counter() - start
+
+    seconds, results = time_extraction(cards)
+    logger.info(f"{label}: {len(cards)} cards")
+    logger.info(f"  parse (cards only)   {parse_seconds * 1000:8.1f} ms")
+    logger.info(f"  extract              {seconds * 1000:8.1f} ms  ({len(cards) / seconds:,.0f} cards/sec)")
+
+    if expected is not None:
+        wrong = check_results(results, expected)
+        logger.info(f"  accuracy             {len(cards) - wrong}/{len(cards)} cards match the fixture")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(sys.argv[1:])
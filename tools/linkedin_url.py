@@ -0,0 +1,49 @@
+import re
+from urllib.parse import urlparse, unquote
+
+# Profile paths LinkedIn serves: /in/<vanity> and the legacy /pub/<name>/<a>/<b>/<c>
+PROFILE_PATH_PATTERN = re.compile(r"^/(?:(in)/([^/]+)|(pub)/([^/]+(?:/[^/]+){3}))", re.IGNORECASE)
+
+# Member-URN slugs (/in/ACoAAB...) are case-sensitive ids, unlike vanity names
+MEMBER_URN_SLUG_PATTERN = re.compile(r"^ACo[A-Za-z0-9_-]{20,}$")
+
+LINKEDIN_DOMAIN = "linkedin.com"
+
+def canonicalize_linkedin_url(url):
+    """
+    Reduce a LinkedIn profile URL to one canonical form
+
+    'http://uk.linkedin.com/in/Jane-Doe/?trk=abc', 'linkedin.com/in/jane-doe'
+    and 'https://www.linkedin.com/in/jane-doe/' all become
+    'https://www.linkedin.com/in/jane-doe'. Locale subdomains, query strings,
+    fragments, trailing slashes, percent-encoding and letter case are dropped,
+    except that member-URN slugs ('/in/ACoAAB...') keep their case.
+
+    Returns:
+        str: The canonical URL, the stripped input if it is not a LinkedIn
+             profile URL, or '' for an empty value
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    parsed = urlparse(url if "://" in url else "https://" + url)
+    host = parsed.netloc.lower().split(":")[0]
+    if host != LINKEDIN_DOMAIN and not host.endswith("." + LINKEDIN_DOMAIN):
+        return url
+
+    match = PROFILE_PATH_PATTERN.match(unquote(parsed.path))
+    if not match:
+        return url
+
+    kind = (match.group(1) or match.group(3)).lower()
+    slug = match.group(2) or match.group(4)
+    if not MEMBER_URN_SLUG_PATTERN.match(slug):
+        slug = slug.lower()
+    return f"https://www.{LINKEDIN_DOMAIN}/{kind}/{slug}"
+
+def is_linkedin_profile_url(url):
+    """True if `url` points at a LinkedIn member profile (/in/ or legacy /pub/)"""
+    return canonicalize_linkedin_url(url).startswith((
+        f"https://www.{LINKEDIN_DOMAIN}/in/", f"https://www.{LINKEDIN_DOMAIN}/pub/"
+    ))
@@ -0,0 +1,75 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    `acquire()` blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if available without waiting. Returns True on success"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def release(self, tokens=1):
+        """Give back tokens that were taken but not used (never above capacity)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def acquire(self, tokens=1):
+        """Block until tokens are available. Returns the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
+
+class HostRateLimiter:
+    """Keeps one token bucket per host so each site gets its own budget"""
+
+    def __init__(self, requests_per_second, burst=None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_second, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """Block until a request to the url's host is allowed"""
+        return self.bucket_for(url).acquire()
@@ -0,0 +1,218 @@
+import io
+import os
+import gzip
+import json
+import zlib
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Batch files can be a JSON array (legacy), JSON Lines, or gzip'd JSON Lines
+RECORD_FILE_SUFFIXES = ('.jsonl.gz', '.jsonl', '.json')
+
+def record_file_suffix(path):
+    """Return the record suffix of a path ('.jsonl.gz', '.jsonl' or '.json'), or ''"""
+    for suffix in RECORD_FILE_SUFFIXES:
+        if path.endswith(suffix):
+            return suffix
+    return ''
+
+def strip_record_suffix(path):
+    suffix = record_file_suffix(path)
+    return path[:-len(suffix)] if suffix else path
+
+def find_record_file(folder, stem):
+    """
+    Find an existing batch file for `stem` (e.g. 'YC_S25_scraped') in any format
+
+    Returns:
+        str: Path of the first match in RECORD_FILE_SUFFIXES order, or None
+    """
+    for suffix in RECORD_FILE_SUFFIXES:
+        path = os.path.join(folder, stem + suffix)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _open_text(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def iter_records(path):
+    """
+    Yield records from a batch file without loading JSONL files fully into memory
+
+    A truncated last line (e.g. from a crash mid-write) is skipped with a warning.
+    """
+    if record_file_suffix(path) == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+        return
+
+    with _open_text(path, 'r') as f:
+        try:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line {line_number} in {path}")
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            logger.warning(f"{path} ends with an incomplete gzip block - partial data loaded")
+
+def load_records(path):
+    return list(iter_records(path))
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def _fsync_directory(folder):
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return  # Not supported on this platform (e.g. Windows)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_records(path, records):
+    """
+    Rewrite a whole batch file in the format implied by its suffix
+
+    The records go to a temp file in the same folder, which is fsync'd and then
+    renamed over `path`, so readers see either the old file or the new one and
+    never a half-written file.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=folder)
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            stream = gzip.GzipFile(fileobj=raw, mode='wb') if path.endswith('.gz') else raw
+            f = io.TextIOWrapper(stream, encoding='utf-8')
+            if record_file_suffix(path) == '.json':
+                json.dump(records, f, indent=2, ensure_ascii=False)
+            else:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            f.detach()
+            if stream is not raw:
+                stream.close()  # Writes the gzip trailer but leaves `raw` open
+            raw.flush()
+            os.fsync(raw.fileno())
+        # mkstemp creates the file as 0600; keep the permissions a plain open() would give
+        os.chmod(temp_path, os.stat(path).st_mode if os.path.exists(path) else 0o666 & ~_current_umask())
+        os.replace(temp_path, path)
+        _fsync_directory(folder)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def _truncate_partial_line(path):
+    """Cut a plain JSONL file back to its last complete line"""
+    with open(path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(64 * 1024, position)
+            f.seek(position - step)
+            chunk = f.read(step)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position == end:
+            return False
+        f.truncate(position)
+        return True
+
+def _gzip_is_complete(path):
+    try:
+        with gzip.open(path, 'rb') as f:
+            while f.read(1024 * 1024):
+                pass
+        return True
+    except (EOFError, gzip.BadGzipFile, zlib.error):
+        return False
+
+def repair_record_file_tail(path):
+    """
+    Make a JSONL / JSONL.gz file safe to append to after a crash
+
+    A plain file is cut back to its last complete line. A gzip file whose
+    last member was cut off is rewritten from the records that can still be
+    read, because a new member appended after a damaged one would be
+    unreadable.
+
+    Returns:
+        bool: True if the file had to be repaired
+    """
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return False
+    if not path.endswith('.gz'):
+        repaired = _truncate_partial_line(path)
+    elif _gzip_is_complete(path):
+        repaired = False
+    else:
+        write_records(path, load_records(path))
+        repaired = True
+    if repaired:
+        logger.warning(f"Repaired the damaged end of {path} before appending")
+    return repaired
+
+class RecordWriter:
+    """
+    Append records to a JSONL (or .jsonl.gz) file as they are produced
+
+    Data is flushed every `flush_every` records so a crash loses at most that
+    many (pass None to only flush when flush() is called); gzip output uses
+    sync flushes so everything written so far stays readable.
+    """
+
+    def __init__(self, path, append=False, flush_every=10):
+        if record_file_suffix(path) not in ('.jsonl', '.jsonl.gz'):
+            raise ValueError(f"RecordWriter needs a .jsonl or .jsonl.gz path, got: {path}")
+        self.path = path
+        self.flush_every = flush_every
+        self.count = 0
+        self._pending = 0
+        if append:
+            repair_record_file_tail(path)
+        self._file = _open_text(path, 'a' if append else 'w')
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.count += 1
+        self._pending += 1
+        if self.flush_every and self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self.path.endswith('.gz'):
+            self._file.flush()
+            self._file.buffer.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
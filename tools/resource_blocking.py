@@ -0,0 +1,136 @@
+import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# We only ever read the DOM, so nothing below changes what the scripts see
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico", "*.bmp"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg"]
+TRACKING_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*sentry.io*",
+]
+LINKEDIN_TRACKING_PATTERNS = [
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/sensorCollect*",
+    "*dms.licdn.com*",
+]
+
+# Blocked URL patterns per target site (Network.setBlockedURLs wildcard syntax)
+BLOCKING_PRESETS = {
+    # Profiles and the invitations page need the same things (DOM and scripts only)
+    'linkedin': (
+        IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKING_PATTERNS + LINKEDIN_TRACKING_PATTERNS
+        + ["*media.licdn.com/dms/image*"]
+    ),
+    # The directory is rendered by its own JS (Algolia), so scripts stay allowed
+    'yc_directory': IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKING_PATTERNS + ["*bookface-images*"],
+}
+
+# Sums what the page fetched, from the Resource Timing buffer (blocked
+# requests never start, so they do not show up here)
+PAGE_TRAFFIC_JS = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+let bytes = 0;
+const byType = {};
+for (const entry of entries) {
+    const size = entry.transferSize || entry.encodedBodySize || 0;
+    bytes += size;
+    const type = entry.initiatorType || 'other';
+    byType[type] = byType[type] || {requests: 0, bytes: 0};
+    byType[type].requests += 1;
+    byType[type].bytes += size;
+}
+return {requests: entries.length, bytes: bytes, by_type: byType};
+"""
+
+def resource_blocking_enabled():
+    """LINKEDINOS_BLOCK_RESOURCES=0 turns blocking off (on by default)"""
+    return os.getenv("LINKEDINOS_BLOCK_RESOURCES", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def enable_resource_blocking(driver, preset, extra_patterns=None):
+    """
+    Block a preset's URL patterns for every page this driver loads
+
+    Uses the Chrome DevTools Protocol, so it only works on Chromium drivers;
+    on anything else blocking is skipped with a warning.
+
+    Args:
+        driver: Selenium Chrome WebDriver
+        preset: Key of BLOCKING_PRESETS
+        extra_patterns: Additional patterns to block
+
+    Returns:
+        list: The patterns now blocked ([] if blocking is off or unsupported)
+    """
+    if not resource_blocking_enabled():
+        logger.info("Resource blocking disabled by LINKEDINOS_BLOCK_RESOURCES")
+        return []
+
+    patterns = list(BLOCKING_PRESETS[preset]) + list(extra_patterns or [])
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logger.warning(f"Could not enable resource blocking ({preset}): {e}")
+        return []
+
+    logger.info(f"Resource blocking enabled: {preset} ({len(patterns)} patterns)")
+    return patterns
+
+def disable_resource_blocking(driver):
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except Exception as e:
+        logger.warning(f"Could not disable resource blocking: {e}")
+
+def measure_page_traffic(driver):
+    """
+    Requests and bytes the current page has fetched so far
+
+    Returns:
+        dict: 'requests', 'bytes' and a per-initiator 'by_type' breakdown,
+              or None if the page could not be measured
+    """
+    try:
+        return driver.execute_script(PAGE_TRAFFIC_JS)
+    except Exception as e:
+        logger.warning(f"Could not measure page traffic: {e}")
+        return None
+
+class PageTrafficStats:
+    """Running totals of measure_page_traffic results for a campaign summary (thread-safe)"""
+
+    def __init__(self):
+        self.pages = 0
+        self.requests = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, traffic):
+        if not traffic:
+            return
+        with self._lock:
+            self.pages += 1
+            self.requests += traffic['requests']
+            self.bytes += traffic['bytes']
+
+    def summary(self):
+        with self._lock:
+            pages, requests, total_bytes = self.pages, self.requests, self.bytes
+        if not pages:
+            return None
+        return {
+            'pages': pages,
+            'requests_per_page': requests / pages,
+            'kb_per_page': total_bytes / pages / 1024
+        }
@@ -0,0 +1,68 @@
+"""
+Measure what a resource-blocking preset saves on real pages.
+
+    python -m tools.resource_blocking_benchmark linkedin https://www.linkedin.com/in/someone/
+    python -m tools.resource_blocking_benchmark yc_directory "https://www.ycombinator.com/companies?batch=Summer%202025"
+
+Every URL is loaded twice in a browser from setup_driver: once with nothing
+blocked and once with the preset. It reports requests, transferred KB and
+load timings for both. That browser uses a throw-away profile by default, so
+LinkedIn pages are measured logged out; set LINKEDINOS_CHROME_PROFILE=persistent
+to use a logged-in ./chrome_profile instead.
+"""
+import sys
+import time
+import logging
+
+from LinkedinConnector.setup_driver import setup_driver
+from tools.resource_blocking import (
+    BLOCKING_PRESETS,
+    disable_resource_blocking,
+    enable_resource_blocking,
+    measure_page_traffic
+)
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return nav ? {dom_ready_ms: nav.domContentLoadedEventEnd, load_ms: nav.loadEventEnd} : null;
+"""
+
+def load_and_measure(driver, url, settle_seconds):
+    driver.get(url)
+    time.sleep(settle_seconds)  # Let late requests land so both runs are comparable
+    traffic = measure_page_traffic(driver) or {'requests': 0, 'bytes': 0}
+    timings = driver.execute_script(TIMINGS_JS) or {'dom_ready_ms': 0, 'load_ms': 0}
+    return {**traffic, **timings}
+
+def benchmark_url(driver, preset, url, settle_seconds=5):
+    disable_resource_blocking(driver)
+    before = load_and_measure(driver, url, settle_seconds)
+    enable_resource_blocking(driver, preset)
+    after = load_and_measure(driver, url, settle_seconds)
+
+    logger.info(url)
+    for label, run in (("unblocked", before), (preset, after)):
+        logger.info(f"  {label:<22} {run['requests']:5d} requests  {run['bytes'] / 1024:9.0f} KB  "
+                    f"DOM ready {run['dom_ready_ms']:7.0f} ms  load {run['load_ms']:7.0f} ms")
+    if before['bytes']:
+        logger.info(f"  saved {before['requests'] - after['requests']} requests, "
+                    f"{(1 - after['bytes'] / before['bytes']) * 100:.0f}% of bytes")
+
+def main(args):
+    if len(args) < 2 or args[0] not in BLOCKING_PRESETS:
+        logger.info(f"Usage: python -m tools.resource_blocking_benchmark "
+                    f"<{'|'.join(BLOCKING_PRESETS)}> url [url ...]")
+        return
+
+    driver = setup_driver(blocking_preset=None)
+    try:
+        for url in args[1:]:
+            benchmark_url(driver, args[0], url)
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+import os
+import json
+import socket
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ServiceError(Exception):
+    """The LinkedinOS service rejected a job or failed while running it"""
+
+def get_socket_path():
+    """Unix socket of the LinkedinOS service (LINKEDINOS_SOCKET overrides the default)"""
+    return os.getenv("LINKEDINOS_SOCKET", os.path.join(PROJECT_ROOT, ".linkedinos.sock"))
+
+def _connect(timeout=None):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    client.connect(get_socket_path())
+    return client
+
+def service_available():
+    """True if a LinkedinOS service is listening (cheap: one connect + ping)"""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(get_socket_path()):
+        return False
+    try:
+        call_service("ping", timeout=2)
+        return True
+    except (OSError, ServiceError):
+        return False
+
+def call_service(job, timeout=None, on_log=print, **args):
+    """
+    Run one job in the LinkedinOS service and wait for it to finish
+
+    The service streams the job's log lines back while it runs; each one is
+    passed to `on_log`. The protocol is newline-delimited JSON: one request
+    line, then any number of {"log": ...} lines and a final {"result": ...}
+    or {"error": ...} line.
+
+    Returns:
+        The job's result value
+
+    Raises:
+        ServiceError: If the job failed or the service closed the connection
+        OSError: If the service is not reachable
+    """
+    with _connect(timeout) as client:
+        client.sendall((json.dumps({'job': job, 'args': args}) + "\n").encode("utf-8"))
+        with client.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                message = json.loads(line)
+                if 'log' in message:
+                    if on_log:
+                        on_log(message['log'])
+                elif 'error' in message:
+                    raise ServiceError(message['error'])
+                else:
+                    return message.get('result')
+    raise ServiceError(f"Service closed the connection during '{job}'")